@@ -26,6 +26,14 @@ app.use(cors({
 app.use(express.json());
 app.use(express.urlencoded({ extended: true }));
 
+// Strong ETags let the game client revalidate cached leaderboard/rank/profile
+// responses with If-None-Match and get a 304 instead of the full body
+app.set('etag', 'strong');
+app.use('/api', (req, res, next) => {
+  res.set('Cache-Control', 'private, no-cache');
+  next();
+});
+
 // Request logging
 app.use(requestLogger);
 
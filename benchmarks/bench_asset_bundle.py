@@ -0,0 +1,141 @@
+"""Benchmark: startup asset cost with and without the asset bundle.
+
+Times getting every surface the game asks the registry for at startup
+(images, scaled backgrounds, flipped pipe, bird rotations), converted
+for a display:
+
+  decode          PNG decoding, scaling and rotating (no bundle)
+  build           writing the bundle (first launch, or images changed)
+  bundle          mapping the bundle and wrapping its pixels
+
+Each bundled surface is compared pixel for pixel with the decoded one,
+an image whose mtime changes must make the bundle stale, and the
+bundle's pages are checked to stay clean (shareable between processes)
+via /proc/self/smaps where available.
+
+    python benchmarks/bench_asset_bundle.py
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import IMAGE_PATHS, SCREEN_WIDTH, SCREEN_HEIGHT
+from game.assets import AssetRegistry
+from game.asset_bundle import AssetBundle, build_bundle, open_bundle, SCALED_BACKGROUNDS
+from game.sprites import BIRD_ANGLES
+
+ROUNDS = 3
+
+
+def startup_surfaces(registry):
+    """Request what FlappyBirdGame, ScreenRenderer and the sprites do."""
+    surfaces = {}
+    for name in ('bg', 'ground', 'restart', 'pipe'):
+        surfaces[name] = registry.image(name)
+    for name in SCALED_BACKGROUNDS:
+        surfaces[(name, 'scaled')] = registry.scaled(name, (SCREEN_WIDTH, SCREEN_HEIGHT))
+    surfaces['pipe flipped'] = registry.pipe_image(flipped=True)
+    registry.prerender_bird_rotations(BIRD_ANGLES)
+    for index in range(3):
+        for angle in BIRD_ANGLES:
+            surfaces[('bird', index, angle)] = registry.bird_frame(index, angle)
+    return surfaces
+
+
+def timed(func):
+    best = float("inf")
+    result = None
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def bundle_mapping_kib(path):
+    """(resident, private dirty) KiB of the mappings of path, or None."""
+    try:
+        with open("/proc/self/smaps") as f:
+            lines = f.read().splitlines()
+    except OSError:
+        return None
+    rss = dirty = 0
+    inside = False
+    for line in lines:
+        first = line.split(maxsplit=1)[0] if line else ""
+        if "-" in first and not first.endswith(":"):  # "start-end perms ... pathname"
+            inside = line.endswith(path)
+        elif inside and line.startswith("Rss:"):
+            rss += int(line.split()[1])
+        elif inside and line.startswith("Private_Dirty:"):
+            dirty += int(line.split()[1])
+    return rss, dirty
+
+
+def main():
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "assets.bundle")
+
+        decode_ms, decoded = timed(lambda: startup_surfaces(AssetRegistry(IMAGE_PATHS)))
+        build_ms, count = timed(lambda: build_bundle(path))
+
+        bundles = []
+
+        def from_bundle():
+            registry = AssetRegistry(IMAGE_PATHS)
+            registry.load_bundle(path)
+            bundles.append(registry)
+            return startup_surfaces(registry)
+
+        bundle_ms, bundled = timed(from_bundle)
+        registry = bundles[-1]
+        del bundles[:-1]  # unmap the earlier rounds' bundles
+        assert registry.load_count == 0, "bundle misses made the registry decode PNGs"
+
+        # Same pixels as decoding
+        for key, surface in decoded.items():
+            other = bundled[key]
+            assert surface.get_size() == other.get_size(), key
+            assert pygame.image.tobytes(surface, "RGBA") == pygame.image.tobytes(other, "RGBA"), key
+
+        size = os.path.getsize(path)
+        print(f"{count} surfaces, bundle {size / 2**20:.1f} MiB; pixels match decoding")
+        print(f"{'path':<10} {'ms':>8}  (best of {ROUNDS})")
+        print(f"{'decode':<10} {decode_ms:>8.1f}")
+        print(f"{'build':<10} {build_ms:>8.1f}")
+        print(f"{'bundle':<10} {bundle_ms:>8.1f}  ({decode_ms / bundle_ms:.0f}x faster than decode)")
+
+        # Draw with the bundled surfaces, then look at the mapping's pages
+        screen = pygame.display.get_surface()
+        for surface in bundled.values():
+            screen.blit(surface, (0, 0))
+        mapping = bundle_mapping_kib(path)
+        if mapping:
+            print(f"bundle pages resident {mapping[0]} KiB, private dirty {mapping[1]} KiB")
+
+        # A changed image makes the bundle stale and open_bundle rebuilds it
+        images = os.path.join(tmp, "img")
+        shutil.copytree(os.path.dirname(IMAGE_PATHS['bg']), images)
+        paths = {name: os.path.join(images, os.path.basename(p)) for name, p in IMAGE_PATHS.items()}
+        copy_path = os.path.join(tmp, "copy.bundle")
+        first = open_bundle(copy_path, paths)
+        assert not first.is_stale(paths)
+        stat = os.stat(paths['pipe'])
+        os.utime(paths['pipe'], ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert first.is_stale(paths)
+        assert not open_bundle(copy_path, paths).is_stale(paths)
+        assert AssetBundle(copy_path).sources != first.sources
+        print("touching an image makes the bundle stale; it was rebuilt")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark: vectorized batch simulation throughput at N=1, 1k and 100k.
+
+First checks that BatchSimulation matches the scalar Simulation tick for
+tick on a few hundred seeded games with a noisy autopilot, then measures
+game-ticks per second with a vectorized autopilot (flap when the bird
+drops near the bottom of the next gap). Requires numpy.
+
+    python benchmarks/bench_batch_simulation.py
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+
+from game.config import BIRD_HEIGHT
+from game.batch_simulation import BatchSimulation
+from game.simulation import Simulation
+
+CHECK_GAMES = 256
+CHECK_TICKS = 3000
+SIZES = (1, 1_000, 100_000)
+TICKS = 2_000
+
+
+def autopilot(batch):
+    """Flap when the bird drops near the bottom of the next gap."""
+    gap_y = batch.next_gap()
+    if gap_y is None:
+        return (batch.bird_y + BIRD_HEIGHT // 2 > 420) & (batch.vel > 0)
+    return (batch.bird_y + BIRD_HEIGHT > gap_y + 60) & (batch.vel > 0)
+
+
+def check_equivalence():
+    """Step scalar and batch games with the same inputs and compare states."""
+    rng = random.Random(7)
+    seeds = [rng.getrandbits(64) for _ in range(CHECK_GAMES)]
+    noise = np.array([[rng.random() < 0.005 for _ in range(CHECK_GAMES)]
+                      for _ in range(CHECK_TICKS)])
+    batch = BatchSimulation(seeds)
+    sims = []
+    for seed in seeds:
+        sim = Simulation(seed)
+        sim.flying = True
+        sims.append(sim)
+    dead = [False] * CHECK_GAMES
+
+    for tick in range(CHECK_TICKS):
+        flaps = autopilot(batch) ^ noise[tick]
+        batch.step(flaps)
+        for i, sim in enumerate(sims):
+            if dead[i]:
+                continue
+            sim.step(bool(flaps[i]))
+            dead[i] = sim.collided()
+            assert batch.bird_y[i] == sim.bird_y and batch.vel[i] == sim.vel, (tick, i)
+            assert batch.score[i] == sim.score and batch.alive[i] == (not dead[i]), (tick, i)
+        if all(dead):
+            break
+    return tick + 1
+
+
+def main():
+    ticks = check_equivalence()
+    print(f"scalar/batch match over {CHECK_GAMES} games, {ticks} ticks")
+
+    print(f"{'N':>8} {'ticks':>6} {'seconds':>8} {'game-ticks/s':>14} {'alive':>7} {'mean score':>11}")
+    for n in SIZES:
+        batch = BatchSimulation(np.arange(1, n + 1, dtype=np.uint64))
+        start = time.perf_counter()
+        for _ in range(TICKS):
+            batch.step(autopilot(batch))
+        elapsed = time.perf_counter() - start
+        print(f"{n:>8} {TICKS:>6} {elapsed:>8.2f} {n * TICKS / elapsed:>14,.0f} "
+              f"{int(batch.alive.sum()):>7} {batch.score.mean():>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark: per-frame cost of tilting the bird sprite.
+
+Compares rotating the frame with pygame.transform.rotate every frame
+against the pre-rotated lookup in the asset registry.
+
+    python benchmarks/bench_bird_rotation.py
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.assets import ASSETS
+from game.sprites import BIRD_ANGLES
+
+FRAMES = 60 * 60 * 5  # five minutes of play at 60 FPS
+
+
+def _velocities():
+    """Velocity sequence of a bird flapping every 40 frames."""
+    vel = 0
+    for frame in range(FRAMES):
+        if frame % 40 == 0:
+            vel = -10
+        else:
+            vel = min(vel + 0.5, 8)
+        yield frame, vel
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frames = ASSETS.bird_frames()
+    ASSETS.prerender_bird_rotations(BIRD_ANGLES)
+
+    start = time.perf_counter()
+    for frame, vel in _velocities():
+        pygame.transform.rotate(frames[(frame // 6) % 3], vel * -2)
+    per_frame_rotate = (time.perf_counter() - start) / FRAMES
+
+    start = time.perf_counter()
+    for frame, vel in _velocities():
+        ASSETS.bird_frame((frame // 6) % 3, vel * -2)
+    per_frame_cached = (time.perf_counter() - start) / FRAMES
+
+    print(f"transform.rotate: {per_frame_rotate * 1e6:8.2f} us/frame")
+    print(f"rotation cache:   {per_frame_cached * 1e6:8.2f} us/frame")
+    print(f"speedup:          {per_frame_rotate / per_frame_cached:8.1f}x")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
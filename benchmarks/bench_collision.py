@@ -0,0 +1,170 @@
+"""Benchmark: cost of the pipe collision test per frame, rect vs mask.
+
+Records the game states of autopilot runs (pipes, bird position, frame
+and tilt), then times Simulation.collided on every state with the
+rectangle test, the mask collider and the mask test without the pair
+broad phase. Before timing, checks the mask collider on edge cases and
+against a full-screen per-pixel reference.
+
+    python benchmarks/bench_collision.py
+"""
+import os
+import random
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, BIRD_WIDTH, BIRD_HEIGHT, PIPE_WIDTH, PIPE_HEIGHT, PIPE_GAP
+)
+from game.collision import get_mask_collider
+from game.simulation import Simulation
+
+STATES = 20_000
+ROUNDS = 5
+FUZZ_CASES = 5_000
+
+
+def _sim(collider, x, y, pipes, frame_index=0, angle=0):
+    sim = Simulation(0, collider)
+    sim.bird_x, sim.bird_y = x, y
+    sim.frame_index, sim.angle = frame_index, angle
+    for x, gap_y in pipes:
+        sim.pipes.spawn(x, gap_y)
+    return sim
+
+
+def _reference(collider, sim):
+    """Per-pixel overlap of the whole scene, without any broad phase."""
+    scene = pygame.mask.Mask((SCREEN_WIDTH + 2 * PIPE_WIDTH, SCREEN_HEIGHT + 2 * PIPE_HEIGHT))
+    dx, dy = PIPE_WIDTH, PIPE_HEIGHT  # keep off-screen parts inside the mask
+    for pipe in sim.pipes:
+        x, gap_y = pipe.x, pipe.gap_y
+        scene.draw(collider.top_pipe, (x + dx, gap_y - PIPE_GAP // 2 - PIPE_HEIGHT + dy))
+        scene.draw(collider.bottom_pipe, (x + dx, gap_y + PIPE_GAP // 2 + dy))
+    bird = collider._bird_mask(sim.frame_index, sim.angle)
+    return scene.overlap(bird, (sim.bird_x + dx, sim.bird_y + dy)) is not None
+
+
+def check_edge_cases(collider):
+    """Assert the cases rectangles get wrong and the ones they get right."""
+    left, top = 100, 400
+    gap_y = 300  # bottom pipe starts at 375, top pipe ends at 225
+
+    def both(x, y, pipes, **kwargs):
+        return _sim(None, x, y, pipes, **kwargs).collided(), _sim(collider, x, y, pipes, **kwargs).collided()
+
+    # Bird's transparent bottom-right corner 3px into the bottom pipe's corner
+    pipe = (left + BIRD_WIDTH - 3, gap_y)
+    assert both(left, gap_y + PIPE_GAP // 2 - BIRD_HEIGHT + 3, [pipe]) == (True, False)
+    # Transparent top-left corner 2px into the end of the top pipe
+    pipe = (left + 10 - PIPE_WIDTH, gap_y)
+    assert both(left, gap_y - PIPE_GAP // 2 - 2, [pipe]) == (True, False)
+    # Touching edges do not collide
+    pipe = (left, gap_y)
+    assert both(left, gap_y + PIPE_GAP // 2 - BIRD_HEIGHT, [pipe]) == (False, False)
+    assert both(left, gap_y - PIPE_GAP // 2, [pipe]) == (False, False)
+    assert both(left + PIPE_WIDTH, top, [(left, 100)]) == (False, False)
+    # One opaque pixel of overlap does (the bird's belly is opaque at x 15-29)
+    assert both(left - 20, gap_y + PIPE_GAP // 2 - BIRD_HEIGHT + 1, [(left, gap_y)]) == (True, True)
+    # Inside the gap, and pipes outside the bird's x-range, never collide
+    assert both(left, gap_y - BIRD_HEIGHT // 2, [(left, gap_y)]) == (False, False)
+    assert both(left, top, [(left - PIPE_WIDTH - 1, 100), (left + 300, 100)]) == (False, False)
+    # Only the overlapping pair counts, wherever it is in the list
+    assert both(left, top, [(left - 200, 100), (left + 10, 100), (left + 250, 700)]) == (True, True)
+    # Rotated frames use their own, larger masks: nose down, the bird
+    # reaches below its 36px rect
+    dive = collider._bird_mask(0, -90)
+    assert dive.get_size() == (BIRD_HEIGHT, BIRD_WIDTH)
+    below = gap_y + PIPE_GAP // 2 - BIRD_HEIGHT - 5
+    assert _sim(collider, left, below, [(left, gap_y)], angle=-90).collided()
+    assert not _sim(collider, left, below, [(left, gap_y)], angle=0).collided()
+
+
+def check_against_reference(collider, cases=FUZZ_CASES):
+    rng = random.Random(7)
+    angles = list(range(-16, 21)) + [-90]
+    for _ in range(cases):
+        left = rng.randrange(-20, 200)
+        pipes = []
+        x = rng.randrange(-PIPE_WIDTH, 120)
+        for _ in range(rng.randrange(0, 4)):
+            pipes.append((x, rng.randrange(200, 500)))
+            x += rng.randrange(PIPE_WIDTH, 400)
+        sim = _sim(collider, left, rng.randrange(1, 600), pipes, rng.randrange(3), rng.choice(angles))
+        assert sim.collided() == _reference(collider, sim), (left, sim.bird_y, sim.angle, pipes)
+
+
+def record_states(count):
+    """Snapshots of autopilot play; collisions re-place the bird and go on."""
+    rng = random.Random(1)
+    sim = Simulation(rng.getrandbits(64))
+    sim.flying = True
+    states = []
+    while len(states) < count:
+        flap = False
+        for pipe in sim.pipes:
+            if pipe.x + PIPE_WIDTH >= sim.bird_x:
+                flap = sim.bird_y + BIRD_HEIGHT > pipe.gap_y + 60 and sim.vel > 0
+                break
+        else:
+            flap = sim.bird_y + BIRD_HEIGHT // 2 > 420 and sim.vel > 0
+        sim.step(flap != (rng.random() < 0.01))
+        states.append((sim.bird_x, sim.bird_y, [(pipe.x, pipe.gap_y) for pipe in sim.pipes],
+                       sim.frame_index, sim.angle))
+        if sim.collided():
+            sim.checkpoint_reset()
+    return states
+
+
+class NoBroadPhase:
+    """Mask test on both pipes of every pair, for comparison."""
+
+    def __init__(self, collider):
+        self.collider = collider
+
+    def hits_pipe(self, sim):
+        collider = self.collider
+        bird = collider._bird_mask(sim.frame_index, sim.angle)
+        for pipe in sim.pipes:
+            x, gap_y = pipe.x, pipe.gap_y
+            if collider.top_pipe.overlap(bird, (sim.bird_x - x, sim.bird_y - (gap_y - PIPE_GAP // 2 - PIPE_HEIGHT))) or \
+               collider.bottom_pipe.overlap(bird, (sim.bird_x - x, sim.bird_y - (gap_y + PIPE_GAP // 2))):
+                return True
+        return False
+
+
+def time_checks(collider, states):
+    sims = [_sim(collider, *state) for state in states]
+    best = float("inf")
+    hits = 0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        hits = 0
+        for sim in sims:
+            hits += sim.collided()
+        best = min(best, time.perf_counter() - start)
+    return best / len(sims) * 1e6, hits
+
+
+def main():
+    collider = get_mask_collider()
+    check_edge_cases(collider)
+    check_against_reference(collider)
+    print(f"edge cases and {FUZZ_CASES} random scenes match the per-pixel reference")
+
+    states = record_states(STATES)
+    pipes = sum(len(state[2]) for state in states) / len(states)
+    print(f"\n{len(states)} states, {pipes:.1f} pipe pairs on screen on average")
+    print(f"{'test':<20} {'us/check':>9} {'hits':>7}  (best of {ROUNDS})")
+    for name, test in (("rect", None), ("mask", collider), ("mask, no broad phase", NoBroadPhase(collider))):
+        cost, hits = time_checks(test, states)
+        print(f"{name:<20} {cost:>9.2f} {hits:>7}")
+
+
+if __name__ == "__main__":
+    main()
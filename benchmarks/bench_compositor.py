@@ -0,0 +1,129 @@
+"""Benchmark: blit cost per frame of the game scene, before and after the
+SceneCompositor.
+
+  legacy      full background blit, one blit per pipe, Group.draw for
+              the bird, then the per-pixel-alpha ground image
+  compositor  cached sky, pipes and bird, then a window of the opaque
+              pre-tiled ground strip, all in one Surface.blits call
+
+Both draw the same frames of a seeded run (every interpolation phase,
+including offsets just past the ground's wrap point) and the screens are
+compared pixel for pixel. The frozen countdown/game-over scene is timed
+the same way.
+
+    python benchmarks/bench_compositor.py
+"""
+import os
+import statistics
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_HEIGHT, SCROLL_SPEED, PIPE_GAP, PIPE_HEIGHT, FONT, WHITE
+)
+from game.assets import ASSETS
+from game.game_state import GameState
+from game.game_engine import GameEngine
+from game.compositor import get_scene_compositor
+from game.text import TEXT
+
+FRAMES = 2000
+ALPHAS = (0.0, 0.25, 0.5, 0.75, 1.0)
+CHECK_EVERY = 7
+GROUND_REPEAT = 36  # period the legacy draw wrapped the ground at
+
+
+def legacy_draw(engine, screen, bg_img, ground_img, alpha):
+    """GameEngine.draw as it was before the compositor (without dirty rects)."""
+    screen.blit(bg_img, (0, 0))
+    lag = round((1 - alpha) * SCROLL_SPEED) if engine._scrolled else 0
+    pipe_img = ASSETS.pipe_image()
+    top_pipe_img = ASSETS.pipe_image(flipped=True)
+    for pipe in engine.sim.pipes:
+        x = pipe.x + lag
+        screen.blit(top_pipe_img, (x, pipe.gap_y - PIPE_GAP // 2 - PIPE_HEIGHT))
+        screen.blit(pipe_img, (x, pipe.gap_y + PIPE_GAP // 2))
+    prev_y = engine._prev_bird_y
+    engine.bird.rect.y = round(prev_y + (engine.sim.bird_y - prev_y) * alpha)
+    engine.bird_group.draw(screen)
+    ground_x = engine.game_state.ground_scroll + lag
+    if ground_x > 0:
+        ground_x -= GROUND_REPEAT
+    screen.blit(ground_img, (ground_x, GROUND_HEIGHT))
+    TEXT.draw_number(screen, engine.game_state.score, FONT, WHITE, SCREEN_WIDTH // 2, 20)
+
+
+def legacy_scene(screen, bg_img, ground_img, ground_scroll, bird_group):
+    """ScreenRenderer._draw_scene's blits before the compositor."""
+    screen.blit(bg_img, (0, 0))
+    screen.blit(ground_img, (ground_scroll, GROUND_HEIGHT))
+    bird_group.draw(screen)
+
+
+def scene(screen, bg_img, ground_img, ground_scroll, bird_group):
+    birds = [(sprite.image, sprite.rect.topleft) for sprite in bird_group]
+    get_scene_compositor(bg_img, ground_img).draw(screen, (), ground_scroll, overlays=birds)
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    func(*args)
+    return time.perf_counter() - start
+
+
+def main():
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    bg_img = ASSETS.image('bg')
+    ground_img = ASSETS.image('ground')
+    state = GameState()
+    state.flying = True
+    engine = GameEngine(state, seed=1)
+    compositor = get_scene_compositor(bg_img, ground_img)
+    print(f"ground strip {compositor.ground.get_width()}x{compositor.ground.get_height()} "
+          f"({'opaque' if compositor.opaque_ground else 'alpha'}), "
+          f"sky {compositor.sky.get_width()}x{compositor.sky.get_height()}")
+
+    times = {"legacy": [], "compositor": [], "legacy scene": [], "compositor scene": []}
+    checked = 0
+    offsets = set()  # ground positions drawn
+    for frame in range(FRAMES):
+        first = engine.sim.pipes.first
+        if engine.sim.bird_y > (first.gap_y if first else SCREEN_HEIGHT // 2):
+            engine.queue_flap()
+        engine.update()
+        alpha = ALPHAS[frame % len(ALPHAS)]
+        lag = round((1 - alpha) * SCROLL_SPEED) if engine._scrolled else 0
+        offsets.add(state.ground_scroll + lag)
+
+        times["legacy"].append(timed(legacy_draw, engine, screen, bg_img, ground_img, alpha))
+        before = pygame.image.tobytes(screen, "RGB") if frame % CHECK_EVERY == 0 else None
+        times["compositor"].append(timed(engine.draw, screen, bg_img, ground_img, alpha))
+        if before is not None:
+            assert before == pygame.image.tobytes(screen, "RGB"), f"frame {frame} differs"
+            checked += 1
+
+        scroll = state.ground_scroll
+        times["legacy scene"].append(timed(legacy_scene, screen, bg_img, ground_img, scroll, engine.bird_group))
+        before = pygame.image.tobytes(screen, "RGB") if frame % CHECK_EVERY == 0 else None
+        times["compositor scene"].append(timed(scene, screen, bg_img, ground_img, scroll, engine.bird_group))
+        if before is not None:
+            assert before == pygame.image.tobytes(screen, "RGB"), f"scene {frame} differs"
+
+    assert max(offsets) > 0, "no frame drew the ground past its wrap point"
+    print(f"{checked} gameplay frames and scenes identical to the legacy drawing "
+          f"(ground at {min(offsets)}..{max(offsets)})")
+    print(f"{'variant':<17} {'mean us':>8} {'p50 us':>8} {'p95 us':>8}  ({FRAMES} frames)")
+    for name, samples in times.items():
+        samples = sorted(samples)
+        print(f"{name:<17} {statistics.fmean(samples) * 1e6:>8.1f} {samples[len(samples) // 2] * 1e6:>8.1f} "
+              f"{samples[int(len(samples) * 0.95)] * 1e6:>8.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark: pixels pushed to the display per frame for each ScreenState.
+
+Runs FlappyBirdGame headless (SDL dummy driver) with a stubbed API client
+and reports the average area passed to pygame.display.update per frame.
+
+    python benchmarks/bench_dirty_rects.py
+"""
+import os
+import sys
+import tempfile
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import flappy
+from game import APIClient, ScreenState, SCREEN_WIDTH, SCREEN_HEIGHT
+
+FRAMES = 300
+
+
+class StubAPIClient(APIClient):
+    """APIClient with canned responses and no network access."""
+
+    def __init__(self):
+        journal = os.path.join(tempfile.mkdtemp(), "pending_scores.jsonl")
+        super().__init__("http://stub.invalid/api", journal_path=journal)
+        self.auth_token = "stub-token"
+        self.user_info = {'username': 'bench', 'email': 'bench@example.com',
+                          'highest_score': 42, 'games_played': 7}
+        self.user_rank = {'rank': 3, 'highest_score': 42}
+        self.leaderboard_data = [
+            {'rank': i + 1, 'username': f'player{i + 1}', 'highest_score': 100 - i}
+            for i in range(10)
+        ]
+
+    def login(self, username, password):
+        return True, "Login successful!"
+
+    def register(self, username, email, password):
+        return True, "Registration successful!"
+
+    def submit_score(self, score_value, level=1):
+        return True, "Score submitted!"
+
+    def get_leaderboard(self, limit=10):
+        return True
+
+    def get_user_rank(self):
+        return True
+
+    def get_profile(self):
+        return True
+
+
+def _run(game, frames):
+    """Render frames and return the average pixels pushed per frame."""
+    # The first frame of a screen is always a full flip; measure steady state
+    game.handle_events()
+    game.update_game()
+    game.render()
+    game.dirty.reset_stats()
+    for frame in range(frames):
+        if frame % 30 == 0:
+            pygame.event.post(pygame.event.Event(
+                pygame.MOUSEMOTION, pos=(SCREEN_WIDTH // 2, 470 + (frame // 30) % 2 * 200),
+                rel=(0, 0), buttons=(0, 0, 0)))
+        game.handle_events()
+        game.update_game()
+        game.render()
+    return game.dirty.total_pixels / game.dirty.frames
+
+
+def main():
+    game = flappy.FlappyBirdGame(loader_threads=0)  # no background decoding while timing
+    game.api_client = StubAPIClient()
+    game.screen_renderer.api_client = game.api_client
+    screen_pixels = SCREEN_WIDTH * SCREEN_HEIGHT
+
+    print(f"{'screen':<12} {'pixels/frame':>13} {'of full':>8}")
+    for state in (ScreenState.LOGIN, ScreenState.REGISTER, ScreenState.HOME,
+                  ScreenState.LEADERBOARD, ScreenState.PROFILE):
+        game.game_state.current_screen = state
+        game.game_state.current_input_field = "login_username"
+        pixels = _run(game, FRAMES)
+        print(f"{state.name:<12} {pixels:>13.0f} {pixels / screen_pixels:>8.1%}")
+
+    # Gameplay with collisions disabled so pipes keep scrolling
+    game.game_engine.check_collisions = lambda: False
+    game.game_state.start_new_game()
+    game.game_state.flying = True
+    pixels = _run(game, FRAMES)
+    print(f"{'GAME':<12} {pixels:>13.0f} {pixels / screen_pixels:>8.1%}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""Benchmark: time-to-puzzle with and without the prefetch pool.
+
+Starts a local stand-in for the heart puzzle API that answers with a
+delay, like the real service, then activates the lifeline repeatedly.
+Reports the pool hit rate and time-to-puzzle percentiles, then checks
+that a collision before the pool has filled waits for the fetch in
+flight without blocking a frame, and that a dead API fails fast.
+
+    python benchmarks/bench_heart_prefetch.py
+"""
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT
+from game.api_client import HeartPuzzleAPI
+from game.heart_puzzle import HeartPuzzle, PuzzlePrefetcher
+
+ACTIVATIONS = 10
+LATENCY = 0.25  # seconds per stand-in response
+GAP = 1.0  # seconds of play between collisions
+
+with open(os.path.join(ROOT, "heart.png"), "rb") as f:
+    PUZZLE_PNG = f.read()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        if self.path.startswith("/puzzle.png"):
+            body, content_type = PUZZLE_PNG, "image/png"
+        else:
+            host, port = self.server.server_address
+            body = json.dumps({"question": f"http://{host}:{port}/puzzle.png", "solution": 7}).encode()
+            content_type = "application/json"
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _run(puzzle):
+    puzzle.prepare()
+    for _ in range(ACTIVATIONS):
+        time.sleep(GAP)  # playing until the next collision
+        assert puzzle.activate()
+        puzzle.deactivate()
+    if puzzle.prefetcher:
+        puzzle.prefetcher.stop()
+    times = sorted(puzzle.time_to_puzzle)
+    return puzzle.hit_rate(), statistics.median(times), times[-1]
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    api = HeartPuzzleAPI(f"http://127.0.0.1:{server.server_address[1]}/api.php", 30)
+
+    print(f"{'mode':<10} {'hit rate':>9} {'p50 ms':>9} {'max ms':>9}")
+    for label, puzzle in (("blocking", HeartPuzzle(api)),
+                          ("prefetch", HeartPuzzle(api, PuzzlePrefetcher(api)))):
+        hit_rate, p50, worst = _run(puzzle)
+        print(f"{label:<10} {hit_rate:>9.0%} {p50 * 1000:>9.2f} {worst * 1000:>9.2f}")
+
+    # Collision right after the run starts: the pool is still empty
+    puzzle = HeartPuzzle(api, PuzzlePrefetcher(api))
+    puzzle.prepare()
+    start = time.perf_counter()
+    assert puzzle.activate() and puzzle.waiting, "empty pool should wait for the fetch"
+    slowest = time.perf_counter() - start
+    while puzzle.waiting:
+        time.sleep(1 / 60)  # one frame
+        frame = time.perf_counter()
+        assert puzzle.update(), "the puzzle in flight never arrived"
+        slowest = max(slowest, time.perf_counter() - frame)
+    puzzle.prefetcher.stop()
+    assert puzzle.image is not None and not puzzle.is_time_up()
+    print(f"empty pool while prefetching: puzzle after {puzzle.time_to_puzzle[-1] * 1000:.0f} ms, "
+          f"slowest frame call {slowest * 1000:.2f} ms")
+
+    # Dead API: the prefetcher is failing, so the lifeline is denied at once
+    dead = HeartPuzzleAPI("http://127.0.0.1:9/api.php", 30)
+    puzzle = HeartPuzzle(dead, PuzzlePrefetcher(dead))
+    puzzle.prepare()
+    while not puzzle.prefetcher.failing:
+        time.sleep(0.01)
+    start = time.perf_counter()
+    assert not puzzle.activate(), "a failing API should deny the lifeline"
+    puzzle.prefetcher.stop()
+    print(f"dead API: unavailable after {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    server.shutdown()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
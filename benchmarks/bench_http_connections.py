@@ -0,0 +1,88 @@
+"""Benchmark: TCP connections opened per 100 API requests.
+
+Starts a local stand-in for the Express backend that counts accepted
+connections, then issues 100 leaderboard requests through plain
+module-level requests.get and through the shared HTTPSession. Also times
+how fast calls fail against a dead backend once the circuit opens.
+
+    python benchmarks/bench_http_connections.py
+"""
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import requests
+
+from game.http_session import HTTPSession
+
+REQUESTS = 100
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def process_request(self, request, client_address):
+        self.connections += 1
+        super().process_request(request, client_address)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    wbufsize = -1  # send headers and body in one segment (avoids delayed-ACK stalls)
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = json.dumps({"leaderboard": [{"rank": 1, "username": "a", "highest_score": 1}]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _count(server, send):
+    server.connections = 0
+    start = time.perf_counter()
+    for _ in range(REQUESTS):
+        send().json()
+    return server.connections, time.perf_counter() - start
+
+
+def main():
+    server = _CountingServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/api/scores/leaderboard?limit=10"
+
+    session = HTTPSession()
+    print(f"{'client':<14} {'connections':>12} {'ms total':>9}")
+    for label, send in (("requests.get", lambda: requests.get(url, timeout=5)),
+                        ("HTTPSession", lambda: session.get(url, timeout=5))):
+        connections, elapsed = _count(server, send)
+        print(f"{label:<14} {connections:>12} {elapsed * 1000:>9.1f}")
+
+    server.shutdown()
+    server.server_close()
+
+    # Dead backend: the circuit opens after a few failures and calls fail fast
+    dead = HTTPSession(retries=0)
+    timings = []
+    for _ in range(10):
+        start = time.perf_counter()
+        try:
+            dead.get(url, timeout=5)
+        except requests.exceptions.ConnectionError:
+            pass
+        timings.append((time.perf_counter() - start) * 1000)
+    print("dead backend ms/call:", " ".join(f"{t:.2f}" for t in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark: average CPU use per screen, always rendering vs idle-aware.
+
+Each screen runs the real FlappyBirdGame.run loop for SECONDS in a fresh
+process (dummy video driver, stubbed API client, no input), once with
+every frame rendered at the frame cap as before and once with idle menu
+scheduling. Reports CPU time / wall time and rendered frames per second.
+Menus should drop to a few frames per second (cursor blinks); GAME,
+COUNTDOWN and HEART_PUZZLE keep their full rate.
+
+    python benchmarks/bench_idle_cpu.py [--seconds S]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(HERE)
+SCREENS = ("LOGIN", "REGISTER", "HOME", "LEADERBOARD", "PROFILE", "GAME", "COUNTDOWN", "HEART_PUZZLE")
+SECONDS = 3.0
+
+LAUNCH = """
+import json, sys, time
+import pygame
+import flappy
+from bench_screens import MODES
+from bench_dirty_rects import StubAPIClient
+
+name, idle, seconds = sys.argv[1], sys.argv[2] == "1", float(sys.argv[3])
+game = flappy.FlappyBirdGame(loader_threads=0)
+game.idle_menus = idle
+game.api_client = StubAPIClient()
+game.screen_renderer.api_client = game.api_client
+game.heart_puzzle.prefetcher = None  # no network
+MODES[name][0](game)
+
+frames = 0
+render = game.render
+def counting_render(alpha=1.0):
+    global frames
+    frames += 1
+    render(alpha)
+game.render = counting_render
+
+pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+cpu, wall = time.process_time(), time.perf_counter()
+game.run()
+cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+print(json.dumps({"cpu": cpu / wall * 100, "fps": frames / wall}))
+"""
+
+
+def launch(data_dir, name, idle, seconds):
+    env = dict(os.environ, FLAPPY_DATA_DIR=data_dir, SDL_VIDEODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1", PYTHONPATH=os.pathsep.join([ROOT, HERE]))
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", LAUNCH, name, str(int(idle)), str(seconds)],
+                         cwd=ROOT, env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=SECONDS, help="run time per screen and mode")
+    args = parser.parse_args()
+
+    print(f"{'screen':<13} {'always CPU%':>11} {'fps':>7} {'idle CPU%':>10} {'fps':>7}")
+    with tempfile.TemporaryDirectory() as data_dir:
+        for name in SCREENS:
+            always = launch(data_dir, name, False, args.seconds)
+            idle = launch(data_dir, name, True, args.seconds)
+            print(f"{name:<13} {always['cpu']:>11.1f} {always['fps']:>7.1f} {idle['cpu']:>10.1f} {idle['fps']:>7.1f}")
+
+
+if __name__ == "__main__":
+    main()
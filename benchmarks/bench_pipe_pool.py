@@ -0,0 +1,89 @@
+"""Benchmark: allocations of the pipe pool over a long session.
+
+Plays autopilot runs back to back (restarting after every collision, as
+a long session would) and, after a warm-up, counts PipePair objects
+created and the pool's capacity, and traces the memory blocks held by
+the simulation module at the middle and end of the session. Spawning
+and dropping pipes only recycles pairs, so none of these should grow;
+the few blocks held at all are the current values of the counters.
+
+    python benchmarks/bench_pipe_pool.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game.simulation as simulation
+from game.config import BIRD_HEIGHT, PIPE_WIDTH
+from game.simulation import PipePair, Simulation
+
+WARMUP_TICKS = 10_000
+TICKS = 500_000
+BLOCK_SLACK = 8  # live int values come and go
+
+
+def autopilot(sim):
+    """Flap when the bird's bottom sinks near the bottom of the next gap."""
+    for pipe in sim.pipes:
+        if pipe.x + PIPE_WIDTH >= sim.bird_x:
+            return sim.bird_y + BIRD_HEIGHT > pipe.gap_y + 60 and sim.vel > 0
+    return sim.bird_y + BIRD_HEIGHT // 2 > 420 and sim.vel > 0
+
+
+def play(sim, ticks):
+    """Returns (runs ended, pipe pairs spawned)."""
+    runs = 0
+    spawned = -sim.pipes_spawned
+    for _ in range(ticks):
+        sim.step(autopilot(sim))
+        if sim.collided():
+            runs += 1
+            spawned += sim.pipes_spawned
+            sim.reset(seed=sim.seed + 1)
+            sim.flying = True
+    return runs, spawned + sim.pipes_spawned
+
+
+def main():
+    created = [0]
+    original_init = PipePair.__init__
+
+    def counting_init(self, *args):
+        created[0] += 1
+        original_init(self, *args)
+
+    sim = Simulation(seed=1)
+    sim.flying = True
+    play(sim, WARMUP_TICKS)
+
+    PipePair.__init__ = counting_init
+    only_sim = [tracemalloc.Filter(True, simulation.__file__)]
+    tracemalloc.start()
+    snapshots = [tracemalloc.take_snapshot().filter_traces(only_sim)]
+    runs = spawned = 0
+    start = time.perf_counter()
+    for _ in range(2):
+        counts = play(sim, TICKS // 2)
+        runs += counts[0]
+        spawned += counts[1]
+        snapshots.append(tracemalloc.take_snapshot().filter_traces(only_sim))
+    elapsed = time.perf_counter() - start
+    tracemalloc.stop()
+    PipePair.__init__ = original_init
+
+    held = [sum(stat.count_diff for stat in snapshot.compare_to(snapshots[0], "lineno"))
+            for snapshot in snapshots[1:]]
+    print(f"{TICKS:,} ticks after {WARMUP_TICKS:,} warm-up, {runs} runs, "
+          f"{TICKS / elapsed:,.0f} ticks/s under tracemalloc")
+    print(f"pipe pairs spawned               {spawned:,}")
+    print(f"PipePair objects created         {created[0]}")
+    print(f"pool capacity                    {sim.pipes.capacity} (MAX_PIPES {simulation.MAX_PIPES})")
+    print(f"game/simulation.py blocks held   {held[0]:+d} at {TICKS // 2:,} ticks, {held[1]:+d} at {TICKS:,}")
+    return 1 if created[0] or held[1] - held[0] > BLOCK_SLACK else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+"""Benchmark: frame cost with the profiler disabled and enabled.
+
+Runs gameplay headless (SDL dummy driver, collisions off) and times the
+same frame loop FlappyBirdGame.run uses, with the profiler off and on,
+then prints the profiler's own per-phase percentiles. "on" includes
+drawing the overlay; "off" runs no profiler code beyond one flag check.
+The API client is the stub from bench_dirty_rects and no puzzles are
+prefetched, so nothing touches the network.
+
+    python benchmarks/bench_profiler.py
+"""
+import os
+import sys
+import tempfile
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+import flappy
+from bench_dirty_rects import StubAPIClient
+
+FRAMES = 1000
+ROUNDS = 5
+
+
+def _frames(game, frames):
+    start = time.perf_counter()
+    for _ in range(frames):
+        game.handle_events()
+        game.update_game()
+        game.render()
+        if game.profiler.enabled:
+            game.profiler.end_frame()
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def main():
+    game = flappy.FlappyBirdGame(loader_threads=0)  # no background decoding while timing
+    game.api_client = StubAPIClient()
+    game.screen_renderer.api_client = game.api_client
+    game.heart_puzzle.prefetcher = None  # no network
+    game.game_state.start_new_game()
+    game.game_state.flying = True
+    game.game_engine.check_collisions = lambda: False
+    _frames(game, 200)  # warm caches
+
+    # Alternate off/on rounds and keep the best of each, to cancel drift
+    best = {False: float("inf"), True: float("inf")}
+    for _ in range(ROUNDS):
+        for enabled in (False, True):
+            if enabled:
+                game.profiler.enable()
+            best[enabled] = min(best[enabled], _frames(game, FRAMES))
+            game.profiler.disable()
+
+    off, on = best[False], best[True]
+    print(f"{'profiler':<10} {'us/frame':>9}  (best of {ROUNDS} x {FRAMES} frames)")
+    print(f"{'off':<10} {off:>9.1f}")
+    print(f"{'on':<10} {on:>9.1f}  ({(on - off) / off:+.1%})")
+
+    print(f"\n{'phase':<40} {'n':>5} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}  (ms)")
+    for label, (count, p50, p95, p99, worst) in sorted(game.profiler.summary().items()):
+        if count:
+            print(f"{label:<40} {count:>5} {p50:>7.3f} {p95:>7.3f} {p99:>7.3f} {worst:>7.3f}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        game.profiler.export_csv(os.path.join(tmp, "profile.csv"))
+        game.profiler.export_chrome_trace(os.path.join(tmp, "profile.json"))
+        sizes = {name: os.path.getsize(os.path.join(tmp, name)) for name in os.listdir(tmp)}
+    print("\nexports:", ", ".join(f"{name} {size:,} B" for name, size in sorted(sizes.items())))
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,351 @@
+"""Benchmark suite: frame cost of every screen, with a stored baseline.
+
+Runs FlappyBirdGame headless (SDL dummy driver) with the stubbed API
+client from bench_dirty_rects and drives scripted input through each
+ScreenState plus the heart-puzzle and countdown modes. For every mode it
+reports frames/sec, per-frame latency percentiles, tracemalloc
+allocations per frame and surfaces created per frame (through
+pygame.Surface, pygame.transform, pygame.image and text-cache renders).
+
+Results are written as JSON and compared with a baseline; the exit
+status is 1 when a mode regressed beyond the tolerances below. The gate
+is mainly on the machine-independent counts (allocations and surfaces
+per frame). Timings are the best of TIME_ROUNDS passes and only count as
+a regression when they are worse both relatively and by more than an
+absolute floor, so sub-millisecond jitter on a busy machine doesn't fail
+the run.
+
+    python benchmarks/bench_screens.py
+    python benchmarks/bench_screens.py --update-baseline
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import pygame
+
+import flappy
+from bench_dirty_rects import StubAPIClient
+from game import ScreenState, SCREEN_WIDTH, BIRD_HEIGHT, PIPE_WIDTH, TEXT
+
+WARMUP_FRAMES = 30
+FRAMES = 300
+ALLOC_FRAMES = 100
+BASELINE_PATH = os.path.join(HERE, "baselines", "bench_screens.json")
+RESULTS_PATH = os.path.join(HERE, "results", "bench_screens.json")
+
+TIME_ROUNDS = 3  # timed passes per mode; each timing is the best of them
+
+# Regression tolerances against the baseline
+TIME_TOLERANCE = 0.25  # mean frame time and p95 may be this much worse...
+TIME_FLOOR_MS = 0.5  # ...and must also be this much worse to count
+SURFACE_TOLERANCE = 0.5  # extra surfaces per frame
+ALLOC_TOLERANCE = 0.25  # relative growth in allocated blocks per frame
+ALLOC_SLACK = 5  # blocks per frame ignored as noise
+
+
+def _key(key, unicode=""):
+    return pygame.event.Event(pygame.KEYDOWN, key=key, unicode=unicode, mod=0, scancode=0)
+
+
+def _motion(x, y):
+    return pygame.event.Event(pygame.MOUSEMOTION, pos=(x, y), rel=(0, 0), buttons=(0, 0, 0))
+
+
+# ----------------------------------------------------------------------
+# Scripted modes: setup(game) and inputs(game, frame) -> events
+# ----------------------------------------------------------------------
+
+def _menu(state, field=None):
+    def setup(game):
+        game.game_state.return_to_home()
+        game.game_state.current_screen = state
+        game.game_state.current_input_field = field
+    return setup
+
+
+def _typing(game, frame):
+    events = []
+    if frame % 4 == 0:
+        events.append(_key(pygame.K_a + frame % 26, chr(ord("a") + frame % 26)))
+    if frame % 12 == 6:
+        events.append(_key(pygame.K_BACKSPACE))
+    if frame % 60 == 59:
+        events.append(_key(pygame.K_TAB))
+    if frame % 30 == 0:
+        events.append(_motion(SCREEN_WIDTH // 2, 470 + (frame // 30) % 2 * 200))
+    return events
+
+
+def _hover(game, frame):
+    if frame % 15 == 0:
+        return [_motion(SCREEN_WIDTH // 2, 380 + (frame // 15) % 4 * 80)]
+    return []
+
+
+def _setup_game(game):
+    game.game_state.start_new_game()
+    game.game_engine.reset_game()
+    game.game_engine.check_collisions = lambda: False
+    pygame.event.post(_key(pygame.K_SPACE, " "))
+
+
+def _autopilot(game, frame):
+    """Press SPACE when the bird sinks below the middle of the next gap."""
+    sim = game.game_engine.sim
+    target = next((pipe.gap_y for pipe in sim.pipes if pipe.x + PIPE_WIDTH >= sim.bird_x), 420)
+    if sim.vel > 0 and sim.bird_y + BIRD_HEIGHT // 2 > target + 20:
+        return [_key(pygame.K_SPACE, " ")]
+    return []
+
+
+def _setup_heart(game):
+    game.game_state.start_new_game()
+    puzzle = game.heart_puzzle
+    image = pygame.transform.scale(pygame.image.load(os.path.join(os.path.dirname(HERE), "heart.png")), (400, 400))
+    puzzle.active = True
+    puzzle.image = image.convert_alpha()
+    puzzle.answer = "7"
+    puzzle.input = ""
+    puzzle.start_time = time.time() + 3600
+
+
+def _heart_inputs(game, frame):
+    if frame % 10 == 0:
+        return [_key(pygame.K_1 + frame % 9, str(1 + frame % 9))]
+    if frame % 10 == 5:
+        return [_key(pygame.K_BACKSPACE)]
+    return []
+
+
+def _setup_countdown(game):
+    game.game_state.start_new_game()
+    game.heart_puzzle.active = False
+    game.game_state.countdown_active = True
+    game.game_state.countdown_end_time = time.time() + 3600
+
+
+def _idle(game, frame):
+    return []
+
+
+MODES = {
+    "LOGIN": (_menu(ScreenState.LOGIN, "login_username"), _typing),
+    "REGISTER": (_menu(ScreenState.REGISTER, "register_username"), _typing),
+    "HOME": (_menu(ScreenState.HOME), _hover),
+    "LEADERBOARD": (_menu(ScreenState.LEADERBOARD), _hover),
+    "PROFILE": (_menu(ScreenState.PROFILE), _hover),
+    "GAME": (_setup_game, _autopilot),
+    "HEART_PUZZLE": (_setup_heart, _heart_inputs),
+    "COUNTDOWN": (_setup_countdown, _idle),
+}
+
+
+# ----------------------------------------------------------------------
+# Measurement
+# ----------------------------------------------------------------------
+
+class SurfaceCounter:
+    """Counts surfaces created through the Python-visible pygame APIs."""
+
+    MODULES = (pygame.transform, pygame.image)
+
+    def __init__(self):
+        self.count = 0
+        self._saved = []
+
+    def install(self):
+        counter = self
+
+        class CountingSurface(pygame.Surface):
+            def __init__(self, *args, **kwargs):
+                counter.count += 1
+                super().__init__(*args, **kwargs)
+
+        self._saved.append((pygame, "Surface", pygame.Surface))
+        pygame.Surface = CountingSurface
+        for module in self.MODULES:
+            for name in dir(module):
+                func = getattr(module, name)
+                if callable(func) and not name.startswith("_") and not isinstance(func, type):
+                    self._saved.append((module, name, func))
+                    setattr(module, name, self._counting(func))
+
+    def _counting(self, func):
+        def wrapper(*args, **kwargs):
+            result = func(*args, **kwargs)
+            if isinstance(result, pygame.Surface):
+                self.count += 1
+            return result
+        return wrapper
+
+    def uninstall(self):
+        for module, name, func in reversed(self._saved):
+            setattr(module, name, func)
+        self._saved = []
+
+    def total(self):
+        return self.count + TEXT.misses
+
+
+def _frame(game, inputs, frame):
+    for event in inputs(game, frame):
+        pygame.event.post(event)
+    game.api_client.poll()
+    game.handle_events()
+    game.update_game()
+    game.render()
+
+
+def _percentile(ordered, p):
+    return ordered[min(len(ordered) - 1, int(p * len(ordered)))]
+
+
+def run_mode(game, name, frames=FRAMES, alloc_frames=ALLOC_FRAMES):
+    setup, inputs = MODES[name]
+    setup(game)
+    for frame in range(WARMUP_FRAMES):
+        _frame(game, inputs, frame)
+
+    # Timing, best of TIME_ROUNDS passes; surfaces are counted in the first
+    first = WARMUP_FRAMES
+    counter = SurfaceCounter()
+    counter.install()
+    TEXT.reset_stats()
+    best = None
+    for round_ in range(TIME_ROUNDS):
+        times = []
+        start = time.perf_counter()
+        for frame in range(first, first + frames):
+            t0 = time.perf_counter()
+            _frame(game, inputs, frame)
+            times.append(time.perf_counter() - t0)
+        elapsed = time.perf_counter() - start
+        first += frames
+        if round_ == 0:
+            counter.uninstall()
+            surfaces = counter.total()
+        ordered = sorted(times)
+        timing = {
+            "fps": round(frames / elapsed, 1),
+            "p50_ms": round(_percentile(ordered, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(ordered, 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(ordered, 0.99) * 1000, 3),
+            "max_ms": round(ordered[-1] * 1000, 3),
+        }
+        if best is None:
+            best = timing
+        else:
+            best = {key: (max if key == "fps" else min)(value, best[key]) for key, value in timing.items()}
+
+    # Allocations, in a separate pass since tracing slows frames down
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    peaks = []
+    for frame in range(first, first + alloc_frames):
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        _frame(game, inputs, frame)
+        peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    stats = after.compare_to(before, "lineno")
+    new_blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+
+    return {
+        **best,
+        "alloc_blocks_per_frame": round(new_blocks / alloc_frames, 2),
+        "alloc_peak_kib_per_frame": round(sorted(peaks)[len(peaks) // 2] / 1024, 2),
+        "surfaces_per_frame": round(surfaces / frames, 3),
+    }
+
+
+def _slower(now_ms, base_ms):
+    return now_ms > base_ms * (1 + TIME_TOLERANCE) and now_ms - base_ms > TIME_FLOOR_MS
+
+
+def compare(results, baseline):
+    """Return a list of regression messages."""
+    problems = []
+    for name, now in results["modes"].items():
+        base = baseline.get("modes", {}).get(name)
+        if not base:
+            continue
+        if _slower(1000 / now["fps"], 1000 / base["fps"]):
+            problems.append(f"{name}: fps {base['fps']} -> {now['fps']}")
+        if _slower(now["p95_ms"], base["p95_ms"]):
+            problems.append(f"{name}: p95 {base['p95_ms']} ms -> {now['p95_ms']} ms")
+        if now["surfaces_per_frame"] > base["surfaces_per_frame"] + SURFACE_TOLERANCE:
+            problems.append(f"{name}: surfaces/frame {base['surfaces_per_frame']} -> {now['surfaces_per_frame']}")
+        limit = max(base["alloc_blocks_per_frame"] * (1 + ALLOC_TOLERANCE),
+                    base["alloc_blocks_per_frame"] + ALLOC_SLACK)
+        if now["alloc_blocks_per_frame"] > limit:
+            problems.append(f"{name}: allocated blocks/frame {base['alloc_blocks_per_frame']} "
+                            f"-> {now['alloc_blocks_per_frame']}")
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--output", default=RESULTS_PATH, help="where to write the JSON results")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument("--update-baseline", action="store_true", help="store these results as the baseline")
+    parser.add_argument("--modes", nargs="*", choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    # Load assets up front: background decoding would skew the first screens
+    game = flappy.FlappyBirdGame(loader_threads=0)
+    game.api_client = StubAPIClient()
+    game.screen_renderer.api_client = game.api_client
+    game.heart_puzzle.prefetcher = None  # no network
+
+    results = {
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "machine": platform.machine(),
+        "frames": FRAMES,
+        "modes": {},
+    }
+    print(f"{'mode':<13} {'fps':>8} {'p50':>7} {'p95':>7} {'p99':>7} {'max':>7} "
+          f"{'blocks/f':>9} {'KiB/f':>7} {'surf/f':>7}")
+    for name in args.modes:
+        r = run_mode(game, name)
+        results["modes"][name] = r
+        print(f"{name:<13} {r['fps']:>8.0f} {r['p50_ms']:>7.2f} {r['p95_ms']:>7.2f} {r['p99_ms']:>7.2f} "
+              f"{r['max_ms']:>7.2f} {r['alloc_blocks_per_frame']:>9.1f} "
+              f"{r['alloc_peak_kib_per_frame']:>7.1f} {r['surfaces_per_frame']:>7.2f}")
+    pygame.quit()
+
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nresults written to {args.output}")
+
+    if args.update_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline updated: {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        print("no baseline to compare with (run with --update-baseline)")
+        return 0
+    with open(args.baseline) as f:
+        problems = compare(results, json.load(f))
+    for problem in problems:
+        print("REGRESSION", problem)
+    if not problems:
+        print("no regressions against", args.baseline)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+"""Benchmark: headless simulation ticks per second on one core.
+
+Plays runs back to back with a simple autopilot (flap when the bird
+drops below the next gap) and restarts after every collision.
+
+    python benchmarks/bench_simulation.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import BIRD_HEIGHT, PIPE_WIDTH
+from game.simulation import Simulation
+
+TICKS = 1_000_000
+TARGET = 100_000  # ticks/s
+
+
+def autopilot(sim):
+    """Flap when the bird's bottom sinks near the bottom of the next gap."""
+    for pipe in sim.pipes:
+        if pipe.x + PIPE_WIDTH >= sim.bird_x:
+            return sim.bird_y + BIRD_HEIGHT > pipe.gap_y + 60 and sim.vel > 0
+    return sim.bird_y + BIRD_HEIGHT // 2 > 420 and sim.vel > 0
+
+
+def main():
+    sim = Simulation(seed=1)
+    sim.flying = True
+    runs = 0
+    best = 0
+    start = time.perf_counter()
+    for _ in range(TICKS):
+        sim.step(autopilot(sim))
+        if sim.collided():
+            best = max(best, sim.score)
+            runs += 1
+            sim.reset(seed=runs + 1)
+            sim.flying = True
+    elapsed = time.perf_counter() - start
+
+    rate = TICKS / elapsed
+    print(f"{TICKS} ticks in {elapsed:.2f}s: {rate:,.0f} ticks/s "
+          f"({'ok' if rate >= TARGET else 'below'} target {TARGET:,}); "
+          f"{runs} runs, best score {best}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark: image loads and allocations per 1,000 spawned pipes.
+
+Run from the repository root:
+
+    python benchmarks/bench_sprite_assets.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+
+from game.config import SCREEN_WIDTH, SCREEN_HEIGHT, PIPE_GAP, IMAGE_PATHS
+from game.assets import ASSETS
+
+PIPE_COUNT = 1000
+
+
+class _LegacyPipe(pygame.sprite.Sprite):
+    """Pipe as it was built before the asset registry: one decode per spawn."""
+
+    def __init__(self, x, y, position):
+        super().__init__()
+        self.image = pygame.image.load(IMAGE_PATHS['pipe'])
+        self.rect = self.image.get_rect()
+        if position == 1:
+            self.image = pygame.transform.flip(self.image, False, True)
+            self.rect.bottomleft = (x, y - PIPE_GAP // 2)
+        else:
+            self.rect.topleft = (x, y + PIPE_GAP // 2)
+
+
+class _RegistryPipe(pygame.sprite.Sprite):
+    """The same pipe sprite with its image from the shared asset registry."""
+
+    def __init__(self, x, y, position):
+        super().__init__()
+        self.image = ASSETS.pipe_image(flipped=position == 1)
+        self.rect = self.image.get_rect()
+        if position == 1:
+            self.rect.bottomleft = (x, y - PIPE_GAP // 2)
+        else:
+            self.rect.topleft = (x, y + PIPE_GAP // 2)
+
+
+def _measure(pipe_cls):
+    """Spawn PIPE_COUNT pipes in pairs; return (loads, alloc bytes, alloc blocks, seconds)."""
+    loads = 0
+    real_load = pygame.image.load
+
+    def counting_load(*args, **kwargs):
+        nonlocal loads
+        loads += 1
+        return real_load(*args, **kwargs)
+
+    pygame.image.load = counting_load
+    group = pygame.sprite.Group()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    try:
+        for _ in range(PIPE_COUNT // 2):
+            group.add(pipe_cls(SCREEN_WIDTH, SCREEN_HEIGHT // 2, -1))
+            group.add(pipe_cls(SCREEN_WIDTH, SCREEN_HEIGHT // 2, 1))
+            group.empty()
+        elapsed = time.perf_counter() - start
+        stats = tracemalloc.take_snapshot().compare_to(before, 'filename')
+    finally:
+        tracemalloc.stop()
+        pygame.image.load = real_load
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    return loads, size, blocks, elapsed
+
+
+def main():
+    pygame.init()
+    pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    # Warm the registry so the measurement reflects steady-state spawning
+    ASSETS.pipe_image()
+    ASSETS.pipe_image(flipped=True)
+
+    print(f"{'variant':<10} {'loads':>7} {'alloc KiB':>10} {'blocks':>8} {'ms':>9}")
+    for label, cls in (("legacy", _LegacyPipe), ("registry", _RegistryPipe)):
+        loads, size, blocks, elapsed = _measure(cls)
+        print(f"{label:<10} {loads:>7} {size / 1024:>10.1f} {blocks:>8} {elapsed * 1000:>9.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
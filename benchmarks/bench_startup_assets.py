@@ -0,0 +1,89 @@
+"""Benchmark: time to the first interactive frame, by asset loading path.
+
+Each launch is a fresh interpreter that builds FlappyBirdGame (dummy
+video driver) and renders until the login screen is up. Reports the
+median of RUNS launches, from process start, for:
+
+  serial, cold      no bundle, ASSET_LOADER_THREADS = 0: the bundle is
+                    built on the main thread before anything is drawn
+  threaded, cold    no bundle: images decode on worker threads behind
+                    the progress screen (the bundle would be written next)
+  bundle, warm      the bundle from a previous launch is mapped
+
+"first pixels" is when the window first shows something (the progress
+screen, or the login screen when there is none) and "interactive" when
+the login screen accepts input.
+
+    python benchmarks/bench_startup_assets.py
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+LAUNCH = """
+import json, sys
+import pygame
+import flappy
+from game import StartupTimer
+timer = StartupTimer(flappy._STARTED)
+timer.mark("imports", flappy._IMPORTED)
+game = flappy.FlappyBirdGame(startup=timer, loader_threads=int(sys.argv[1]))
+pygame.event.post(pygame.event.Event(pygame.QUIT))  # one frame, then exit
+game.run()
+elapsed = 0.0
+first_pixels = None
+for label, seconds in timer.phases:
+    elapsed += seconds
+    if label in ("loading screen", "first interactive frame") and first_pixels is None:
+        first_pixels = elapsed
+print(json.dumps({"first_pixels": first_pixels, "interactive": elapsed}))
+"""
+
+
+def launch(data_dir, threads):
+    env = dict(os.environ, FLAPPY_DATA_DIR=data_dir, SDL_VIDEODRIVER="dummy",
+               PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", LAUNCH, str(threads)], cwd=ROOT,
+                         env=env, capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def build_bundle(data_dir):
+    subprocess.run([sys.executable, "-m", "game.asset_bundle", "--output",
+                    os.path.join(data_dir, "assets.bundle")], cwd=ROOT, env=dict(
+                        os.environ, SDL_VIDEODRIVER="dummy", PYGAME_HIDE_SUPPORT_PROMPT="1"),
+                   capture_output=True, check=True)
+
+
+def median(results, key):
+    values = sorted(result[key] for result in results)
+    return values[len(values) // 2]
+
+
+def main():
+    rows = {"serial, cold": [], "threaded, cold": [], "bundle, warm": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        for _ in range(RUNS):
+            shutil.rmtree(data_dir, ignore_errors=True)
+            rows["serial, cold"].append(launch(data_dir, 0))
+            shutil.rmtree(data_dir, ignore_errors=True)
+            rows["threaded, cold"].append(launch(data_dir, 4))
+            # These launches quit before the loader gets to the bundle
+            build_bundle(data_dir)
+            rows["bundle, warm"].append(launch(data_dir, 4))
+
+    print(f"{'':<15} {'first pixels ms':>16} {'interactive ms':>15}  (median of {RUNS} launches)")
+    for name, results in rows.items():
+        print(f"{name:<15} {median(results, 'first_pixels') * 1000:>16.1f} "
+              f"{median(results, 'interactive') * 1000:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
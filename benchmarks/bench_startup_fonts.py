@@ -0,0 +1,85 @@
+"""Benchmark: startup cost of the game's fonts, cold and warm.
+
+Each measurement runs in a fresh interpreter, since pygame keeps its
+system font list for the life of the process. Reports the median of
+RUNS launches for:
+
+  eager SysFont  what game.config used to do at import: four SysFonts
+  lazy, cold     importing game, then first use of every font, with no
+                 font cache in the data directory (the first launch)
+  lazy, warm     the same with the cache written by the cold launch
+
+pygame itself is imported before timing starts. "import game" is the
+time to import the package, "fonts" the time until all four fonts have
+rendered once and "lookups" counts system font lookups; the first one
+in a process scans the installed fonts. Without fc-list (some
+containers) that scan is nearly free; on desktops it dominates.
+
+    python benchmarks/bench_startup_fonts.py
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RUNS = 5
+
+EAGER = """
+import json, time
+import pygame
+t1 = time.perf_counter()
+pygame.font.init()
+fonts = [pygame.font.SysFont('Bauhaus 93', 60), pygame.font.SysFont('Arial', 32),
+         pygame.font.SysFont('Arial', 72), pygame.font.SysFont('Arial', 20)]
+for font in fonts:
+    font.render('0', True, (0, 0, 0))
+t2 = time.perf_counter()
+print(json.dumps({"import": None, "fonts": t2 - t1, "lookups": 4}))
+"""
+
+LAZY = """
+import json, time
+import pygame
+t0 = time.perf_counter()
+import game
+t1 = time.perf_counter()
+for font in (game.FONT, game.SMALL_FONT, game.LARGE_FONT, game.TINY_FONT):
+    font.render('0', True, (0, 0, 0))
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "fonts": t2 - t1, "lookups": game.FONTS.lookup_count}))
+"""
+
+
+def launch(code, data_dir):
+    env = dict(os.environ, FLAPPY_DATA_DIR=data_dir, PYGAME_HIDE_SUPPORT_PROMPT="1")
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", code], cwd=ROOT, env=env,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def median(results, key):
+    values = sorted(result[key] for result in results)
+    return values[len(values) // 2]
+
+
+def main():
+    rows = {"eager SysFont": [], "lazy, cold": [], "lazy, warm": []}
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = os.path.join(tmp, "data")
+        for _ in range(RUNS):
+            rows["eager SysFont"].append(launch(EAGER, data_dir))
+            shutil.rmtree(data_dir, ignore_errors=True)
+            rows["lazy, cold"].append(launch(LAZY, data_dir))
+            rows["lazy, warm"].append(launch(LAZY, data_dir))
+
+    print(f"{'':<14} {'import game ms':>15} {'fonts ms':>9} {'lookups':>6}  (median of {RUNS} launches)")
+    for name, results in rows.items():
+        imported = "-" if results[0]["import"] is None else f"{median(results, 'import') * 1000:.1f}"
+        print(f"{name:<14} {imported:>15} {median(results, 'fonts') * 1000:>9.1f} {median(results, 'lookups'):>8}")
+
+
+if __name__ == "__main__":
+    main()
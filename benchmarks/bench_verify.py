@@ -0,0 +1,92 @@
+"""Benchmark: replay verifier throughput and memory ceiling.
+
+Records a few hundred autopilot runs, packs them into tar archives of
+increasing size and verifies each archive with game.verify on all cores.
+Reports replays per minute and the peak RSS of the dispatching process,
+which should stay flat as the input grows.
+
+    python benchmarks/bench_verify.py
+"""
+import io
+import os
+import random
+import resource
+import sys
+import tarfile
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.config import BIRD_HEIGHT, PIPE_WIDTH
+from game.replay import ReplayRecorder, START, HEART_SOLVED, HEART_FAILED, COUNTDOWN_END
+from game.simulation import Simulation
+from game.verify import verify_sources
+
+DISTINCT_RUNS = 300
+ARCHIVE_SIZES = (2_000, 20_000, 60_000)
+
+
+def record_run(seed, rng):
+    """Play one autopilot run with the heart lifeline and record it."""
+    sim = Simulation(seed)
+    recorder = ReplayRecorder(sim)
+    recorder.event(sim.tick, START)
+    sim.flying = True
+    while True:
+        flap = False
+        for pipe in sim.pipes:
+            if pipe.x + PIPE_WIDTH >= sim.bird_x:
+                flap = sim.bird_y + BIRD_HEIGHT > pipe.gap_y + 60 and sim.vel > 0
+                break
+        else:
+            flap = sim.bird_y + BIRD_HEIGHT // 2 > 420 and sim.vel > 0
+        flap = flap != (rng.random() < 0.005)
+        if flap:
+            recorder.flap(sim.tick)
+        sim.step(flap)
+        if sim.collided():
+            if rng.random() < 0.5:
+                recorder.event(sim.tick, HEART_SOLVED)
+                recorder.event(sim.tick, COUNTDOWN_END)
+                sim.checkpoint_reset()
+                continue
+            recorder.event(sim.tick, HEART_FAILED)
+            return recorder.finish(sim.tick, sim.score).encode()
+
+
+def write_archive(path, runs, count):
+    with tarfile.open(path, "w") as archive:
+        for i in range(count):
+            data = runs[i % len(runs)]
+            info = tarfile.TarInfo(f"replays/{i:06d}.fbr")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+            archive.members = []  # keep the writer's own memory flat
+
+
+def main():
+    rng = random.Random(1)
+    runs = [record_run(rng.getrandbits(64), rng) for _ in range(DISTINCT_RUNS)]
+    sizes = sorted(len(data) for data in runs)
+    print(f"{DISTINCT_RUNS} distinct runs, replay size p50 {sizes[len(sizes) // 2]} B, max {sizes[-1]} B")
+
+    workers = os.cpu_count() or 1
+    print(f"{'replays':>8} {'failed':>7} {'seconds':>8} {'replays/min':>12} {'peak RSS MB':>12}  ({workers} workers)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for count in ARCHIVE_SIZES:
+            path = os.path.join(tmp, f"replays-{count}.tar")
+            write_archive(path, runs, count)
+            start = time.perf_counter()
+            results = 0
+            failed = 0
+            for result in verify_sources([path], workers):
+                results += 1
+                failed += not result["ok"]
+            elapsed = time.perf_counter() - start
+            peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(f"{results:>8} {failed:>7} {elapsed:>8.2f} {results / elapsed * 60:>12,.0f} {peak:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
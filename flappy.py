@@ -1,60 +1,176 @@
 """Main entry point for Flappy Bird game."""
-import pygame
-from pygame.locals import *
 import time
+_STARTED = time.perf_counter()  # for --profile-startup
+
+import argparse
+import math
+import os
+import pygame
 
+# Only what the first frame needs; the API clients, asset loader, replay
+# and profiler modules are imported where they are first used
 from game import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, IMAGE_PATHS,
-    TINY_FONT, BLUE, GRAY, API_BASE_URL, HEART_PUZZLE_API_URL, HEART_TIME_LIMIT,
-    APIClient, HeartPuzzleAPI, GameState, ScreenState,
-    GameEngine, HeartPuzzle, ScreenRenderer
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, RENDER_FPS, FRAME_PACING, MAX_FRAME_TIME, MAX_STEPS_PER_FRAME, IDLE_MENUS,
+    TINY_FONT, FONTS, BLUE, GRAY, API_BASE_URL, HEART_PUZZLE_API_URL, HEART_TIME_LIMIT, REPLAY_DIR, PROFILE_DIR,
+    IMAGE_PATHS, ASSET_BUNDLE_PATH, ASSET_LOADER_THREADS, GameState, ScreenState,
+    GameEngine, HeartPuzzle, PuzzlePrefetcher, ScreenRenderer, ASSETS, TEXT, DirtyRectRenderer
 )
+_IMPORTED = time.perf_counter()
 
 
 class FlappyBirdGame:
     """Main game class that orchestrates all components."""
     
-    def __init__(self):
+    def __init__(self, pacing=FRAME_PACING, render_fps=RENDER_FPS, startup=None,
+                 loader_threads=ASSET_LOADER_THREADS):
+        # Optional StartupTimer; run() reports it after the first frame
+        self.startup = startup
+        mark = startup.mark if startup else lambda label: None
+        self.running = True
         pygame.init()
+        mark("pygame.init")
         self.clock = pygame.time.Clock()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.pacing = pacing
+        self.render_fps = render_fps
+        # Menus sleep until something changes (see _pace); the event that
+        # woke the loop is handled with the next frame's events
+        self.idle_menus = IDLE_MENUS
+        self._wake_event = None
+        self.screen = self._open_display()
         pygame.display.set_caption("Flappy Bird + Heart Puzzle")
+        mark("display")
         
-        # Load images
-        self.bg = pygame.image.load(IMAGE_PATHS['bg'])
-        self.ground_img = pygame.image.load(IMAGE_PATHS['ground'])
+        # Load images: map the pre-decoded bundle, or decode them on worker
+        # threads behind a progress screen while the bundle is written
+        self.asset_loader = None
+        if not loader_threads:
+            ASSETS.load_bundle()
+        elif ASSETS.load_bundle(build=False) is None:
+            from game.asset_loader import AssetLoader, startup_jobs
+            self.asset_loader = AssetLoader(ASSETS, loader_threads)
+            self.asset_loader.start(startup_jobs(IMAGE_PATHS))
+            self.asset_loader.build_bundle_after(ASSET_BUNDLE_PATH, IMAGE_PATHS)
+            self._show_loading(mark)
+        self.bg = ASSETS.image('bg')
+        self.ground_img = ASSETS.image('ground')
+        mark("assets")
         
         # Initialize components
         self.game_state = GameState()
+        from game.api_client import APIClient, HeartPuzzleAPI
         self.api_client = APIClient(API_BASE_URL)
         self.heart_puzzle_api = HeartPuzzleAPI(HEART_PUZZLE_API_URL, HEART_TIME_LIMIT)
-        self.heart_puzzle = HeartPuzzle(self.heart_puzzle_api)
+        self.heart_puzzle = HeartPuzzle(self.heart_puzzle_api, PuzzlePrefetcher(self.heart_puzzle_api))
+        mark("API clients")
         self.game_engine = GameEngine(self.game_state)
-        self.screen_renderer = ScreenRenderer(self.screen, self.game_state, self.api_client)
+        mark("GameEngine.__init__")
+        self.dirty = DirtyRectRenderer(self.screen.get_size())
+        self.screen_renderer = ScreenRenderer(self.screen, self.game_state, self.api_client, self.dirty)
+        mark("ScreenRenderer.__init__")
+        # Last rendered (screen, mode) pair; any change forces a full flip
+        self._last_render_mode = None
         
-        self.running = True
+        # F3 toggles the profiler and its overlay, F4 exports the samples;
+        # both are built on first use (see the profiler property)
+        self._profiler = None
+        self.profiler_overlay = None
+    
+    @property
+    def profiler(self):
+        """The frame profiler, created with its phases registered on first use."""
+        if self._profiler is None:
+            from game.profiler import Profiler, ProfilerOverlay
+            self._profiler = Profiler()
+            self.profiler_overlay = ProfilerOverlay(self._profiler)
+            self._watch_phases()
+        return self._profiler
+    
+    def _profiling(self):
+        return self._profiler is not None and self._profiler.enabled
+    
+    def _show_loading(self, mark):
+        """Draw a progress bar until the login screen and sprites are decoded."""
+        from game.asset_loader import GAMEPLAY
+        from game.screens import draw_loading_screen
+        loader = self.asset_loader
+        shown = False
+        while not loader.ready(GAMEPLAY):
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    self.running = False
+            draw_loading_screen(self.screen, *loader.progress(GAMEPLAY))
+            pygame.display.flip()
+            if not shown:
+                mark("loading screen")
+                shown = True
+            loader.wait(GAMEPLAY, 1 / 30)
+    
+    def _watch_phases(self):
+        """Register the frame phases the profiler times when enabled."""
+        watch = self._profiler.watch
+        watch(self, 'handle_events')
+        watch(self, 'update_game')
+        watch(self.game_engine, 'update', 'GameEngine.update')
+        watch(self.game_engine, 'check_collisions', 'GameEngine.check_collisions')
+        watch(self.game_engine, 'draw', 'GameEngine.draw')
+        for name in dir(ScreenRenderer):
+            if name.startswith('draw_'):
+                watch(self.screen_renderer, name, f'ScreenRenderer.{name}')
+        watch(self.dirty, 'present', 'display.update')
+    
+    def _open_display(self):
+        """Create the window; vsync pacing needs a renderer-backed display."""
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        if self.pacing == "vsync":
+            try:
+                return pygame.display.set_mode(size, pygame.SCALED, vsync=1)
+            except pygame.error as e:
+                print(f"vsync unavailable ({e}); pacing with tick_busy_loop")
+                self.pacing = "busy"
+        return pygame.display.set_mode(size)
     
     def handle_events(self):
         """Handle pygame events."""
-        for event in pygame.event.get():
+        events = pygame.event.get()
+        if self._wake_event is not None:
+            events.insert(0, self._wake_event)
+            self._wake_event = None
+        for event in events:
             if event.type == pygame.QUIT:
                 self.running = False
                 return
             
+            if event.type == pygame.WINDOWEXPOSED:
+                self.dirty.mark_all()
+            
             if event.type == pygame.KEYDOWN:
                 self._handle_keydown(event)
             
+            # Menu widgets react to mouse events
+            if not self._should_update_game():
+                self.screen_renderer.handle_event(event)
+            
             # Handle heart puzzle input
             if self.heart_puzzle.active:
                 self._handle_heart_puzzle_input(event)
     
     def _handle_keydown(self, event):
         """Handle keyboard input."""
+        if event.key == pygame.K_F3:
+            self.profiler.toggle()
+        elif event.key == pygame.K_F4:
+            self._export_profile()
+        
         # ESC key handling
         if event.key == pygame.K_ESCAPE:
             if self.game_state.current_screen in [ScreenState.LEADERBOARD, ScreenState.PROFILE]:
                 self.game_state.current_screen = ScreenState.HOME
             elif self.game_state.game_started:
+                # Abandon the run: the next one starts from a fresh
+                # simulation, seed and replay recorder
+                if self.heart_puzzle.active:
+                    self.heart_puzzle.deactivate()
+                self.game_engine.reset_game()
                 self.game_state.return_to_home()
             elif self.game_state.current_screen == ScreenState.REGISTER:
                 self.game_state.current_screen = ScreenState.LOGIN
@@ -71,7 +187,15 @@ class FlappyBirdGame:
             not self.game_state.game_over and 
             not self.heart_puzzle.active and 
             not self.game_state.countdown_active):
+            from game.replay import START
             self.game_state.flying = True
+            self.game_engine.record_event(START)
+        
+        # Flaps are queued and consumed one per simulation step
+        if (event.key == pygame.K_SPACE and 
+            self.game_state.flying and 
+            not self.game_state.game_over):
+            self.game_engine.queue_flap()
     
     def _handle_input_field(self, event):
         """Handle input field keyboard events."""
@@ -129,6 +253,9 @@ class FlappyBirdGame:
     
     def _handle_heart_puzzle_input(self, event):
         """Handle input for heart puzzle."""
+        from game.replay import HEART_SOLVED, HEART_FAILED
+        if self.heart_puzzle.waiting:
+            return  # nothing to answer until the puzzle arrives
         if event.type == pygame.KEYDOWN:
             if event.key == pygame.K_BACKSPACE:
                 self.heart_puzzle.input = self.heart_puzzle.input[:-1]
@@ -139,8 +266,10 @@ class FlappyBirdGame:
                     self.game_state.countdown_end_time = time.time() + 3
                     self.game_engine.checkpoint_reset()
                     self.game_state.heart_lifeline_used = False
+                    self.game_engine.record_event(HEART_SOLVED)
                 else:
                     # Wrong answer - game over
+                    self.game_engine.record_event(HEART_FAILED)
                     self.heart_puzzle.deactivate()
                     self.game_state.game_over = True
                     self.game_state.heart_lifeline_used = True
@@ -153,6 +282,10 @@ class FlappyBirdGame:
         """Update game logic."""
         if not self._should_update_game():
             return
+        from game.replay import HEART_FAILED, HEART_UNAVAILABLE, COUNTDOWN_END
+        
+        # Lifeline puzzles are fetched in the background while the run is on
+        self.heart_puzzle.prepare()
         
         # Normal game mode
         if not self.heart_puzzle.active and not self.game_state.countdown_active:
@@ -167,9 +300,11 @@ class FlappyBirdGame:
                         self.game_state.flying = False
                     else:
                         # API failure - game over
+                        self.game_engine.record_event(HEART_UNAVAILABLE)
                         self.game_state.game_over = True
                 else:
                     # Lifeline already used, game over
+                    self.game_engine.record_event(HEART_FAILED)
                     self.game_state.game_over = True
             
             # Handle game over
@@ -178,7 +313,13 @@ class FlappyBirdGame:
         
         # Heart puzzle mode
         elif self.heart_puzzle.active:
-            if self.heart_puzzle.is_time_up():
+            if not self.heart_puzzle.update():
+                # The awaited puzzle never arrived
+                self.game_engine.record_event(HEART_UNAVAILABLE)
+                self.game_state.game_over = True
+                self.game_state.heart_lifeline_used = True
+            elif self.heart_puzzle.is_time_up():
+                self.game_engine.record_event(HEART_FAILED)
                 self.heart_puzzle.deactivate()
                 self.game_state.game_over = True
                 self.game_state.heart_lifeline_used = True
@@ -187,11 +328,18 @@ class FlappyBirdGame:
         elif self.game_state.countdown_active:
             remaining_time = int(self.game_state.countdown_end_time - time.time())
             if remaining_time <= 0:
+                self.game_engine.record_event(COUNTDOWN_END)
                 self.game_state.countdown_active = False
                 self.game_state.game_over = False
                 self.game_state.flying = True
                 self.game_state.puzzle_solved = False
     
+    def _prefetch_puzzles(self):
+        """Start filling the lifeline's puzzle pool once past the login
+        screens, so it is ready before the first collision."""
+        if self.game_state.current_screen not in (ScreenState.LOGIN, ScreenState.REGISTER):
+            self.heart_puzzle.prepare()
+    
     def _should_update_game(self):
         """Check if game should be updated."""
         return (self.game_state.game_started and 
@@ -199,14 +347,17 @@ class FlappyBirdGame:
     
     def _handle_game_over(self):
         """Handle game over logic."""
-        # Submit score if logged in and not already submitted
+        # Journal the score once; the API client's queue delivers it in the
+        # background and survives backend outages and crashes
         if (self.api_client.auth_token and 
             self.game_state.score > 0 and 
-            (not self.api_client.score_submitted or 
-             self.game_state.score != self.api_client.last_submitted_score)):
-            success, msg = self.api_client.submit_score(self.game_state.score)
-            if success:
-                self.api_client.get_user_rank()
+            not self.game_state.score_queued):
+            self.api_client.queue_score(self.game_state.score)
+            self.game_state.score_queued = True
+        
+        replay = self.game_engine.take_replay()
+        if replay:
+            self._save_replay(replay)
         
         # Auto-redirect to home after 3 seconds
         if self.game_state.game_over_screen_timer == 0:
@@ -219,8 +370,42 @@ class FlappyBirdGame:
             self.api_client.score_submitted = False
             self.api_client.last_submitted_score = 0
     
-    def render(self):
-        """Render the current screen."""
+    def _save_replay(self, replay):
+        """Keep the finished run so it can be played back or audited."""
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}-{replay.seed:016x}.fbr"
+        try:
+            replay.save(os.path.join(REPLAY_DIR, name))
+        except OSError as e:
+            print(f"Could not save replay: {e}")
+    
+    def _export_profile(self):
+        """Write the profiler's samples as CSV and Chrome trace JSON."""
+        base = os.path.join(PROFILE_DIR, time.strftime('%Y%m%d-%H%M%S'))
+        try:
+            self.profiler.export_csv(base + ".csv")
+            self.profiler.export_chrome_trace(base + ".json")
+            print(f"Profile written to {base}.csv and {base}.json")
+        except OSError as e:
+            print(f"Could not write profile: {e}")
+    
+    def _render_mode(self):
+        """Identify what is on screen, so transitions get a full flip."""
+        return (
+            self.game_state.current_screen,
+            self._should_update_game(),
+            self.heart_puzzle.active,
+            self.heart_puzzle.waiting,
+            self.game_state.countdown_active,
+            self.game_state.game_over,
+        )
+    
+    def render(self, alpha=1.0):
+        """Render the current screen; alpha interpolates gameplay between steps."""
+        mode = self._render_mode()
+        if mode != self._last_render_mode:
+            self.dirty.mark_all()
+            self._last_render_mode = mode
+        
         # Render UI screens
         if self.game_state.current_screen == ScreenState.LOGIN:
             self.screen_renderer.draw_login_screen()
@@ -238,7 +423,7 @@ class FlappyBirdGame:
         if self._should_update_game():
             if not self.heart_puzzle.active and not self.game_state.countdown_active:
                 if not self.game_state.game_over:
-                    self.game_engine.draw(self.screen, self.bg, self.ground_img)
+                    self.dirty.mark_many(self.game_engine.draw(self.screen, self.bg, self.ground_img, alpha))
                 else:
                     # Game over screen
                     remaining = int(3 - (time.time() - self.game_state.game_over_screen_timer))
@@ -254,8 +439,7 @@ class FlappyBirdGame:
                     remaining_time = 0
                 self.screen_renderer.draw_countdown_screen(
                     self.bg, self.ground_img, self.game_state.ground_scroll,
-                    self.game_engine.bird_group, self.game_state.score, remaining_time,
-                    self.game_state.flying, self.game_state.game_over, self.game_state.countdown_active
+                    self.game_engine.bird_group, self.game_state.score, remaining_time
                 )
             
             # Show user info overlay in game
@@ -266,27 +450,185 @@ class FlappyBirdGame:
                 self._draw_text(user_text, TINY_FONT, BLUE, 10, 10)
                 self._draw_text("ESC: Home", TINY_FONT, GRAY, 10, SCREEN_HEIGHT - 20)
         
-        pygame.display.update()
+        if self._profiling():
+            self.dirty.mark(self.profiler_overlay.draw(self.screen))
+        
+        self.dirty.present()
     
     def _draw_text(self, text, font, col, x, y):
         """Helper to draw text."""
-        img = font.render(text, True, col)
-        self.screen.blit(img, (x, y))
+        self.dirty.mark(TEXT.draw(self.screen, text, font, col, x, y))
+    
+    def _idle(self):
+        """Whether nothing animates at frame rate (a menu screen)."""
+        return self.idle_menus and not self._should_update_game() and not self._profiling()
+    
+    def _pace(self):
+        """Wait for the next frame according to the pacing mode.
+        
+        Idle menus instead sleep until an event arrives or the screen
+        needs a redraw by itself (ScreenRenderer.idle_timeout). Returns
+        True after such a sleep.
+        """
+        if self._idle():
+            timeout = math.ceil(self.screen_renderer.idle_timeout() * 1000)
+            event = pygame.event.wait(max(1, timeout))
+            if event.type != pygame.NOEVENT:
+                self._wake_event = event
+            self.clock.tick()
+            return True
+        if self.pacing == "vsync":
+            self.clock.tick()  # presenting the frame already waited for vblank
+        elif self.pacing == "busy":
+            self.clock.tick_busy_loop(self.render_fps)
+        else:
+            self.clock.tick(self.render_fps)
     
     def run(self):
-        """Main game loop."""
+        """Main game loop.
+        
+        The simulation advances in fixed steps of 1/FPS s from an
+        accumulator of real time; rendering happens once per loop at the
+        display's pace and interpolates between the last two steps. After
+        a stall, at most MAX_FRAME_TIME is caught up, in no more than
+        MAX_STEPS_PER_FRAME steps, and the rest is dropped. Menu screens
+        are only rendered when woken by input or a timeout (see _pace).
+        """
+        step = 1.0 / FPS
+        accumulator = 0.0
+        previous = time.perf_counter()
         while self.running:
-            self.clock.tick(FPS)
+            now = time.perf_counter()
+            accumulator += min(now - previous, MAX_FRAME_TIME)
+            previous = now
+            
+            self.api_client.poll()
             self.handle_events()
-            self.update_game()
+            self._prefetch_puzzles()
+            steps = 0
+            while accumulator >= step and steps < MAX_STEPS_PER_FRAME:
+                self.update_game()
+                accumulator -= step
+                steps += 1
+            if accumulator >= step:
+                accumulator %= step  # spiral-of-death guard: drop the backlog
+            
+            self.render(accumulator / step)
+            if self.startup:
+                self._report_startup()
+            if self.running and self._pace():
+                previous = time.perf_counter()  # menus have nothing to catch up
+            if self._profiling():
+                self.profiler.end_frame()
+        
+        if self._profiling():
+            self._export_profile()
+        self._close_assets()
+        self.api_client.close()
+        if self.heart_puzzle.prefetcher:
+            self.heart_puzzle.prefetcher.stop()
+        pygame.quit()
+    
+    def _close_assets(self):
+        """Stop background decoding; must happen before pygame.quit()."""
+        if self.asset_loader:
+            self.asset_loader.close()
+    
+    def _report_startup(self):
+        """Print the startup phases once the first interactive frame is on screen."""
+        self.startup.mark("first interactive frame")
+        print(self.startup.report())
+        decoded = f"images decoded: {ASSETS.load_count}"
+        if self.asset_loader:
+            decoded += f" (+{self.asset_loader.progress()[0]} on worker threads)"
+        print(f"{decoded}, fonts built: {FONTS.build_count}")
+        self.startup = None
+    
+    def play_replay(self, replay):
+        """Play a recorded run back at real time; ESC stops it."""
+        from game.replay import ReplayPlayer, HEART_SOLVED
+        player = ReplayPlayer(replay)
+        self.game_engine.attach(player.sim)
+        self.game_state.start_new_game()
+        state = self.game_state
+        
+        while self.running:
+            self.clock.tick(FPS)
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT or (
+                        event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+                    self.running = False
+            
+            if state.countdown_active:
+                if time.time() >= state.countdown_end_time:
+                    state.countdown_active = False
+            elif not player.done:
+                if player.step() == HEART_SOLVED:
+                    state.countdown_active = True
+                    state.countdown_end_time = time.time() + 3
+            elif not state.game_over:
+                state.game_over = True
+                state.game_over_screen_timer = time.time()
+            elif time.time() - state.game_over_screen_timer >= 3:
+                break
+            
+            state.flying = player.sim.flying
+            state.score = player.sim.score
+            state.ground_scroll = player.sim.ground_scroll
+            self.game_engine.attach(player.sim)
             self.render()
         
+        self._close_assets()
+        self.api_client.close()
         pygame.quit()
+        return player
+
+
+def _replay_headless(replay):
+    """Re-simulate a replay at full speed and report whether it checks out."""
+    from game.replay import ReplayPlayer
+    start = time.perf_counter()
+    player = ReplayPlayer(replay)
+    score = player.run()
+    elapsed = time.perf_counter() - start
+    status = "ok" if player.verified() else f"MISMATCH ({player.error or 'score differs'})"
+    print(f"claimed {replay.score}, simulated {score}: {status}; "
+          f"{player.sim.tick} ticks in {elapsed * 1000:.1f} ms")
+    return player.verified()
 
 
 def main():
     """Entry point."""
-    game = FlappyBirdGame()
+    parser = argparse.ArgumentParser(description="Flappy Bird + Heart Puzzle")
+    parser.add_argument("--replay", metavar="FILE", help="play back a recorded run")
+    parser.add_argument("--headless", action="store_true",
+                        help="with --replay: simulate at full speed without a window")
+    parser.add_argument("--pacing", choices=("tick", "busy", "vsync"), default=FRAME_PACING,
+                        help="frame pacing: sleep, busy-wait (precise) or display vsync")
+    parser.add_argument("--fps", type=int, default=RENDER_FPS,
+                        help="render frame cap for tick/busy pacing")
+    parser.add_argument("--profile", action="store_true",
+                        help="start with the frame profiler on (F3) and export it on exit")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="print the time spent in each startup phase up to the first interactive frame")
+    args = parser.parse_args()
+    
+    if args.replay:
+        from game.replay import Replay
+        replay = Replay.load(args.replay)
+        if args.headless:
+            raise SystemExit(0 if _replay_headless(replay) else 1)
+        FlappyBirdGame(args.pacing, args.fps).play_replay(replay)
+        return
+    
+    startup = None
+    if args.profile_startup:
+        from game.profiler import StartupTimer
+        startup = StartupTimer(_STARTED)
+        startup.mark("imports", _IMPORTED)
+    game = FlappyBirdGame(args.pacing, args.fps, startup)
+    if args.profile:
+        game.profiler.enable()
     game.run()
 
 
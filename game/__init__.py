@@ -1,25 +1,113 @@
-"""Flappy Bird game package."""
+"""Flappy Bird game package.
+
+Only the config is imported eagerly. Everything else is loaded the first
+time one of its names is accessed (module __getattr__), so scripts only
+pay for the parts they use.
+"""
+import importlib
+
 # Import all config constants (using * for convenience since config has many constants)
 from .config import *
-from .api_client import APIClient, HeartPuzzleAPI
-from .game_state import GameState, ScreenState
-from .game_engine import GameEngine
-from .heart_puzzle import HeartPuzzle
-from .screens import ScreenRenderer
-from .sprites import Bird, Pipe, Button, TextButton
+
+# Public name -> submodule that defines it, imported on first access
+_LAZY = {
+    'APIClient': 'api_client',
+    'HeartPuzzleAPI': 'api_client',
+    'HTTPSession': 'http_session',
+    'CircuitBreaker': 'http_session',
+    'CircuitOpenError': 'http_session',
+    'get_session': 'http_session',
+    'AssetRegistry': 'assets',
+    'ASSETS': 'assets',
+    'AssetBundle': 'asset_bundle',
+    'AssetLoader': 'asset_loader',
+    'FontRegistry': 'fonts',
+    'LazyFont': 'fonts',
+    'GameState': 'game_state',
+    'ScreenState': 'game_state',
+    'GameEngine': 'game_engine',
+    'HeartPuzzle': 'heart_puzzle',
+    'PuzzlePrefetcher': 'heart_puzzle',
+    'ScreenRenderer': 'screens',
+    'Bird': 'sprites',
+    'Button': 'sprites',
+    'TextButton': 'sprites',
+    'TextRenderer': 'text',
+    'TEXT': 'text',
+    'Widget': 'widgets',
+    'ButtonWidget': 'widgets',
+    'WidgetTree': 'widgets',
+    'DirtyRectRenderer': 'dirty_rects',
+    'SceneCompositor': 'compositor',
+    'get_scene_compositor': 'compositor',
+    'Simulation': 'simulation',
+    'BatchSimulation': 'batch_simulation',
+    'MaskCollider': 'collision',
+    'get_mask_collider': 'collision',
+    'Replay': 'replay',
+    'ReplayError': 'replay',
+    'ReplayPlayer': 'replay',
+    'ReplayRecorder': 'replay',
+    'Profiler': 'profiler',
+    'ProfilerOverlay': 'profiler',
+    'StartupTimer': 'profiler',
+}
 
 __all__ = [
     # Classes
     'APIClient',
     'HeartPuzzleAPI',
+    'HTTPSession',
+    'CircuitBreaker',
+    'CircuitOpenError',
+    'get_session',
+    'AssetRegistry',
+    'ASSETS',
+    'AssetBundle',
+    'AssetLoader',
+    'FontRegistry',
+    'LazyFont',
+    'FONTS',
     'GameState',
     'ScreenState',
     'GameEngine',
     'HeartPuzzle',
+    'PuzzlePrefetcher',
     'ScreenRenderer',
     'Bird',
-    'Pipe',
     'Button',
     'TextButton',
+    'TextRenderer',
+    'TEXT',
+    'Widget',
+    'ButtonWidget',
+    'WidgetTree',
+    'DirtyRectRenderer',
+    'SceneCompositor',
+    'get_scene_compositor',
+    'Simulation',
+    'BatchSimulation',
+    'MaskCollider',
+    'get_mask_collider',
+    'Replay',
+    'ReplayError',
+    'ReplayPlayer',
+    'ReplayRecorder',
+    'Profiler',
+    'ProfilerOverlay',
+    'StartupTimer',
     # Note: Config constants are also exported via 'from .config import *'
 ]
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,13 +1,111 @@
 """API client for backend communication and heart puzzle API."""
-import requests
 import io
+import time
 import pygame
+from concurrent.futures import ThreadPoolExecutor
+from .config import SCORE_JOURNAL_PATH
+from .score_queue import ScoreQueue, DELIVERED, REJECTED, RETRY, HELD
+
+# Worker threads used for non-blocking API calls
+API_WORKERS = 2
+
+# Seconds a cached GET response is served without revalidation
+CACHE_TTLS = {
+    'get_leaderboard': 30,
+    'get_user_rank': 30,
+    'get_profile': 60,
+}
+
+
+def get_session():
+    """The shared HTTPSession, importing requests on the first call.
+
+    Importing the client stays cheap, and since most calls run on worker
+    threads, so does the first request's import.
+    """
+    from .http_session import get_session as shared_session
+    return shared_session()
+
+
+class CacheEntry:
+    """Cached response body with its validator."""
+    
+    def __init__(self, data, etag, ttl):
+        self.data = data
+        self.etag = etag
+        self.ttl = ttl
+        self.fetched_at = time.monotonic()
+    
+    def is_fresh(self):
+        return time.monotonic() - self.fetched_at < self.ttl
+
+
+class ResponseCache:
+    """Per-endpoint TTL cache for GET responses (stale-while-revalidate).
+    
+    Stale entries are still returned so screens can render instantly
+    while APIClient.refresh revalidates them in the background.
+    """
+    
+    def __init__(self, ttls=None):
+        self.ttls = dict(CACHE_TTLS if ttls is None else ttls)
+        self._entries = {}
+    
+    def get(self, key):
+        return self._entries.get(key)
+    
+    def store(self, key, data, etag=None):
+        self._entries[key] = CacheEntry(data, etag, self.ttls.get(key[0], 0))
+    
+    def touch(self, key):
+        """Mark an entry fresh again (after a 304 Not Modified)."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.fetched_at = time.monotonic()
+    
+    def clear(self):
+        self._entries.clear()
+
+
+class PendingCall:
+    """Handle for an API call running on the background worker.
+    
+    The network request runs on a worker thread; its response is turned
+    into a result (and applied to the client's state) on the main thread
+    by APIClient.poll(), which then invokes the optional callback.
+    """
+    
+    def __init__(self, name, future, handler, callback=None):
+        self.name = name
+        self.future = future
+        self.handler = handler
+        self.callback = callback
+        self.done = False
+        self.result = None
+    
+    def apply(self):
+        """Apply the finished response on the calling (main) thread."""
+        response, error = self.future.result()
+        self.result = self.handler(response, error)
+        self.done = True
+        if self.callback:
+            self.callback(self.result)
+        return self.result
 
 
 class APIClient:
-    """Handles all API communication with the backend."""
+    """Handles all API communication with the backend.
+    
+    Every endpoint can be called synchronously (``login(...)``) or on a
+    worker thread with ``call_async('login', ...)``. Async results are
+    applied to ``user_info``/``leaderboard_data``/``user_rank`` only when
+    the main loop calls ``poll()``.
     
-    def __init__(self, base_url):
+    Game-over scores go through ``queue_score``, which journals them to
+    disk and delivers them in the background (see ScoreQueue).
+    """
+    
+    def __init__(self, base_url, journal_path=SCORE_JOURNAL_PATH):
         self.base_url = base_url
         self.auth_token = None
         self.user_info = None
@@ -15,134 +113,326 @@ class APIClient:
         self.user_rank = None
         self.score_submitted = False
         self.last_submitted_score = 0
+        self._executor = None
+        self._pending = []
+        self.cache = ResponseCache()
+        # Scores left over from a previous (possibly crashed) session are
+        # flushed as soon as the backend is reachable
+        self.score_queue = ScoreQueue(journal_path, self._deliver_queued_score)
+        if self.score_queue.pending():
+            self.score_queue.start()
     
-    def register(self, username, email, password):
-        """Register a new user."""
+    # ------------------------------------------------------------------
+    # Call plumbing
+    # ------------------------------------------------------------------
+    
+    def _auth_headers(self):
+        return {"Authorization": f"Bearer {self.auth_token}"}
+    
+    def _request(self, method, path, **kwargs):
+        """Build a zero-argument callable that performs one HTTP request."""
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", 5)
+        return lambda: get_session().request(method, url, **kwargs)
+    
+    @staticmethod
+    def _send(send):
+        """Run a request callable; return (response, error) without raising."""
+        if send is None:
+            return None, None
         try:
-            response = requests.post(
-                f"{self.base_url}/auth/register",
-                json={"username": username, "email": email, "password": password},
+            return send(), None
+        except Exception as e:
+            return None, e
+    
+    def _run(self, call):
+        send, handler = call
+        response, error = self._send(send)
+        return handler(response, error)
+    
+    def call_async(self, name, *args, callback=None):
+        """Start endpoint `name` on the worker pool and return a PendingCall.
+        
+        The callback receives the same value the synchronous method returns.
+        """
+        send, handler = getattr(self, f"_{name}_call")(*args)
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=API_WORKERS, thread_name_prefix="api"
+            )
+        future = self._executor.submit(self._send, send)
+        pending = PendingCall(name, future, handler, callback)
+        self._pending.append(pending)
+        return pending
+    
+    def poll(self):
+        """Apply finished async calls; call once per frame on the main thread."""
+        while self.score_queue.completed:
+            entry, outcome = self.score_queue.completed.popleft()
+            if outcome == DELIVERED:
+                self.cache.clear()  # Rank and high score have changed
+            if outcome == DELIVERED and self.auth_token and entry["user"] == self._queue_user():
+                self.score_submitted = True
+                self.last_submitted_score = entry["score"]
+                self.call_async('get_user_rank')
+        if not self._pending:
+            return
+        finished = [call for call in self._pending if call.future.done()]
+        for call in finished:
+            self._pending.remove(call)
+            call.apply()
+    
+    def is_loading(self, name=None):
+        """Check whether an async call (optionally a specific endpoint) is in flight."""
+        return any(name is None or call.name == name for call in self._pending)
+    
+    def close(self):
+        """Stop the worker pool without waiting for in-flight requests."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._pending.clear()
+        self.score_queue.close()
+    
+    # ------------------------------------------------------------------
+    # Client-side cache
+    # ------------------------------------------------------------------
+    
+    def _cache_key(self, name, *args):
+        """Cache key for an endpoint; per-user endpoints are keyed by token."""
+        if name == 'get_leaderboard':
+            return (name,) + args
+        return (name, self.auth_token)
+    
+    def refresh(self, name, *args, callback=None):
+        """Show cached data for a GET endpoint now; revalidate if stale.
+        
+        Fresh entries are applied without any request. Stale or missing
+        entries trigger a background conditional request (If-None-Match).
+        Returns the PendingCall, or None if nothing was sent.
+        """
+        entry = self.cache.get(self._cache_key(name, *args))
+        if entry is not None:
+            {
+                'get_leaderboard': self._apply_leaderboard,
+                'get_user_rank': self._apply_user_rank,
+                'get_profile': self._apply_profile,
+            }[name](entry.data)
+            if entry.is_fresh():
+                return None
+        if self.is_loading(name):
+            return None
+        return self.call_async(name, *args, callback=callback)
+    
+    # ------------------------------------------------------------------
+    # Offline score queue
+    # ------------------------------------------------------------------
+    
+    def _queue_user(self):
+        """The logged-in user as the score queue identifies them."""
+        return (self.user_info or {}).get('id') or (self.user_info or {}).get('username')
+    
+    def queue_score(self, score_value, level=1):
+        """Journal a score for background delivery; returns False if logged out."""
+        if not self.auth_token:
+            return False
+        self.score_queue.enqueue(self._queue_user(), score_value, level)
+        return True
+    
+    def _resume_score_queue(self):
+        """Deliver scores waiting for this user now that they are logged in."""
+        if self.score_queue.pending():
+            self.score_queue.start()
+            self.score_queue.wake()
+    
+    def _deliver_queued_score(self, entry):
+        """Send one journaled score (runs on the queue's thread).
+        
+        The journal holds no tokens: an entry is sent with the current
+        session's token once its user is logged in, and waits until then.
+        """
+        token = self.auth_token
+        if not token or self._queue_user() != entry["user"]:
+            return HELD
+        try:
+            response = get_session().post(
+                f"{self.base_url}/scores/submit",
+                json={"score": entry["score"], "level": entry["level"]},
+                headers={
+                    "Authorization": f"Bearer {token}",
+                    "Idempotency-Key": entry["key"],
+                },
                 timeout=5
             )
+        except Exception:
+            return RETRY
+        if response.status_code == 201:
+            return DELIVERED
+        if response.status_code >= 500 or response.status_code == 429:
+            return RETRY
+        return REJECTED
+    
+    # ------------------------------------------------------------------
+    # Endpoints: each _<name>_call returns (send, handler)
+    # ------------------------------------------------------------------
+    
+    def _register_call(self, username, email, password):
+        def handle(response, error):
+            if error:
+                return False, f"Connection error: {str(error)}"
             if response.status_code == 201:
                 data = response.json()
                 self.auth_token = data.get("token")
                 self.user_info = data.get("user")
+                self._resume_score_queue()
                 return True, "Registration successful!"
-            else:
-                try:
-                    error_msg = response.json().get("error", "Registration failed")
-                except:
-                    error_msg = f"Registration failed (Status: {response.status_code})"
-                return False, error_msg
-        except Exception as e:
-            return False, f"Connection error: {str(e)}"
+            try:
+                error_msg = response.json().get("error", "Registration failed")
+            except:
+                error_msg = f"Registration failed (Status: {response.status_code})"
+            return False, error_msg
+        
+        send = self._request(
+            "POST", "/auth/register",
+            json={"username": username, "email": email, "password": password}
+        )
+        return send, handle
     
-    def login(self, username, password):
-        """Login user."""
-        try:
-            response = requests.post(
-                f"{self.base_url}/auth/login",
-                json={"username": username, "password": password},
-                timeout=5
-            )
+    def _login_call(self, username, password):
+        def handle(response, error):
+            if error:
+                return False, f"Connection error: {str(error)}"
             if response.status_code == 200:
                 data = response.json()
                 self.auth_token = data.get("token")
                 self.user_info = data.get("user")
+                self._resume_score_queue()
                 return True, "Login successful!"
-            else:
-                try:
-                    error_msg = response.json().get("error", "Login failed")
-                except:
-                    error_msg = f"Login failed (Status: {response.status_code})"
-                return False, error_msg
-        except Exception as e:
-            return False, f"Connection error: {str(e)}"
-    
-    def submit_score(self, score_value, level=1):
-        """Submit score to backend."""
-        if not self.auth_token:
-            return False, "Not logged in"
+            try:
+                error_msg = response.json().get("error", "Login failed")
+            except:
+                error_msg = f"Login failed (Status: {response.status_code})"
+            return False, error_msg
         
-        try:
-            headers = {"Authorization": f"Bearer {self.auth_token}"}
-            response = requests.post(
-                f"{self.base_url}/scores/submit",
-                json={"score": score_value, "level": level},
-                headers=headers,
-                timeout=5
-            )
+        send = self._request(
+            "POST", "/auth/login",
+            json={"username": username, "password": password}
+        )
+        return send, handle
+    
+    def _submit_score_call(self, score_value, level=1):
+        def handle(response, error):
+            if response is None and error is None:
+                return False, "Not logged in"
+            if self.auth_token != token:
+                return False, "Logged out"
+            if error:
+                return False, f"Connection error: {str(error)}"
             if response.status_code == 201:
                 self.score_submitted = True
                 self.last_submitted_score = score_value
+                self.cache.clear()  # Rank and high score have changed
                 return True, "Score submitted!"
-            else:
-                try:
-                    error_msg = response.json().get("error", "Failed to submit score")
-                except:
-                    error_msg = f"Failed to submit score (Status: {response.status_code})"
-                return False, error_msg
-        except Exception as e:
-            return False, f"Connection error: {str(e)}"
+            try:
+                error_msg = response.json().get("error", "Failed to submit score")
+            except:
+                error_msg = f"Failed to submit score (Status: {response.status_code})"
+            return False, error_msg
+        
+        token = self.auth_token
+        if not token:
+            return None, handle
+        send = self._request(
+            "POST", "/scores/submit",
+            json={"score": score_value, "level": level},
+            headers=self._auth_headers()
+        )
+        return send, handle
     
-    def get_leaderboard(self, limit=10):
-        """Get leaderboard."""
-        try:
-            response = requests.get(
-                f"{self.base_url}/scores/leaderboard?limit={limit}",
-                timeout=5
-            )
+    def _cached_get_call(self, name, path, apply, what, authenticated, *key_args):
+        """Build a conditional GET whose body is cached for refresh()."""
+        token = self.auth_token
+        cache_key = self._cache_key(name, *key_args)
+        entry = self.cache.get(cache_key)
+        
+        def handle(response, error):
+            if response is None and error is None:
+                return False  # Not logged in
+            if authenticated and self.auth_token != token:
+                return False  # Logged out while the request was in flight
+            if error:
+                print(f"Error fetching {what}: {error}")
+                return False
+            if response.status_code == 304 and entry is not None:
+                self.cache.touch(cache_key)
+                apply(entry.data)
+                return True
             if response.status_code == 200:
                 data = response.json()
-                self.leaderboard_data = data.get("leaderboard", [])
+                self.cache.store(cache_key, data, response.headers.get("ETag"))
+                apply(data)
                 return True
             return False
-        except Exception as e:
-            print(f"Error fetching leaderboard: {e}")
-            return False
+        
+        if authenticated and not token:
+            return None, handle
+        headers = self._auth_headers() if authenticated else {}
+        if entry is not None and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        return self._request("GET", path, headers=headers), handle
+    
+    def _apply_leaderboard(self, data):
+        self.leaderboard_data = data.get("leaderboard", [])
+    
+    def _apply_user_rank(self, data):
+        self.user_rank = data
+    
+    def _apply_profile(self, data):
+        self.user_info = data.get("user")
+    
+    def _get_leaderboard_call(self, limit=10):
+        return self._cached_get_call(
+            'get_leaderboard', f"/scores/leaderboard?limit={limit}",
+            self._apply_leaderboard, "leaderboard", False, limit
+        )
+    
+    def _get_user_rank_call(self):
+        return self._cached_get_call(
+            'get_user_rank', "/scores/my-rank", self._apply_user_rank, "rank", True
+        )
+    
+    def _get_profile_call(self):
+        return self._cached_get_call(
+            'get_profile', "/auth/me", self._apply_profile, "profile", True
+        )
+    
+    # ------------------------------------------------------------------
+    # Synchronous API
+    # ------------------------------------------------------------------
+    
+    def register(self, username, email, password):
+        """Register a new user."""
+        return self._run(self._register_call(username, email, password))
+    
+    def login(self, username, password):
+        """Login user."""
+        return self._run(self._login_call(username, password))
+    
+    def submit_score(self, score_value, level=1):
+        """Submit score to backend."""
+        return self._run(self._submit_score_call(score_value, level))
+    
+    def get_leaderboard(self, limit=10):
+        """Get leaderboard."""
+        return self._run(self._get_leaderboard_call(limit))
     
     def get_user_rank(self):
         """Get current user's rank."""
-        if not self.auth_token:
-            return False
-        
-        try:
-            headers = {"Authorization": f"Bearer {self.auth_token}"}
-            response = requests.get(
-                f"{self.base_url}/scores/my-rank",
-                headers=headers,
-                timeout=5
-            )
-            if response.status_code == 200:
-                data = response.json()
-                self.user_rank = data
-                return True
-            return False
-        except Exception as e:
-            print(f"Error fetching rank: {e}")
-            return False
+        return self._run(self._get_user_rank_call())
     
     def get_profile(self):
         """Get current user profile."""
-        if not self.auth_token:
-            return False
-        
-        try:
-            headers = {"Authorization": f"Bearer {self.auth_token}"}
-            response = requests.get(
-                f"{self.base_url}/auth/me",
-                headers=headers,
-                timeout=5
-            )
-            if response.status_code == 200:
-                data = response.json()
-                self.user_info = data.get("user")
-                return True
-            return False
-        except Exception as e:
-            print(f"Error fetching profile: {e}")
-            return False
+        return self._run(self._get_profile_call())
     
     def logout(self):
         """Logout current user."""
@@ -151,6 +441,7 @@ class APIClient:
         self.user_rank = None
         self.score_submitted = False
         self.last_submitted_score = 0
+        self.cache.clear()
 
 
 class HeartPuzzleAPI:
@@ -160,13 +451,20 @@ class HeartPuzzleAPI:
         self.api_url = api_url
         self.time_limit = time_limit
     
-    def fetch_puzzle(self):
-        """Fetch a new heart puzzle from the API."""
+    def fetch_puzzle(self, timeout=8, retries=None):
+        """Fetch a new heart puzzle from the API.
+        
+        timeout and retries apply to each of the two requests (retries
+        defaults to the shared session's policy). The image is returned in
+        its file format: this runs on worker threads, and HeartPuzzle
+        converts it for the display on the main thread.
+        """
         try:
-            resp = requests.get(self.api_url, timeout=8).json()
+            session = get_session()
+            resp = session.get(self.api_url, timeout=timeout, retries=retries).json()
             answer = str(resp["solution"])
             img_url = resp["question"]
-            img_data = requests.get(img_url, timeout=8).content
+            img_data = session.get(img_url, timeout=timeout, retries=retries).content
             
             heart_image = pygame.image.load(io.BytesIO(img_data))
             heart_image = pygame.transform.scale(heart_image, (400, 400))
@@ -175,4 +473,3 @@ class HeartPuzzleAPI:
         except Exception as e:
             print(f"Error loading heart puzzle: {e}")
             return False, None, None
-
@@ -0,0 +1,225 @@
+"""Pre-decoded asset bundle, memory-mapped at startup.
+
+    python -m game.asset_bundle [--output PATH]
+
+builds the bundle ahead of time (e.g. when installing a kiosk); the game
+also rebuilds it by itself whenever an image changed.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+import time
+
+import pygame
+
+from .config import IMAGE_PATHS, ASSET_BUNDLE_PATH, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# File layout: magic, version (u16), index length (u32), JSON index, then
+# each surface's pixels in BGRA order (the 32-bit display format with
+# alpha), page-aligned so processes share them through the page cache.
+MAGIC = b"FBAB"
+VERSION = 1
+_HEADER = struct.Struct("<4sHI")
+_ALIGN = mmap.PAGESIZE
+_DISPLAY_MASKS = (0xFF0000, 0xFF00, 0xFF)  # XRGB/ARGB8888, the usual display format
+
+# ScreenRenderer's full-screen backgrounds; only their scaled copies are kept
+SCALED_BACKGROUNDS = ('cover', 'home', 'heartbg', 'dp')
+
+
+def source_files(paths=IMAGE_PATHS):
+    """Every image file the bundle is built from."""
+    files = []
+    for name, path in paths.items():
+        if name == 'bird':
+            files.extend(path.format(number) for number in range(1, 4))
+        else:
+            files.append(path)
+    return files
+
+
+def _stamp(files):
+    stamps = {}
+    for path in files:
+        stat = os.stat(path)
+        stamps[path] = [stat.st_mtime_ns, stat.st_size]
+    return stamps
+
+
+def _to_json_key(key):
+    return list(key) if isinstance(key, tuple) else key
+
+
+def _from_json_key(key):
+    if isinstance(key, list):
+        return tuple(_from_json_key(part) for part in key)
+    return key
+
+
+def _bundled_surfaces(paths, decoded=()):
+    """(key, surface) for every surface the game asks the registry for.
+
+    Surfaces stay in their file format (no display conversion), so this
+    is safe on any thread.
+    """
+    from .assets import AssetRegistry
+    from .sprites import BIRD_ANGLES
+
+    registry = AssetRegistry(paths, convert=False)
+    for key, future in decoded:
+        registry.add_pending(key, future)
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    for name in paths:
+        if name != 'bird' and name not in SCALED_BACKGROUNDS:
+            registry.image(name)
+    for name in SCALED_BACKGROUNDS:
+        registry.scaled(name, size)
+    registry.pipe_image(flipped=True)
+    registry.prerender_bird_rotations(BIRD_ANGLES)
+    return [(key, surface) for key, surface in registry.items()
+            if key not in SCALED_BACKGROUNDS]
+
+
+def build_bundle(path=ASSET_BUNDLE_PATH, paths=IMAGE_PATHS, decoded=()):
+    """Decode, scale and rotate every image once and write the bundle.
+
+    decoded holds (registry key, Future) pairs of surfaces an AssetLoader
+    already decoded; those are used instead of decoding again.
+    """
+    files = source_files(paths)
+    stamps = _stamp(files)
+    entries = []
+    blobs = []
+    offset = 0
+    for key, surface in _bundled_surfaces(paths, decoded):
+        width, height = surface.get_size()
+        pixels = pygame.image.tobytes(surface, "BGRA")
+        entries.append({
+            "key": _to_json_key(key),
+            "size": [width, height],
+            "alpha": bool(surface.get_flags() & pygame.SRCALPHA),
+            "offset": offset,
+        })
+        blobs.append(pixels)
+        offset += -(-len(pixels) // _ALIGN) * _ALIGN
+    index = json.dumps({
+        "screen": [SCREEN_WIDTH, SCREEN_HEIGHT],
+        "sources": stamps,
+        "entries": entries,
+    }).encode("utf-8")
+    data_start = -(-(_HEADER.size + len(index)) // _ALIGN) * _ALIGN
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    # Write beside the target and rename, so running games keep their
+    # mapping of the old file
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, len(index)))
+        f.write(index)
+        for entry, pixels in zip(entries, blobs):
+            f.seek(data_start + entry["offset"])
+            f.write(pixels)
+        f.truncate(data_start + offset)
+    os.replace(tmp_path, path)
+    return len(entries)
+
+
+class AssetBundle:
+    """A memory-mapped bundle; surfaces wrap its pages without decoding.
+
+    The file is mapped copy-on-write, so unmodified pages are shared by
+    every game process on the host and a stray write to a surface only
+    touches this process's copy.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        if len(self._map) < _HEADER.size:
+            raise ValueError("truncated asset bundle")
+        magic, version, index_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not an asset bundle of this version")
+        index = json.loads(self._map[_HEADER.size:_HEADER.size + index_length])
+        self.screen = tuple(index["screen"])
+        self.sources = index["sources"]
+        self._data_start = -(-(_HEADER.size + index_length) // _ALIGN) * _ALIGN
+        self._entries = {_from_json_key(entry["key"]): entry for entry in index["entries"]}
+
+    def is_stale(self, paths=IMAGE_PATHS):
+        """True if an image changed since the build, or the screen size did."""
+        if self.screen != (SCREEN_WIDTH, SCREEN_HEIGHT):
+            return True
+        files = source_files(paths)
+        if sorted(files) != sorted(self.sources):
+            return True
+        try:
+            return _stamp(files) != self.sources
+        except OSError:
+            return True
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def keys(self):
+        return self._entries.keys()
+
+    def surface(self, key):
+        """A surface viewing the bundled pixels of key, or None.
+
+        Alpha surfaces already have the display's per-pixel-alpha format.
+        Opaque ones come back with an alpha channel of 255; the registry
+        converts those to the opaque display format, which blits faster.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        width, height = entry["size"]
+        start = self._data_start + entry["offset"]
+        pixels = memoryview(self._map)[start:start + width * height * 4]
+        return pygame.image.frombuffer(pixels, (width, height), "BGRA")
+
+    def is_opaque(self, key):
+        return not self._entries[key]["alpha"]
+
+
+def display_matches():
+    """Whether bundled BGRA pixels are the display's own 32-bit format."""
+    display = pygame.display.get_surface()
+    return display is not None and display.get_bitsize() == 32 and \
+        tuple(display.get_masks()[:3]) == _DISPLAY_MASKS
+
+
+def open_bundle(path=ASSET_BUNDLE_PATH, paths=IMAGE_PATHS, build=True):
+    """Map the bundle at path, (re)building it first if missing or stale.
+
+    With build=False, returns None instead of building.
+    """
+    bundle = None
+    try:
+        bundle = AssetBundle(path)
+    except (OSError, ValueError):
+        pass
+    if bundle is None or bundle.is_stale(paths):
+        if not build:
+            return None
+        build_bundle(path, paths)
+        bundle = AssetBundle(path)
+    return bundle
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the pre-decoded asset bundle.")
+    parser.add_argument("--output", default=ASSET_BUNDLE_PATH, help="bundle file to write")
+    args = parser.parse_args(argv)
+    start = time.perf_counter()
+    count = build_bundle(args.output)
+    print(f"{count} surfaces, {os.path.getsize(args.output) / 2**20:.1f} MiB "
+          f"in {time.perf_counter() - start:.2f}s: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+"""Decoding startup images on worker threads, most urgent first."""
+import os
+from concurrent.futures import ThreadPoolExecutor, CancelledError, wait, FIRST_COMPLETED
+import pygame
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT
+from .asset_bundle import build_bundle
+
+# Priorities, in decode order
+LOGIN = 0     # the first screen
+GAMEPLAY = 1  # sprites the game engine is built with
+DEFERRED = 2  # other menu and lifeline backgrounds, only needed later
+
+
+def _decode(path):
+    return pygame.image.load(path)
+
+
+def _decode_scaled(path, size):
+    return pygame.transform.scale(pygame.image.load(path), size)
+
+
+def startup_jobs(paths):
+    """(priority, registry key, function, args) for every startup image.
+
+    Keys are the ones AssetRegistry caches the surfaces under, so the
+    screens pick the results up through the usual ASSETS calls.
+    """
+    size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+    jobs = [(LOGIN, ('cover', 'scaled', size), _decode_scaled, (paths['cover'], size))]
+    for name in ('bg', 'ground', 'pipe', 'restart'):
+        jobs.append((GAMEPLAY, name, _decode, (paths[name],)))
+    for number in range(1, 4):
+        jobs.append((GAMEPLAY, ('bird', number), _decode, (paths['bird'].format(number),)))
+    for name in ('home', 'dp', 'heartbg'):
+        jobs.append((DEFERRED, (name, 'scaled', size), _decode_scaled, (paths[name], size)))
+    return jobs
+
+
+class AssetLoader:
+    """Decodes and scales images in a thread pool for an AssetRegistry.
+
+    pygame releases the GIL while decoding and scaling, so the main thread
+    keeps drawing a progress screen meanwhile. Jobs are queued by
+    priority; the registry hands out a result as soon as it is asked for
+    its key, waiting for that job alone if it is still running.
+
+    Converting to the display format stays on the main thread (the
+    registry does it on first access).
+    """
+
+    def __init__(self, registry, threads):
+        self.registry = registry
+        # More threads than cores would only interleave jobs and let less
+        # urgent ones slow down the urgent ones
+        threads = max(1, min(threads, os.cpu_count() or 1))
+        self._executor = ThreadPoolExecutor(max_workers=threads, thread_name_prefix="assets")
+        self._jobs = []  # (priority, future)
+        self._decoded = []  # (registry key, future)
+
+    def start(self, jobs):
+        """Queue jobs (see startup_jobs) in priority order."""
+        for priority, key, function, args in sorted(jobs, key=lambda job: job[0]):
+            future = self._executor.submit(function, *args)
+            self.registry.add_pending(key, future)
+            self._jobs.append((priority, future))
+            self._decoded.append((key, future))
+
+    def build_bundle_after(self, path, paths):
+        """Write the asset bundle once the queued jobs are picked up.
+
+        The bundle is built from the jobs' results (flipped and rotated
+        copies are derived from them) without converting anything to the
+        display format. The next launch then maps it instead of decoding.
+        """
+        self._executor.submit(self._build_bundle, path, paths, list(self._decoded))
+
+    @staticmethod
+    def _build_bundle(path, paths, decoded):
+        try:
+            build_bundle(path, paths, decoded)
+        except (OSError, pygame.error, CancelledError) as e:
+            print(f"Could not write asset bundle ({e}); images are decoded next launch too")
+
+    def _futures(self, priority):
+        return [future for job_priority, future in self._jobs if job_priority <= priority]
+
+    def progress(self, priority=DEFERRED):
+        """(finished, total) jobs of priority and more urgent ones."""
+        futures = self._futures(priority)
+        return sum(future.done() for future in futures), len(futures)
+
+    def ready(self, priority=DEFERRED):
+        finished, total = self.progress(priority)
+        return finished == total
+
+    def wait(self, priority=DEFERRED, timeout=None):
+        """Block until one more job up to priority finishes, or timeout."""
+        pending = [future for future in self._futures(priority) if not future.done()]
+        if pending:
+            wait(pending, timeout, return_when=FIRST_COMPLETED)
+
+    def close(self):
+        """Drop jobs nobody asked for yet and let running ones finish.
+
+        Call before pygame.quit(), which must not happen under a worker.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self.registry.drop_pending()
@@ -0,0 +1,162 @@
+"""Process-wide image asset registry."""
+import pygame
+from .config import IMAGE_PATHS, ASSET_BUNDLE_PATH
+from .asset_bundle import open_bundle, display_matches
+
+
+class AssetRegistry:
+    """Decodes every image once and hands out shared surfaces.
+
+    Surfaces are converted to the display format as soon as a display
+    exists, so images requested before ``set_mode`` are upgraded on the
+    next access instead of staying in their file format.
+
+    With an asset bundle loaded (``load_bundle``), bundled surfaces are
+    served from its memory map instead of being decoded. Those with
+    alpha are already in the display format and keep viewing the mapped
+    pages; opaque ones are copied once into the opaque display format.
+
+    Without a bundle, an AssetLoader can decode images on worker threads
+    ahead of time (``add_pending``); asking for one of those keys waits
+    for its job instead of decoding again.
+
+    With convert=False surfaces keep their file format; that is how the
+    bundle is built off the main thread, where the display must not be
+    touched.
+    """
+
+    def __init__(self, paths, convert=True):
+        self.paths = paths
+        self.convert = convert
+        self._surfaces = {}
+        self._converted = set()
+        self.bundle = None
+        self._bundled = set()
+        self._pending = {}  # key -> Future of a decoded surface
+        self.load_count = 0
+
+    def load_bundle(self, path=ASSET_BUNDLE_PATH, build=True):
+        """Serve surfaces from the bundle at path, rebuilding it if stale.
+
+        With build=False a missing or stale bundle is left alone and None
+        returned.
+        """
+        try:
+            self.bundle = open_bundle(path, self.paths, build)
+        except (OSError, ValueError, pygame.error) as e:
+            print(f"asset bundle unavailable ({e}); decoding images")
+            self.bundle = None
+        return self.bundle
+
+    def _convert(self, key):
+        """Convert a cached surface to the display format once possible."""
+        if not self.convert or key in self._converted or pygame.display.get_surface() is None:
+            return
+        surface = self._surfaces[key]
+        if key in self._bundled:
+            if self.bundle.is_opaque(key):
+                surface = surface.convert()
+            elif not display_matches():
+                surface = surface.convert_alpha()
+        elif surface.get_flags() & pygame.SRCALPHA:
+            surface = surface.convert_alpha()
+        else:
+            surface = surface.convert()
+        self._surfaces[key] = surface
+        self._converted.add(key)
+
+    def _get(self, key, factory):
+        """Return the cached surface for key, building it on first use."""
+        if key not in self._surfaces:
+            surface = self.bundle.surface(key) if self.bundle is not None else None
+            pending = self._pending.pop(key, None)
+            if surface is not None:
+                self._bundled.add(key)
+            elif pending is not None:
+                surface = pending.result()
+            else:
+                surface = factory()
+            self._surfaces[key] = surface
+        self._convert(key)
+        return self._surfaces[key]
+
+    def items(self):
+        """Iterate over (key, surface) for every surface built so far."""
+        return iter(list(self._surfaces.items()))
+
+    def add_pending(self, key, future):
+        """Take the surface for key from future when it is first needed."""
+        self._pending[key] = future
+
+    def drop_pending(self):
+        """Forget cancelled jobs; their keys are decoded on demand again."""
+        for key, future in list(self._pending.items()):
+            if future.cancelled():
+                del self._pending[key]
+
+    def _load(self, path):
+        self.load_count += 1
+        return pygame.image.load(path)
+
+    def image(self, name):
+        """Get the surface for an entry of IMAGE_PATHS."""
+        return self._get(name, lambda: self._load(self.paths[name]))
+
+    def scaled(self, name, size):
+        """Get an image scaled to size (e.g. full-screen backgrounds)."""
+        return self._get(
+            (name, 'scaled', size),
+            lambda: pygame.transform.scale(self.image(name), size)
+        )
+
+    def flipped(self, name, flip_x=False, flip_y=True):
+        """Get a mirrored copy of an image."""
+        return self._get(
+            (name, 'flipped', flip_x, flip_y),
+            lambda: pygame.transform.flip(self.image(name), flip_x, flip_y)
+        )
+
+    def _bird_source(self, number):
+        return self._get(('bird', number), lambda: self._load(self.paths['bird'].format(number)))
+
+    def bird_frames(self):
+        """Get the three bird animation frames."""
+        return [self._bird_source(i) for i in range(1, 4)]
+
+    def bird_frame(self, index, angle=0):
+        """Get bird frame index (0-2) rotated by angle degrees.
+
+        Angles are quantized to whole degrees so the handful of
+        (frame, angle) combinations the physics produces are each rotated
+        only once.
+        """
+        angle = int(round(angle))
+        if angle == 0:
+            return self._bird_source(index + 1)
+        return self._get(
+            ('bird', index + 1, 'rotated', angle),
+            lambda: pygame.transform.rotate(self._bird_source(index + 1), angle)
+        )
+
+    def prerender_bird_rotations(self, angles):
+        """Fill the rotation cache for every frame ahead of time."""
+        for index in range(3):
+            for angle in angles:
+                self.bird_frame(index, angle)
+
+    def pipe_image(self, flipped=False):
+        """Get the pipe surface, upside down for the top pipe."""
+        if flipped:
+            return self.flipped('pipe')
+        return self.image('pipe')
+
+    def clear(self):
+        """Drop every cached surface (e.g. after the display is recreated)."""
+        self._surfaces.clear()
+        self._converted.clear()
+        self._bundled.clear()
+        self._pending.clear()
+
+
+# Shared registry used by sprites and screens
+ASSETS = AssetRegistry(IMAGE_PATHS)
@@ -0,0 +1,147 @@
+"""Vectorized simulation of many independent games at once (needs NumPy)."""
+from .config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SCROLL_SPEED, PIPE_GAP, PIPE_FREQUENCY_TICKS,
+    GROUND_HEIGHT, GRAVITY, MAX_FALL_SPEED, FLAP_VELOCITY,
+    BIRD_WIDTH, BIRD_HEIGHT, BIRD_START_X, PIPE_WIDTH, PIPE_HEIGHT
+)
+from .simulation import PIPE_OFFSET_RANGE, MAX_PIPES, _MASK64
+
+try:
+    import numpy as np
+except ImportError:  # optional; only batch workloads need it
+    np = None
+
+
+def pipe_offsets(seeds, index):
+    """pipe_offset(seed, index) for an array of uint64 seeds."""
+    step = np.uint64(((index + 1) * 0x9E3779B97F4A7C15) & _MASK64)
+    with np.errstate(over='ignore'):
+        z = seeds + step
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    z ^= z >> np.uint64(31)
+    return (z % np.uint64(2 * PIPE_OFFSET_RANGE + 1)).astype(np.int64) - PIPE_OFFSET_RANGE
+
+
+class BatchSimulation:
+    """N games stepped together, one NumPy operation per rule.
+
+    Every game starts like a fresh Simulation that is already flying and
+    follows the same rules tick for tick: bird physics, tick-based pipe
+    spawning and scrolling, scoring and the check_collisions AABB
+    tests. A game stops at the tick it collides; its bird, score and
+    death tick are frozen from then on, as when GameEngine ends a run.
+
+    Games only differ in their seeds and flap inputs. Pipes spawn on the
+    same ticks in every game, so pipe x positions are one shared ring of
+    MAX_PIPES slots and only the gap centers (games x slots) are per game.
+    Bird animation and rotation are cosmetic and not simulated, so pipes
+    are always hit-tested by rectangle (Simulation without a collider).
+    """
+
+    def __init__(self, seeds):
+        if np is None:
+            raise ImportError("BatchSimulation requires numpy (pip install numpy)")
+        self.seeds = np.asarray(seeds, dtype=np.uint64)
+        n = len(self.seeds)
+        self.tick = 0
+
+        # Per game
+        self.bird_y = np.full(n, SCREEN_HEIGHT // 2 - BIRD_HEIGHT // 2, dtype=np.float64)
+        self.vel = np.zeros(n, dtype=np.float64)
+        self.score = np.zeros(n, dtype=np.int64)
+        self.pass_pipe = np.zeros(n, dtype=bool)
+        self.alive = np.ones(n, dtype=bool)
+        self.death_tick = np.full(n, -1, dtype=np.int64)
+        self.gap_y = np.zeros((n, MAX_PIPES), dtype=np.int64)
+
+        # Shared by all games
+        self.bird_x = BIRD_START_X - BIRD_WIDTH // 2
+        self.pipe_x = np.zeros(MAX_PIPES, dtype=np.int64)
+        self.first_pipe = 0  # index of the oldest pipe still on screen
+        self.pipes_spawned = 0
+        self.last_pipe_tick = -PIPE_FREQUENCY_TICKS - 1
+
+    def __len__(self):
+        return len(self.seeds)
+
+    def _slots(self):
+        return [index % MAX_PIPES for index in range(self.first_pipe, self.pipes_spawned)]
+
+    def next_gap(self):
+        """Gap centers of the first pipe not yet behind the bird, or None."""
+        for slot in self._slots():
+            if self.pipe_x[slot] + PIPE_WIDTH >= self.bird_x:
+                return self.gap_y[:, slot]
+        return None
+
+    def step(self, flap=None):
+        """Advance every live game one tick; flap is a bool array (or None).
+
+        Returns the mask of games that collided on this tick.
+        """
+        self.tick += 1
+        alive = self.alive
+
+        # Bird physics (frozen games keep their state)
+        vel = np.minimum(self.vel + GRAVITY, MAX_FALL_SPEED)
+        moving = alive & (self.bird_y + BIRD_HEIGHT < GROUND_HEIGHT)
+        target = self.bird_y + vel
+        rounded = np.where(target >= 0, np.floor(target + 0.5), -np.floor(-target + 0.5))
+        self.bird_y = np.where(moving, rounded, self.bird_y)
+        if flap is not None:
+            vel = np.where(flap, FLAP_VELOCITY, vel)
+        self.vel = np.where(alive, vel, self.vel)
+
+        # Spawn and scroll the shared pipes
+        if self.tick - self.last_pipe_tick > PIPE_FREQUENCY_TICKS:
+            slot = self.pipes_spawned % MAX_PIPES
+            self.gap_y[:, slot] = SCREEN_HEIGHT // 2 + pipe_offsets(self.seeds, self.pipes_spawned)
+            self.pipe_x[slot] = SCREEN_WIDTH
+            self.pipes_spawned += 1
+            self.last_pipe_tick = self.tick
+        self.pipe_x -= SCROLL_SPEED
+        while self.first_pipe < self.pipes_spawned and \
+                self.pipe_x[self.first_pipe % MAX_PIPES] + PIPE_WIDTH < 0:
+            self.first_pipe += 1
+
+        # Score against the oldest pipe on screen
+        if self.first_pipe < self.pipes_spawned:
+            pipe_left = int(self.pipe_x[self.first_pipe % MAX_PIPES])
+            pipe_right = pipe_left + PIPE_WIDTH
+            if self.bird_x > pipe_left and self.bird_x + BIRD_WIDTH < pipe_right:
+                self.pass_pipe |= alive
+            if self.bird_x > pipe_right:
+                passed = alive & self.pass_pipe
+                self.score += passed
+                self.pass_pipe &= ~passed
+
+        hit = alive & self.collided()
+        self.alive = alive & ~hit
+        self.death_tick[hit] = self.tick
+        return hit
+
+    def collided(self):
+        """Per-game pipe, ceiling and ground collisions (check_collisions)."""
+        top = self.bird_y
+        bottom = top + BIRD_HEIGHT
+        hit = (top < 0) | (bottom >= GROUND_HEIGHT)
+        left = self.bird_x
+        right = left + BIRD_WIDTH
+        for slot in self._slots():
+            x = self.pipe_x[slot]
+            if left < x + PIPE_WIDTH and right > x:
+                top_pipe_bottom = self.gap_y[:, slot] - PIPE_GAP // 2
+                bottom_pipe_top = self.gap_y[:, slot] + PIPE_GAP // 2
+                hit |= (top < top_pipe_bottom) & (bottom > top_pipe_bottom - PIPE_HEIGHT)
+                hit |= (bottom > bottom_pipe_top) & (top < bottom_pipe_top + PIPE_HEIGHT)
+        return hit
+
+    def run(self, policy, max_ticks):
+        """Step until every game has collided or max_ticks have passed.
+
+        policy(batch) returns the flap array for the coming tick.
+        """
+        while self.alive.any() and self.tick < max_ticks:
+            self.step(policy(self))
+        return self.score
@@ -0,0 +1,65 @@
+"""Pixel-perfect pipe collisions for the simulation."""
+import pygame
+from .config import PIPE_GAP, PIPE_HEIGHT, PIPE_WIDTH
+from .assets import ASSETS
+from .sprites import BIRD_ANGLES
+
+
+class MaskCollider:
+    """Narrow-phase pipe test on the bird's and pipes' alpha masks.
+
+    Masks are built once: one per bird animation frame and tilt (the
+    surfaces the engine actually draws, anchored at the bird's top-left)
+    and one per pipe orientation. Simulation keeps pipes as ordered pairs,
+    so only pairs overlapping the bird's x-range reach the narrow phase,
+    and within a pair only the pipe the bird reaches vertically. Ceiling
+    and ground checks stay rectangle-based in Simulation.collided.
+    """
+
+    def __init__(self, angles=BIRD_ANGLES):
+        self._bird = {}
+        for index in range(len(ASSETS.bird_frames())):
+            for angle in angles:
+                self._bird_mask(index, angle)
+        self.bottom_pipe = pygame.mask.from_surface(ASSETS.pipe_image())
+        self.top_pipe = pygame.mask.from_surface(ASSETS.pipe_image(flipped=True))
+
+    def _bird_mask(self, index, angle):
+        key = (index, round(angle))
+        mask = self._bird.get(key)
+        if mask is None:
+            mask = self._bird[key] = pygame.mask.from_surface(ASSETS.bird_frame(index, angle))
+        return mask
+
+    def hits_pipe(self, sim):
+        """True if any opaque bird pixel overlaps an opaque pipe pixel."""
+        bird = self._bird_mask(sim.frame_index, sim.angle)
+        width, height = bird.get_size()
+        left = sim.bird_x
+        right = left + width
+        top = sim.bird_y
+        bottom = top + height
+        for pipe in sim.pipes:
+            x = pipe.x
+            if x >= right:
+                break  # pairs are ordered by x; the rest are further right
+            if x + PIPE_WIDTH <= left:
+                continue
+            gap_top = pipe.gap_y - PIPE_GAP // 2
+            gap_bottom = pipe.gap_y + PIPE_GAP // 2
+            if top < gap_top and self.top_pipe.overlap(bird, (left - x, top - (gap_top - PIPE_HEIGHT))):
+                return True
+            if bottom > gap_bottom and self.bottom_pipe.overlap(bird, (left - x, top - gap_bottom)):
+                return True
+        return False
+
+
+_shared = None
+
+
+def get_mask_collider():
+    """Shared MaskCollider (its masks are immutable)."""
+    global _shared
+    if _shared is None:
+        _shared = MaskCollider()
+    return _shared
@@ -0,0 +1,76 @@
+"""Layered compositing of the game scene."""
+import pygame
+from .config import SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_HEIGHT
+
+
+class SceneCompositor:
+    """Draws the scene from layers prepared once for a (bg, ground) pair.
+
+    - sky: the part of the background above the ground (all of it if the
+      ground has transparent pixels), copied into the display format.
+    - ground: the ground image tiled into a strip at least twice the
+      screen width. Each frame shows a window of it at the scroll offset,
+      taken modulo the image width, so any offset (including the
+      interpolated ones just past the wrap) is seamless.
+    - sprites: blitted between the two in the same ``Surface.blits`` call.
+
+    A ground image without transparent pixels is kept in the opaque
+    display format, which blits much faster than per-pixel alpha.
+    """
+
+    def __init__(self, bg_img, ground_img):
+        self.bg_img = bg_img
+        self.ground_img = ground_img
+        self.ground = self._build_ground(ground_img)
+        self.sky = self._build_sky(bg_img, GROUND_HEIGHT if self.opaque_ground else SCREEN_HEIGHT)
+        self.tile_width = ground_img.get_width()
+        self._ground_area = pygame.Rect(0, 0, SCREEN_WIDTH, ground_img.get_height())
+
+    @staticmethod
+    def _display_copy(size, opaque):
+        surface = pygame.Surface(size, 0 if opaque else pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert() if opaque else surface.convert_alpha()
+        return surface
+
+    def _build_sky(self, bg_img, height):
+        sky = self._display_copy((SCREEN_WIDTH, height), True)
+        sky.blit(bg_img, (0, 0))
+        return sky
+
+    def _build_ground(self, ground_img):
+        width, height = ground_img.get_size()
+        self.opaque_ground = pygame.mask.from_surface(ground_img, 254).count() == width * height
+        # Two screens wide and at least two tiles: a full screen from any offset
+        tiles = max(2, -(-2 * SCREEN_WIDTH // width))
+        strip = self._display_copy((width * tiles, height), self.opaque_ground)
+        strip.blits([(ground_img, (x, 0)) for x in range(0, strip.get_width(), width)], False)
+        return strip
+
+    def uses(self, bg_img, ground_img):
+        return bg_img is self.bg_img and ground_img is self.ground_img
+
+    def draw(self, screen, sprites, ground_x, overlays=()):
+        """Draw sky, sprites, ground and overlays; return the screen rects
+        of the sprites followed by those of the overlays.
+
+        sprites and overlays are sequences of (surface, position) drawn in
+        order, below and above the ground; ground_x is where the ground
+        image's left edge would be.
+        """
+        area = self._ground_area
+        area.x = -ground_x % self.tile_width
+        rects = screen.blits([(self.sky, (0, 0)), *sprites, (self.ground, (0, GROUND_HEIGHT), area), *overlays])
+        ground = len(sprites) + 1
+        return rects[1:ground] + rects[ground + 1:]
+
+
+_shared = None
+
+
+def get_scene_compositor(bg_img, ground_img):
+    """Shared SceneCompositor, rebuilt when the images change."""
+    global _shared
+    if _shared is None or not _shared.uses(bg_img, ground_img):
+        _shared = SceneCompositor(bg_img, ground_img)
+    return _shared
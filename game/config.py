@@ -1,19 +1,24 @@
 """Configuration constants and settings for the Flappy Bird game."""
-import pygame
-import os
+# Underscored so `from .config import *` exports only the settings
+import os as _os
+from .fonts import FontRegistry as _FontRegistry
 
 # Screen settings
 # Slightly smaller default window so it fits on more displays
 SCREEN_WIDTH = 720
 SCREEN_HEIGHT = 840
-FPS = 60
+FPS = 60  # simulation ticks per second
 
-# Initialize pygame fonts
-pygame.font.init()
-FONT = pygame.font.SysFont('Bauhaus 93', 60)
-SMALL_FONT = pygame.font.SysFont('Arial', 32)
-LARGE_FONT = pygame.font.SysFont('Arial', 72)
-TINY_FONT = pygame.font.SysFont('Arial', 20)
+# Rendering runs independently of the simulation (see FlappyBirdGame.run)
+RENDER_FPS = 120  # frame cap for the "tick" and "busy" pacing modes
+FRAME_PACING = "tick"  # "tick" (sleep), "busy" (tick_busy_loop) or "vsync"
+MAX_FRAME_TIME = 0.25  # seconds; longer stalls are not caught up
+MAX_STEPS_PER_FRAME = 5  # spiral-of-death guard
+# Menu screens only render on input, cursor blinks and backend results
+IDLE_MENUS = True
+IDLE_MAX_WAIT = 1.0  # seconds an idle menu may sleep
+CURSOR_BLINK = 0.5  # seconds the text cursor stays on, then off
+API_POLL_INTERVAL = 0.05  # seconds between redraws while a request is in flight
 
 # Colors
 WHITE = (255, 255, 255)
@@ -26,10 +31,43 @@ GRAY = (128, 128, 128)
 # Backend API Configuration
 API_BASE_URL = "http://localhost:3000/api"
 
+# Local data (offline score journal, caches); override with FLAPPY_DATA_DIR
+DATA_DIR = _os.environ.get("FLAPPY_DATA_DIR") or _os.path.join(_os.path.expanduser("~"), ".flappy_bird")
+SCORE_JOURNAL_PATH = _os.path.join(DATA_DIR, "pending_scores.jsonl")
+REPLAY_DIR = _os.path.join(DATA_DIR, "replays")
+PROFILE_DIR = _os.path.join(DATA_DIR, "profiles")
+FONT_CACHE_PATH = _os.path.join(DATA_DIR, "font_paths.json")
+ASSET_BUNDLE_PATH = _os.path.join(DATA_DIR, "assets.bundle")  # see game.asset_bundle
+# Without a bundle, images are decoded on this many threads behind a progress
+# screen while the bundle is written; 0 builds the bundle first instead
+ASSET_LOADER_THREADS = 4
+
+# Fonts are built on first use; system font lookups are cached on disk
+FONTS = _FontRegistry(FONT_CACHE_PATH)
+FONT = FONTS.font('Bauhaus 93', 60)
+SMALL_FONT = FONTS.font('Arial', 32)
+LARGE_FONT = FONTS.font('Arial', 72)
+TINY_FONT = FONTS.font('Arial', 20)
+
 # Game settings
 SCROLL_SPEED = 4
 PIPE_GAP = 150
 PIPE_FREQUENCY = 1500
+# Bird physics (per tick)
+GRAVITY = 0.5
+MAX_FALL_SPEED = 8
+FLAP_VELOCITY = -10
+# Sprite sizes (match img/bird*.png and img/pipe.png); the simulation core
+# uses them without loading any images
+BIRD_WIDTH = 51
+BIRD_HEIGHT = 36
+BIRD_START_X = 100
+PIPE_WIDTH = 78
+PIPE_HEIGHT = 560
+# Pipe hits: "mask" (opaque pixels only, game.collision) or "rect"
+COLLISION_MODE = "mask"
+# Simulation runs in ticks of 1/FPS seconds
+PIPE_FREQUENCY_TICKS = PIPE_FREQUENCY * FPS // 1000
 # Ground sprite is 168px tall; keep it anchored to the bottom of the screen
 GROUND_IMAGE_HEIGHT = 168
 GROUND_HEIGHT = SCREEN_HEIGHT - GROUND_IMAGE_HEIGHT
@@ -37,21 +75,22 @@ GROUND_HEIGHT = SCREEN_HEIGHT - GROUND_IMAGE_HEIGHT
 # Heart puzzle settings
 HEART_TIME_LIMIT = 30  # seconds
 HEART_PUZZLE_API_URL = "https://marcconrad.com/uob/heart/api.php"
+HEART_PUZZLE_POOL_SIZE = 3  # puzzles fetched ahead of time
 
 # Image paths - using relative paths from the game module directory
-_GAME_DIR = os.path.dirname(os.path.abspath(__file__))
-_PARENT_DIR = os.path.dirname(_GAME_DIR)
-_IMG_DIR = os.path.join(_PARENT_DIR, 'img')
+_GAME_DIR = _os.path.dirname(_os.path.abspath(__file__))
+_PARENT_DIR = _os.path.dirname(_GAME_DIR)
+_IMG_DIR = _os.path.join(_PARENT_DIR, 'img')
 
 IMAGE_PATHS = {
-    'bg': os.path.join(_IMG_DIR, "bg.png"),
-    'home': os.path.join(_IMG_DIR, "home.png"),
-    'heartbg': os.path.join(_IMG_DIR, "heartbg.png"),
-    'dp': os.path.join(_IMG_DIR, "dp.png"),
-    'cover': os.path.join(_IMG_DIR, "cover.png"),
-    'ground': os.path.join(_IMG_DIR, "ground.png"),
-    'restart': os.path.join(_IMG_DIR, "restart.png"),
-    'pipe': os.path.join(_IMG_DIR, "pipe.png"),
-    'bird': os.path.join(_IMG_DIR, "bird{}.png")  # Format with number 1-3
+    'bg': _os.path.join(_IMG_DIR, "bg.png"),
+    'home': _os.path.join(_IMG_DIR, "home.png"),
+    'heartbg': _os.path.join(_IMG_DIR, "heartbg.png"),
+    'dp': _os.path.join(_IMG_DIR, "dp.png"),
+    'cover': _os.path.join(_IMG_DIR, "cover.png"),
+    'ground': _os.path.join(_IMG_DIR, "ground.png"),
+    'restart': _os.path.join(_IMG_DIR, "restart.png"),
+    'pipe': _os.path.join(_IMG_DIR, "pipe.png"),
+    'bird': _os.path.join(_IMG_DIR, "bird{}.png")  # Format with number 1-3
 }
 
@@ -0,0 +1,96 @@
+"""Dirty-rectangle display updates."""
+import pygame
+
+# Push the whole frame once changed regions cover this share of the screen
+FULL_UPDATE_RATIO = 0.5
+
+
+class DirtyRectRenderer:
+    """Collects changed screen regions and pushes only those to the display.
+
+    Each frame, drawing code marks the rects it touched. ``present`` updates
+    those rects together with the previous frame's, so content that moved
+    or disappeared is cleared as well. When the changed area gets too large
+    (or mark_all was called, e.g. on a screen switch) it falls back to a
+    full ``pygame.display.update()``.
+    """
+
+    def __init__(self, size, full_update_ratio=FULL_UPDATE_RATIO):
+        self.screen_rect = pygame.Rect((0, 0), size)
+        self.full_update_ratio = full_update_ratio
+        self._rects = []
+        self._previous = []
+        self._full = True
+        # Statistics
+        self.last_pixels = 0
+        self.total_pixels = 0
+        self.frames = 0
+        self.full_updates = 0
+
+    def mark(self, rect):
+        """Mark a region as changed this frame."""
+        if rect is None:
+            return
+        rect = self.screen_rect.clip(rect)
+        if rect.width and rect.height:
+            self._rects.append(rect)
+
+    def mark_many(self, rects):
+        """Mark several regions as changed this frame."""
+        for rect in rects:
+            self.mark(rect)
+
+    def mark_all(self):
+        """Force the next present() to push the whole frame."""
+        self._full = True
+
+    @staticmethod
+    def _merge(rects):
+        """Merge overlapping rects when their bounding box is no larger
+        than the two areas combined, so overlaps are not pushed twice
+        without growing an L-shaped pair into a large box."""
+        merged = []
+        for rect in rects:
+            rect = rect.copy()
+            changed = True
+            while changed:
+                changed = False
+                for index, other in enumerate(merged):
+                    if not rect.colliderect(other):
+                        continue
+                    union = rect.union(other)
+                    if union.width * union.height <= rect.width * rect.height + other.width * other.height:
+                        rect = union
+                        del merged[index]
+                        changed = True
+                        break
+            merged.append(rect)
+        return merged
+
+    def present(self):
+        """Push this frame's changes to the display and start a new frame."""
+        rects = self._merge(self._rects + self._previous)
+        pixels = sum(rect.width * rect.height for rect in rects)
+        screen_pixels = self.screen_rect.width * self.screen_rect.height
+
+        if self._full or pixels > screen_pixels * self.full_update_ratio:
+            pygame.display.update()
+            pixels = screen_pixels
+            self.full_updates += 1
+        elif rects:
+            pygame.display.update(rects)
+
+        self._previous = self._rects
+        self._rects = []
+        self._full = False
+        self.last_pixels = pixels
+        self.total_pixels += pixels
+        self.frames += 1
+        return pixels
+
+    def reset_stats(self):
+        """Zero the pixel counters."""
+        self.last_pixels = 0
+        self.total_pixels = 0
+        self.frames = 0
+        self.full_updates = 0
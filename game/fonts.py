@@ -0,0 +1,114 @@
+"""Lazily built fonts with a persistent system-font lookup cache."""
+import json
+import os
+import pygame
+
+
+class LazyFont:
+    """Stands in for a pygame Font and builds it on first use.
+
+    Attribute access (render, size, get_linesize, ...) is forwarded to the
+    real font, so screens can hold these from import time on.
+    """
+
+    __slots__ = ("registry", "family", "size", "_font")
+
+    def __init__(self, registry, family, size):
+        self.registry = registry
+        self.family = family
+        self.size = size
+        self._font = None
+
+    @property
+    def font(self):
+        """The underlying pygame Font, built now if need be."""
+        font = self._font
+        if font is None:
+            font = self._font = self.registry.build(self.family, self.size)
+        return font
+
+    @property
+    def loaded(self):
+        return self._font is not None
+
+    def __getattr__(self, name):
+        return getattr(self.font, name)
+
+    def __repr__(self):
+        state = "loaded" if self._font is not None else "lazy"
+        return f"LazyFont({self.family!r}, {self.size}, {state})"
+
+
+class FontRegistry:
+    """Hands out LazyFonts and remembers where system fonts live.
+
+    Resolving a family name the way SysFont does scans the system font
+    list (fc-list on Linux), which used to happen four times at import.
+    Resolved files are kept in a JSON cache at cache_path, so later
+    launches open them directly; a family that is not installed is cached
+    as pygame's default font. Entries whose file has disappeared are
+    resolved again. Delete the cache to pick up newly installed fonts.
+    """
+
+    def __init__(self, cache_path):
+        self.cache_path = cache_path
+        self._paths = None  # normalized family -> font file, or None for the default font
+        self._fonts = {}
+        self.build_count = 0
+        self.lookup_count = 0
+
+    @staticmethod
+    def _key(family):
+        return family.lower().replace(" ", "")
+
+    def font(self, family, size):
+        """Get the (shared) LazyFont for family at size."""
+        key = (self._key(family), size)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = LazyFont(self, family, size)
+        return font
+
+    def _load_cache(self):
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                paths = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return paths if isinstance(paths, dict) else {}
+
+    def _save_cache(self):
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            tmp_path = self.cache_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._paths, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # only a cache; the next launch scans again
+
+    def path(self, family):
+        """Font file for family, or None for pygame's default font."""
+        if self._paths is None:
+            self._paths = self._load_cache()
+        key = self._key(family)
+        if key in self._paths:
+            path = self._paths[key]
+            if path is None or os.path.exists(path):
+                return path
+        self.lookup_count += 1
+        path = pygame.font.match_font(family)
+        self._paths[key] = path
+        self._save_cache()
+        return path
+
+    def build(self, family, size):
+        """Create the pygame Font for family at size (what SysFont returns)."""
+        if not pygame.font.get_init():
+            pygame.font.init()
+        self.build_count += 1
+        return pygame.font.Font(self.path(family), size)
+
+    def loaded_fonts(self):
+        """LazyFonts that have been built so far."""
+        return [font for font in self._fonts.values() if font.loaded]
@@ -2,114 +2,180 @@
 import pygame
 import random
 from .config import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, SCROLL_SPEED, PIPE_FREQUENCY,
-    PIPE_GAP, GROUND_HEIGHT, FONT, WHITE
+    SCREEN_WIDTH, SCREEN_HEIGHT, GROUND_HEIGHT, SCROLL_SPEED, FONT, WHITE,
+    PIPE_GAP, PIPE_HEIGHT, COLLISION_MODE
 )
-from .sprites import Bird, Pipe
+from .assets import ASSETS
+from .sprites import Bird
+from .simulation import Simulation
+from .collision import get_mask_collider
+from .replay import ReplayRecorder, FINAL_EVENTS
+from .text import TEXT
+from .compositor import get_scene_compositor
 
 
 class GameEngine:
-    """Manages core game logic and mechanics."""
+    """Drives the simulation core with player input and renders it.
     
-    def __init__(self, game_state):
+    Physics, pipes, scoring and collisions live in Simulation; the engine
+    feeds it the flap key, mirrors score/pass_pipe/ground_scroll into
+    GameState and draws the result. Every run is recorded as a Replay;
+    once a final lifeline event ends it, take_replay() hands it out.
+    
+    The engine may be stepped zero or several times per rendered frame.
+    Flaps are queued from KEYDOWN events and consumed one per step, and
+    draw() interpolates between the last two steps.
+    """
+    
+    def __init__(self, game_state, seed=None):
         self.game_state = game_state
-        self.pipe_group = pygame.sprite.Group()
+        collider = get_mask_collider() if COLLISION_MODE == "mask" else None
+        self.sim = Simulation(self._new_seed() if seed is None else seed, collider)
         self.bird_group = pygame.sprite.Group()
         self.bird = None
-        self.last_pipe_time = pygame.time.get_ticks() - PIPE_FREQUENCY
+        self._queued_flaps = 0
+        # Bird y before the last step and whether that step scrolled
+        self._prev_bird_y = self.sim.bird_y
+        self._scrolled = False
+        self.recorder = ReplayRecorder(self.sim)
+        self._replay = None
         self._initialize_bird()
     
+    @staticmethod
+    def _new_seed():
+        """Pick the pipe seed for a new run."""
+        return random.getrandbits(64)
+    
     def _initialize_bird(self):
         """Initialize the bird sprite."""
         self.bird = Bird(100, SCREEN_HEIGHT // 2)
         self.bird_group.add(self.bird)
+        self._sync_bird()
+    
+    def _sync_bird(self):
+        """Copy the simulated bird onto the sprite used for drawing."""
+        sim = self.sim
+        self.bird.rect.topleft = (sim.bird_x, sim.bird_y)
+        self.bird.vel = sim.vel
+        self.bird.index = sim.frame_index
+        self.bird.image = ASSETS.bird_frame(sim.frame_index, sim.angle)
+    
+    def _snap(self):
+        """Drop interpolation after a teleport (reset, checkpoint)."""
+        self._prev_bird_y = self.sim.bird_y
+        self._scrolled = False
     
     def reset_game(self):
         """Reset game to initial state."""
-        self.pipe_group.empty()
-        if self.bird:
-            self.bird.rect.x = 100
-            self.bird.rect.y = SCREEN_HEIGHT // 2
-        self.last_pipe_time = pygame.time.get_ticks() - PIPE_FREQUENCY
+        self.sim.reset(self._new_seed())
+        self.recorder = ReplayRecorder(self.sim)
+        self._replay = None
         self.game_state.pass_pipe = False
+        self._queued_flaps = 0
+        self._snap()
+        self._sync_bird()
+    
+    def attach(self, sim):
+        """Render an externally driven simulation (replay playback)."""
+        if sim is not self.sim:
+            self.sim = sim
+            self._snap()
+        self._sync_bird()
     
     def checkpoint_reset(self):
         """Reset pipes and bird position for continuing the game (score remains)."""
-        self.pipe_group.empty()
-        if self.bird:
-            self.bird.rect.x = 100
-            self.bird.rect.y = SCREEN_HEIGHT // 2
+        self.sim.checkpoint_reset()
+        self._snap()
+        self._sync_bird()
+    
+    def queue_flap(self):
+        """Queue a flap key press for the next simulation step."""
+        self._queued_flaps += 1
+    
+    def _flap_input(self):
+        """Take one queued flap; presses while not flying are dropped."""
+        if not self.game_state.flying or self.game_state.game_over:
+            self._queued_flaps = 0
+            return False
+        if not self._queued_flaps:
+            return False
+        self._queued_flaps -= 1
+        return True
     
     def update(self):
         """Update game state."""
         if not self.bird:
             return
         
-        # Update bird
-        self.bird_group.update(
-            self.game_state.flying,
-            self.game_state.game_over,
-            self.game_state.countdown_active
-        )
+        game_state = self.game_state
+        sim = self.sim
+        sim.flying = game_state.flying
+        sim.game_over = game_state.game_over
+        sim.score = game_state.score
+        sim.pass_pipe = game_state.pass_pipe
+        sim.ground_scroll = game_state.ground_scroll
         
-        # Generate pipes
-        if self.game_state.flying and not self.game_state.game_over:
-            time_now = pygame.time.get_ticks()
-            if time_now - self.last_pipe_time > PIPE_FREQUENCY:
-                height = random.randint(-100, 100)
-                self.pipe_group.add(Pipe(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + height, -1))
-                self.pipe_group.add(Pipe(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + height, 1))
-                self.last_pipe_time = time_now
-            
-            self.pipe_group.update()
-            
-            # Scroll ground
-            self.game_state.ground_scroll -= SCROLL_SPEED
-            if abs(self.game_state.ground_scroll) > 35:
-                self.game_state.ground_scroll = 0
+        flap = self._flap_input()
+        if flap:
+            self.recorder.flap(sim.tick)
+        self._prev_bird_y = sim.bird_y
+        self._scrolled = sim.flying and not sim.game_over
+        sim.step(flap)
         
-        # Score logic
-        if len(self.pipe_group) > 0:
-            pipe = self.pipe_group.sprites()[0]
-            
-            if (self.bird.rect.left > pipe.rect.left and 
-                self.bird.rect.right < pipe.rect.right and 
-                not self.game_state.pass_pipe):
-                self.game_state.pass_pipe = True
-            
-            if self.game_state.pass_pipe and self.bird.rect.left > pipe.rect.right:
-                self.game_state.score += 1
-                self.game_state.pass_pipe = False
+        game_state.score = sim.score
+        game_state.pass_pipe = sim.pass_pipe
+        game_state.ground_scroll = sim.ground_scroll
+        self._sync_bird()
+    
+    def record_event(self, kind):
+        """Record a lifeline event (see game.replay) at the current tick."""
+        self.recorder.event(self.sim.tick, kind)
+        if kind in FINAL_EVENTS and not self.recorder.finished:
+            self._replay = self.recorder.finish(self.sim.tick, self.game_state.score)
+    
+    def take_replay(self):
+        """Return the finished Replay of this run once, else None."""
+        replay, self._replay = self._replay, None
+        return replay
     
     def check_collisions(self):
         """Check for collisions and return True if collision detected."""
         if not self.bird:
             return False
+        return self.sim.collided()
+    
+    def draw(self, screen, bg_img, ground_img, alpha=1.0):
+        """Draw game elements and return the screen rects that changed.
+        
+        alpha (0..1) is how far the frame lies between the previous and
+        the current simulation step. Sky, pipes, bird and ground go out in
+        one batch through the SceneCompositor.
+        """
+        # Everything that scrolls was SCROLL_SPEED further right one step ago
+        lag = round((1 - alpha) * SCROLL_SPEED) if self._scrolled else 0
         
-        # Check pipe collisions or top boundary
-        if (pygame.sprite.groupcollide(self.bird_group, self.pipe_group, False, False) or 
-            self.bird.rect.top < 0):
-            return True
+        pipe_img = ASSETS.pipe_image()
+        top_pipe_img = ASSETS.pipe_image(flipped=True)
+        sprites = []
+        for pipe in self.sim.pipes:
+            x = pipe.x + lag
+            sprites.append((top_pipe_img, (x, pipe.gap_y - PIPE_GAP // 2 - PIPE_HEIGHT)))
+            sprites.append((pipe_img, (x, pipe.gap_y + PIPE_GAP // 2)))
         
-        # Check ground collision
-        if self.bird.rect.bottom >= GROUND_HEIGHT:
-            return True
+        prev_y = self._prev_bird_y
+        self.bird.rect.y = round(prev_y + (self.sim.bird_y - prev_y) * alpha)
+        sprites.append((self.bird.image, self.bird.rect.topleft))
         
-        return False
-    
-    def draw(self, screen, bg_img, ground_img):
-        """Draw game elements."""
-        screen.blit(bg_img, (0, 0))
-        self.pipe_group.draw(screen)
-        self.bird_group.draw(screen)
-        screen.blit(ground_img, (self.game_state.ground_scroll, GROUND_HEIGHT))
+        compositor = get_scene_compositor(bg_img, ground_img)
+        rects = compositor.draw(screen, sprites, self.game_state.ground_scroll + lag)
+        # Pipe pixels below GROUND_HEIGHT are covered by the ground strip
+        sky = pygame.Rect(0, 0, SCREEN_WIDTH, GROUND_HEIGHT)
+        changed = [rect.clip(sky) for rect in rects[:-1]]
+        changed.append(rects[-1])
         
         # Draw score
-        draw_text(screen, str(self.game_state.score), FONT, WHITE, SCREEN_WIDTH // 2, 20)
-
-
-def draw_text(screen, text, font, col, x, y):
-    """Helper function to draw text."""
-    img = font.render(text, True, col)
-    screen.blit(img, (x, y))
-
+        score_rect = TEXT.draw_number(screen, self.game_state.score, FONT, WHITE, SCREEN_WIDTH // 2, 20)
+        
+        changed.append(pygame.Rect(0, GROUND_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT))
+        changed.append(score_rect)
+        return changed
@@ -27,6 +27,7 @@ class GameState:
         self.last_pipe = 0
         self.score = 0
         self.pass_pipe = False
+        self.score_queued = False
         
         # Heart puzzle state
         self.heart_active = False
@@ -63,6 +64,7 @@ class GameState:
         self.game_over = False
         self.score = 0
         self.pass_pipe = False
+        self.score_queued = False
         self.heart_lifeline_used = False
         self.game_over_screen_timer = 0
         self.puzzle_solved = False
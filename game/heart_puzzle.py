@@ -1,38 +1,183 @@
 """Heart puzzle lifeline logic."""
+import queue
+import threading
 import time
+from collections import deque
 import pygame
-from .config import HEART_TIME_LIMIT
+from .config import HEART_TIME_LIMIT, HEART_PUZZLE_POOL_SIZE
+
+# Pause between fetch attempts while the puzzle API is failing (seconds)
+PREFETCH_RETRY_DELAY = 5.0
+
+# Per-request timeout of the one-shot fetch when no prefetcher is running
+# (seconds). It runs on the main thread, mid-run, so it is short and not retried.
+FALLBACK_FETCH_TIMEOUT = 1.5
+
+# Longest wait on the puzzle screen for a fetch still in flight (seconds)
+PUZZLE_WAIT_LIMIT = 10.0
+
+
+class PuzzlePrefetcher:
+    """Keeps a small pool of ready-to-show puzzles filled in the background.
+    
+    A daemon thread calls ``puzzle_api.fetch_puzzle`` (download, decode,
+    scale) until the pool holds ``pool_size`` puzzles, then blocks until
+    one is taken. ``failing`` tells whether its last fetch failed.
+    """
+    
+    def __init__(self, puzzle_api, pool_size=HEART_PUZZLE_POOL_SIZE):
+        self.puzzle_api = puzzle_api
+        self._pool = queue.Queue(maxsize=pool_size)
+        self._stopped = None  # Stop event of the running fetch thread
+        self.failing = False
+    
+    def start(self):
+        """Start filling the pool (no-op if already running)."""
+        if self._stopped is None:
+            self._stopped = threading.Event()
+            threading.Thread(
+                target=self._run, args=(self._stopped,), name="puzzle-prefetch", daemon=True
+            ).start()
+    
+    def stop(self):
+        """Stop the fetch thread once its current request finishes."""
+        if self._stopped is not None:
+            self._stopped.set()
+            self._stopped = None
+    
+    @property
+    def running(self):
+        return self._stopped is not None
+    
+    def ready(self):
+        """Number of puzzles waiting in the pool."""
+        return self._pool.qsize()
+    
+    def take(self):
+        """Pop a ready (image, answer) pair, or None if the pool is empty."""
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            return None
+    
+    def _run(self, stopped):
+        while not stopped.is_set():
+            success, image, answer = self.puzzle_api.fetch_puzzle()
+            self.failing = not success
+            if not success:
+                stopped.wait(PREFETCH_RETRY_DELAY)
+                continue
+            while not stopped.is_set():
+                try:
+                    self._pool.put((image, answer), timeout=0.5)
+                    break
+                except queue.Full:
+                    continue
 
 
 class HeartPuzzle:
-    """Manages heart puzzle lifeline state and logic."""
+    """Manages heart puzzle lifeline state and logic.
     
-    def __init__(self, puzzle_api):
+    If the prefetch pool is empty while a fetch is in flight, activate()
+    opens the puzzle screen in the waiting state; update() picks the
+    puzzle up once it arrives, and the time limit starts then.
+    """
+    
+    def __init__(self, puzzle_api, prefetcher=None):
         self.puzzle_api = puzzle_api
+        self.prefetcher = prefetcher
         self.active = False
+        self.waiting = False
+        self._requested = 0  # perf_counter of the activation being served
         self.image = None
         self.answer = None
         self.input = ""
         self.start_time = 0
         self.solved = False
         self.time_limit = HEART_TIME_LIMIT
+        
+        # Metrics: pool hits/misses and seconds from collision to puzzle
+        self.pool_hits = 0
+        self.pool_misses = 0
+        self.time_to_puzzle = deque(maxlen=100)
+    
+    def prepare(self):
+        """Start prefetching puzzles (call when a run begins)."""
+        if self.prefetcher:
+            self.prefetcher.start()
+    
+    def hit_rate(self):
+        """Share of activations served from the prefetch pool."""
+        total = self.pool_hits + self.pool_misses
+        return self.pool_hits / total if total else 0.0
     
     def activate(self):
-        """Activate the heart puzzle lifeline."""
-        success, image, answer = self.puzzle_api.fetch_puzzle()
-        if success:
+        """Activate the heart puzzle lifeline; False if no puzzle can come."""
+        self._requested = time.perf_counter()
+        puzzle = self.prefetcher.take() if self.prefetcher else None
+        if puzzle is not None:
+            self.pool_hits += 1
+            self._show(*puzzle)
+            return True
+        self.pool_misses += 1
+        if self.prefetcher and self.prefetcher.running:
+            if self.prefetcher.failing:
+                return False  # the API is down; nothing is on its way
+            # A fetch is in flight: wait for it without blocking the frame
             self.active = True
-            self.image = image
-            self.answer = answer
+            self.waiting = True
+            self.image = None
+            self.answer = None
             self.input = ""
-            self.start_time = time.time()
             self.solved = False
             return True
+        # No prefetcher: one short request, without retries
+        success, image, answer = self.puzzle_api.fetch_puzzle(
+            timeout=FALLBACK_FETCH_TIMEOUT, retries=0
+        )
+        if success:
+            self._show(image, answer)
+            return True
         return False
     
+    def update(self):
+        """Pick up an awaited puzzle; call once per frame while active.
+        
+        Returns False (and deactivates) if the puzzle isn't coming: its
+        fetch failed or PUZZLE_WAIT_LIMIT passed.
+        """
+        if not self.waiting:
+            return True
+        puzzle = self.prefetcher.take() if self.prefetcher else None
+        if puzzle is not None:
+            self._show(*puzzle)
+            return True
+        if (self.prefetcher is None or self.prefetcher.failing or
+                time.perf_counter() - self._requested > PUZZLE_WAIT_LIMIT):
+            self.deactivate()
+            return False
+        return True
+    
+    def _show(self, image, answer):
+        # Fetches run on worker threads; only the main thread touches the display
+        if pygame.display.get_surface() is not None:
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+        self.time_to_puzzle.append(time.perf_counter() - self._requested)
+        self.active = True
+        self.waiting = False
+        self.image = image
+        self.answer = answer
+        self.input = ""
+        self.start_time = time.time()
+        self.solved = False
+    
     def deactivate(self):
         """Deactivate the heart puzzle."""
         self.active = False
+        self.waiting = False
         self.image = None
         self.answer = None
         self.input = ""
@@ -42,6 +187,8 @@ class HeartPuzzle:
         """Get remaining time in seconds."""
         if not self.active:
             return 0
+        if self.waiting:
+            return self.time_limit
         elapsed = int(time.time() - self.start_time)
         remaining = self.time_limit - elapsed
         return max(0, remaining)
@@ -60,7 +207,7 @@ class HeartPuzzle:
     
     def handle_input(self, event):
         """Handle keyboard input for the puzzle."""
-        if not self.active:
+        if not self.active or self.waiting:
             return False
         
         if event.type == pygame.KEYDOWN:
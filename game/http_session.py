@@ -0,0 +1,171 @@
+"""Shared HTTP session with connection pooling, retries and a circuit breaker."""
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Connection pool sizing (pools are kept per host)
+POOL_CONNECTIONS = 4
+POOL_MAXSIZE = 8
+
+# Retry policy: attempts after the first, with jittered exponential backoff
+RETRIES = 2
+BACKOFF_BASE = 0.2  # seconds
+BACKOFF_MAX = 2.0  # seconds
+RETRY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# Circuit breaker: open after this many consecutive failures, probe again later
+FAILURE_THRESHOLD = 3
+RESET_TIMEOUT = 15.0  # seconds
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+class CircuitBreaker:
+    """Tracks consecutive failures for one host.
+
+    Closed: requests flow. Open: requests fail immediately until
+    reset_timeout has passed. After that a single probe request is let
+    through (half-open). Its outcome closes or re-opens the circuit.
+    """
+
+    def __init__(self, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self):
+        return self.opened_at is not None
+
+    def allow(self):
+        """Check whether a request may be sent now."""
+        with self._lock:
+            if self.opened_at is None:
+                return True
+            if self._probing or time.monotonic() - self.opened_at < self.reset_timeout:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class HTTPSession:
+    """Keep-alive session shared by every API client.
+
+    Requests reuse pooled connections and negotiate gzip. Idempotent
+    methods are retried on connection errors and 5xx responses. Each host
+    has a circuit breaker, so a dead backend fails fast instead of costing
+    a full timeout per call.
+    """
+
+    def __init__(self, retries=RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX,
+                 retry_methods=RETRY_METHODS, pool_connections=POOL_CONNECTIONS,
+                 pool_maxsize=POOL_MAXSIZE, failure_threshold=FAILURE_THRESHOLD,
+                 reset_timeout=RESET_TIMEOUT):
+        self.retries = retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_methods = retry_methods
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+        self.session = requests.Session()
+        self.session.headers["Accept-Encoding"] = "gzip, deflate"
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def breaker(self, url):
+        """Get the circuit breaker for the host of url."""
+        host = urlsplit(url).netloc
+        with self._lock:
+            breaker = self._breakers.get(host)
+            if breaker is None:
+                breaker = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+                self._breakers[host] = breaker
+            return breaker
+
+    def _backoff(self, attempt):
+        """Full-jitter exponential backoff delay for a retry attempt."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method, url, retries=None, **kwargs):
+        """Send a request; raises requests exceptions like requests.request.
+
+        retries overrides the session's retry count for this call.
+        """
+        method = method.upper()
+        breaker = self.breaker(url)
+        if retries is None:
+            retries = self.retries
+        attempts = 1 + (retries if method in self.retry_methods else 0)
+
+        for attempt in range(attempts):
+            if not breaker.allow():
+                raise CircuitOpenError(f"Circuit open for {urlsplit(url).netloc}")
+            last_attempt = attempt == attempts - 1
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                breaker.record_failure()
+                if last_attempt:
+                    raise
+            except Exception:
+                # Not worth retrying (bad encoding, redirect loop, ...), but
+                # it must still end a half-open probe
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code < 500:
+                    breaker.record_success()
+                    return response
+                breaker.record_failure()
+                if last_attempt:
+                    return response
+                response.close()
+            time.sleep(self._backoff(attempt))
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Get the process-wide HTTPSession, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = HTTPSession()
+        return _session
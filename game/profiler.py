@@ -0,0 +1,254 @@
+"""Per-phase frame timing with an on-screen overlay and trace export."""
+import csv
+import json
+import os
+import time
+from array import array
+
+import pygame
+
+from .config import TINY_FONT, WHITE
+from .text import TEXT, TextRenderer
+
+PROFILE_SAMPLES = 600  # per phase; 10 s of frames at 60 FPS
+OVERLAY_REFRESH = 0.5  # seconds between overlay redraws
+OVERLAY_BG = (0, 0, 0, 180)
+OVERLAY_LABEL_WIDTH = 250
+OVERLAY_COLUMN_WIDTH = 60
+OVERLAY_TEXT_BYTES = 256 * 1024  # private cache for the overlay's changing numbers
+
+
+class RingBuffer:
+    """Fixed-size ring of (start, duration) samples in seconds."""
+
+    __slots__ = ("size", "count", "starts", "durations")
+
+    def __init__(self, size):
+        self.size = size
+        self.count = 0
+        self.starts = array("d", bytes(8 * size))
+        self.durations = array("d", bytes(8 * size))
+
+    def add(self, start, duration):
+        index = self.count % self.size
+        self.starts[index] = start
+        self.durations[index] = duration
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    def samples(self):
+        """(start, duration) pairs, oldest first."""
+        n = len(self)
+        first = self.count - n
+        return [(self.starts[i % self.size], self.durations[i % self.size])
+                for i in range(first, self.count)]
+
+    def summary(self):
+        """(count, p50, p95, p99, max) of the retained durations, in ms."""
+        n = len(self)
+        if not n:
+            return 0, 0.0, 0.0, 0.0, 0.0
+        ordered = sorted(self.durations[:n])
+
+        def pct(p):
+            return ordered[min(n - 1, int(p * n))] * 1000
+
+        return n, pct(0.50), pct(0.95), pct(0.99), ordered[-1] * 1000
+
+
+class Profiler:
+    """Times named phases of the frame into per-phase ring buffers.
+
+    Phases are methods registered with ``watch``. Only while the profiler
+    is enabled are they replaced with timing wrappers on their instances;
+    disabling restores the originals, so a disabled profiler adds no work
+    to the watched calls. ``end_frame`` records the whole frame.
+    """
+
+    def __init__(self, size=PROFILE_SAMPLES):
+        self.size = size
+        self.enabled = False
+        self.rings = {}
+        self._watched = []  # (obj, attribute, label)
+        self._origin = time.perf_counter()
+        self._frame_start = None
+
+    def watch(self, obj, attribute, label=None):
+        """Time obj.attribute(...) as phase label while enabled."""
+        entry = (obj, attribute, label or attribute)
+        self._watched.append(entry)
+        if self.enabled:
+            self._install(*entry)
+
+    def _ring(self, label):
+        ring = self.rings.get(label)
+        if ring is None:
+            ring = self.rings[label] = RingBuffer(self.size)
+        return ring
+
+    def _install(self, obj, attribute, label):
+        func = getattr(obj, attribute)
+        ring = self._ring(label)
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                ring.add(start, clock() - start)
+
+        timed.__wrapped__ = func
+        setattr(obj, attribute, timed)
+
+    @staticmethod
+    def _uninstall(obj, attribute):
+        timed = getattr(obj, attribute)
+        if attribute in vars(obj) and hasattr(timed, "__wrapped__"):
+            delattr(obj, attribute)
+            if getattr(obj, attribute, None) != timed.__wrapped__:
+                setattr(obj, attribute, timed.__wrapped__)
+
+    def enable(self):
+        if not self.enabled:
+            self.enabled = True
+            self._frame_start = None
+            for entry in self._watched:
+                self._install(*entry)
+
+    def disable(self):
+        if self.enabled:
+            self.enabled = False
+            for obj, attribute, _ in self._watched:
+                self._uninstall(obj, attribute)
+
+    def toggle(self):
+        if self.enabled:
+            self.disable()
+        else:
+            self.enable()
+        return self.enabled
+
+    def record(self, label, start, duration):
+        """Add a sample measured by the caller (perf_counter seconds)."""
+        self._ring(label).add(start, duration)
+
+    def end_frame(self):
+        """Mark a frame boundary; frame time is measured between calls."""
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._ring("frame").add(self._frame_start, now - self._frame_start)
+        self._frame_start = now
+
+    def reset(self):
+        self.rings = {}
+        self._frame_start = None
+        if self.enabled:
+            # Re-bind the wrappers to the new rings
+            self.disable()
+            self.enable()
+
+    def summary(self):
+        """{label: (count, p50, p95, p99, max)} with durations in ms."""
+        return {label: ring.summary() for label, ring in self.rings.items()}
+
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+
+    def export_csv(self, path):
+        """Write every retained sample as phase,start_ms,duration_ms."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["phase", "start_ms", "duration_ms"])
+            for label, ring in self.rings.items():
+                for start, duration in ring.samples():
+                    writer.writerow([label, f"{(start - self._origin) * 1000:.3f}",
+                                     f"{duration * 1000:.3f}"])
+
+    def export_chrome_trace(self, path):
+        """Write Chrome trace-event JSON (chrome://tracing, Perfetto)."""
+        events = []
+        for label, ring in self.rings.items():
+            tid = 0 if label == "frame" else 1
+            for start, duration in ring.samples():
+                events.append({"name": label, "ph": "X", "pid": 1, "tid": tid,
+                               "ts": round((start - self._origin) * 1e6, 1),
+                               "dur": round(duration * 1e6, 1)})
+        events.sort(key=lambda event: event["ts"])
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+class StartupTimer:
+    """Wall-clock time between named startup milestones."""
+
+    def __init__(self, start=None):
+        self.start = time.perf_counter() if start is None else start
+        self._last = self.start
+        self.phases = []  # (label, seconds since the previous mark)
+
+    def mark(self, label, now=None):
+        """Close the phase that ends now under label."""
+        now = time.perf_counter() if now is None else now
+        self.phases.append((label, now - self._last))
+        self._last = now
+
+    def total(self):
+        return self._last - self.start
+
+    def report(self):
+        """The phases as an aligned text table, in ms."""
+        lines = [f"{'startup phase':<28} {'ms':>8}"]
+        for label, seconds in self.phases:
+            lines.append(f"{label:<28} {seconds * 1000:>8.1f}")
+        lines.append(f"{'total':<28} {self.total() * 1000:>8.1f}")
+        return "\n".join(lines)
+
+
+class ProfilerOverlay:
+    """Table of phase percentiles drawn in the top-right corner.
+
+    Phase labels and headings go through the shared TEXT cache; the
+    numbers change on every refresh, so they use a small cache of their
+    own instead of evicting the screens' text.
+    """
+
+    def __init__(self, profiler, font=TINY_FONT):
+        self.profiler = profiler
+        self.font = font
+        self._numbers = TextRenderer(OVERLAY_TEXT_BYTES)
+        self._surface = None
+        self._built_at = 0
+
+    def _build(self):
+        rows = [("phase", "p50", "p95", "p99", "max")]
+        for label, (count, p50, p95, p99, worst) in sorted(self.profiler.summary().items()):
+            if count:
+                rows.append((label,) + tuple(f"{value:.2f}" for value in (p50, p95, p99, worst)))
+        line_height = self.font.get_linesize()
+        width = OVERLAY_LABEL_WIDTH + OVERLAY_COLUMN_WIDTH * 4 + 12
+        surface = pygame.Surface((width, line_height * len(rows) + 8), pygame.SRCALPHA)
+        surface.fill(OVERLAY_BG)
+        for i, row in enumerate(rows):
+            y = 4 + i * line_height
+            TEXT.draw(surface, row[0], self.font, WHITE, 6, y)
+            cells = TEXT if i == 0 else self._numbers
+            for j, cell in enumerate(row[1:]):
+                text = cells.render(self.font, cell, WHITE)
+                right = 6 + OVERLAY_LABEL_WIDTH + OVERLAY_COLUMN_WIDTH * (j + 1)
+                surface.blit(text, (right - text.get_width(), y))
+        return surface
+
+    def draw(self, screen):
+        """Blit the overlay; returns the rect it covers."""
+        now = time.perf_counter()
+        if self._surface is None or now - self._built_at >= OVERLAY_REFRESH:
+            self._surface = self._build()
+            self._built_at = now
+        x = screen.get_width() - self._surface.get_width() - 10
+        return screen.blit(self._surface, (x, 10))
@@ -0,0 +1,361 @@
+"""Deterministic run recording and playback in a compact binary format."""
+import os
+import struct
+import zlib
+from collections import deque
+
+from .simulation import Simulation
+
+# File layout (all integers unsigned LEB128 varints unless noted):
+#   magic b"FBRP", version (u8), flags (u8), payload length, payload,
+#   CRC-32 of the payload (u32 little-endian)
+# Payload:
+#   seed (u64 little-endian), claimed score, end tick,
+#   start bird x, y and 2*velocity (zigzag signed),
+#   flap run count, then (gap, repeat) pairs: `repeat + 1` flaps spaced
+#   `gap` ticks apart, the first gap counted from tick 0,
+#   event count, then (tick delta, kind) pairs.
+# The length prefix makes records self-delimiting, so replays can be
+# concatenated into one stream.
+MAGIC = b"FBRP"
+VERSION = 1
+_HEADER = struct.Struct("<4sBB")
+_SEED = struct.Struct("<Q")
+_CRC = struct.Struct("<I")
+MAX_REPLAY_BYTES = 1 << 20
+
+# Header flags
+FLAG_MASK_COLLISION = 1  # pipes were hit-tested on alpha masks (game.collision)
+KNOWN_FLAGS = FLAG_MASK_COLLISION
+
+# Lifeline events
+START = 1  # space pressed; the bird starts flying
+HEART_SOLVED = 2  # collision, heart puzzle answered correctly
+HEART_FAILED = 3  # collision, wrong answer or time up
+HEART_UNAVAILABLE = 4  # collision, no puzzle could be fetched
+COUNTDOWN_END = 5  # the post-puzzle countdown finished; flying again
+EVENT_NAMES = {
+    START: "start",
+    HEART_SOLVED: "heart_solved",
+    HEART_FAILED: "heart_failed",
+    HEART_UNAVAILABLE: "heart_unavailable",
+    COUNTDOWN_END: "countdown_end",
+}
+# Events that end the run
+FINAL_EVENTS = (HEART_FAILED, HEART_UNAVAILABLE)
+
+
+class ReplayError(ValueError):
+    """Raised for malformed or unsupported replay data."""
+
+
+def _write_varint(out, value):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data, pos):
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise ReplayError("truncated varint")
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def _zigzag(value):
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value):
+    return value >> 1 if not value & 1 else -((value + 1) >> 1)
+
+
+class Replay:
+    """One recorded run: seed, start state, flap ticks and lifeline events.
+
+    Ticks are Simulation ticks counted from the start of the run. A flap
+    at tick t is the input of the step that moves the simulation from t
+    to t + 1; an event at tick t is applied when the simulation is at t.
+    """
+
+    def __init__(self, seed, score=0, end_tick=0, start=(0, 0, 0), flaps=(), events=(), flags=0):
+        self.seed = seed
+        self.score = score
+        self.end_tick = end_tick
+        self.start = tuple(start)  # bird x, y, velocity
+        self.flaps = list(flaps)
+        self.events = list(events)  # (tick, kind)
+        self.flags = flags
+
+    def __eq__(self, other):
+        return isinstance(other, Replay) and self.__dict__ == other.__dict__
+
+    def __repr__(self):
+        return (f"Replay(seed={self.seed:#x}, score={self.score}, end_tick={self.end_tick}, "
+                f"flaps={len(self.flaps)}, events={len(self.events)})")
+
+    # ------------------------------------------------------------------
+    # Encoding
+    # ------------------------------------------------------------------
+
+    def encode(self):
+        """Serialize to the versioned binary format."""
+        payload = bytearray(_SEED.pack(self.seed))
+        _write_varint(payload, self.score)
+        _write_varint(payload, self.end_tick)
+        x, y, vel = self.start
+        for value in (x, y, int(vel * 2)):
+            _write_varint(payload, _zigzag(value))
+
+        # Run-length encode the gaps between flaps
+        runs = []
+        previous = 0
+        for tick in self.flaps:
+            gap = tick - previous
+            previous = tick
+            if runs and runs[-1][0] == gap:
+                runs[-1][1] += 1
+            else:
+                runs.append([gap, 0])
+        _write_varint(payload, len(runs))
+        for gap, repeat in runs:
+            _write_varint(payload, gap)
+            _write_varint(payload, repeat)
+
+        _write_varint(payload, len(self.events))
+        previous = 0
+        for tick, kind in self.events:
+            _write_varint(payload, tick - previous)
+            payload.append(kind)
+            previous = tick
+
+        out = bytearray(_HEADER.pack(MAGIC, VERSION, self.flags))
+        _write_varint(out, len(payload))
+        out += payload
+        out += _CRC.pack(zlib.crc32(payload))
+        return bytes(out)
+
+    @classmethod
+    def decode(cls, data):
+        """Parse one replay; data must hold exactly one record."""
+        replay, end = cls._decode_from(data, 0)
+        if end != len(data):
+            raise ReplayError("trailing data after replay")
+        return replay
+
+    @classmethod
+    def _decode_from(cls, data, pos):
+        if len(data) - pos < _HEADER.size:
+            raise ReplayError("truncated header")
+        magic, version, flags = _HEADER.unpack_from(data, pos)
+        if magic != MAGIC:
+            raise ReplayError("not a replay file")
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        if flags & ~KNOWN_FLAGS:
+            raise ReplayError(f"unsupported replay flags {flags:#x}")
+        length, pos = _read_varint(data, pos + _HEADER.size)
+        end = pos + length
+        if end + _CRC.size > len(data):
+            raise ReplayError("truncated payload")
+        payload = bytes(data[pos:end])
+        if _CRC.unpack_from(data, end)[0] != zlib.crc32(payload):
+            raise ReplayError("checksum mismatch")
+        return cls._parse_payload(payload, flags), end + _CRC.size
+
+    @classmethod
+    def _parse_payload(cls, payload, flags):
+        if len(payload) < _SEED.size:
+            raise ReplayError("truncated payload")
+        seed = _SEED.unpack_from(payload)[0]
+        pos = _SEED.size
+        score, pos = _read_varint(payload, pos)
+        end_tick, pos = _read_varint(payload, pos)
+        start = []
+        for _ in range(3):
+            value, pos = _read_varint(payload, pos)
+            start.append(_unzigzag(value))
+        start[2] /= 2
+
+        flaps = []
+        tick = 0
+        count, pos = _read_varint(payload, pos)
+        for _ in range(count):
+            gap, pos = _read_varint(payload, pos)
+            repeat, pos = _read_varint(payload, pos)
+            if tick + gap * (repeat + 1) > end_tick:
+                raise ReplayError("flap after the end of the run")
+            if gap == 0 and (flaps or repeat):
+                raise ReplayError("duplicate flap tick")
+            for _ in range(repeat + 1):
+                tick += gap
+                flaps.append(tick)
+
+        events = []
+        tick = 0
+        count, pos = _read_varint(payload, pos)
+        for _ in range(count):
+            delta, pos = _read_varint(payload, pos)
+            if pos >= len(payload):
+                raise ReplayError("truncated event")
+            kind = payload[pos]
+            pos += 1
+            if kind not in EVENT_NAMES:
+                raise ReplayError(f"unknown event kind {kind}")
+            tick += delta
+            events.append((tick, kind))
+        if pos != len(payload):
+            raise ReplayError("trailing data in payload")
+        return cls(seed, score, end_tick, start, flaps, events, flags)
+
+    # ------------------------------------------------------------------
+    # Files and streams
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Write the replay to path (directories are created)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(self.encode())
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            return cls.decode(f.read(MAX_REPLAY_BYTES + 1))
+
+    @classmethod
+    def read(cls, stream):
+        """Read the next replay from a binary stream; None at a clean EOF."""
+        data = read_record(stream)
+        return None if data is None else cls.decode(data)
+
+
+def read_record(stream):
+    """Read the raw bytes of the next replay record; None at a clean EOF.
+
+    Only the header is inspected, so records can be handed on undecoded.
+    """
+    header = stream.read(_HEADER.size)
+    if not header:
+        return None
+    if len(header) < _HEADER.size or header[:len(MAGIC)] != MAGIC:
+        raise ReplayError("not a replay stream")
+    data = bytearray(header)
+    while True:
+        byte = stream.read(1)
+        if not byte or len(data) > _HEADER.size + 4:
+            raise ReplayError("bad record length")
+        data += byte
+        if byte[0] < 0x80:
+            break
+    length, pos = _read_varint(data, _HEADER.size)
+    if length > MAX_REPLAY_BYTES:
+        raise ReplayError("replay too large")
+    body = stream.read(length + _CRC.size)
+    if len(body) < length + _CRC.size:
+        raise ReplayError("truncated payload")
+    return bytes(data + body)
+
+
+class ReplayRecorder:
+    """Collects the inputs of one run as the engine steps it."""
+
+    def __init__(self, sim):
+        flags = FLAG_MASK_COLLISION if sim.collider is not None else 0
+        self.replay = Replay(sim.seed, start=(sim.bird_x, sim.bird_y, sim.vel), flags=flags)
+        self.finished = False
+
+    def flap(self, tick):
+        if not self.finished:
+            self.replay.flaps.append(tick)
+
+    def event(self, tick, kind):
+        if not self.finished:
+            self.replay.events.append((tick, kind))
+
+    def finish(self, tick, score):
+        """Close the recording at game over and return the Replay."""
+        self.finished = True
+        self.replay.end_tick = tick
+        self.replay.score = score
+        return self.replay
+
+
+class ReplayPlayer:
+    """Re-runs a Replay through the simulation, one tick per step().
+
+    Applies the same rules as FlappyBirdGame.update_game: a collision
+    either continues through a solved heart puzzle (pipes cleared, bird
+    re-placed, flying again when the countdown ends) or ends the run.
+    Collisions use the same test the run was recorded with.
+    """
+
+    def __init__(self, replay):
+        self.replay = replay
+        collider = None
+        if replay.flags & FLAG_MASK_COLLISION:
+            from .collision import get_mask_collider  # loads the images
+            collider = get_mask_collider()
+        self.sim = Simulation(replay.seed, collider)
+        self.sim.bird_x, self.sim.bird_y, self.sim.vel = replay.start
+        self._flaps = deque(replay.flaps)
+        self._events = deque(replay.events)
+        self.done = False
+        self.error = None  # why the run diverged from its recording, if it did
+
+    def _take_event(self, kinds):
+        events = self._events
+        if events and events[0][0] == self.sim.tick and events[0][1] in kinds:
+            return events.popleft()[1]
+        return None
+
+    def step(self):
+        """Advance one tick; returns the lifeline event applied, if any."""
+        sim = self.sim
+        if self._take_event((START, COUNTDOWN_END)):
+            sim.flying = True
+
+        flap = bool(self._flaps) and self._flaps[0] == sim.tick
+        if flap:
+            self._flaps.popleft()
+            if not sim.flying:
+                self._fail("flap while not flying")
+        sim.step(flap)
+
+        if not sim.collided():
+            if sim.tick >= self.replay.end_tick:
+                self._fail("run ended without a collision")
+            return None
+
+        kind = self._take_event((HEART_SOLVED,) + FINAL_EVENTS)
+        if kind == HEART_SOLVED:
+            sim.flying = False
+            sim.checkpoint_reset()
+            return kind
+        sim.game_over = True
+        self.done = True
+        if sim.tick != self.replay.end_tick:
+            self._fail("collision before the recorded end")
+        return kind
+
+    def _fail(self, reason):
+        self.done = True
+        self.error = self.error or f"{reason} at tick {self.sim.tick}"
+
+    def run(self):
+        """Play to the end at full speed; returns the simulated score."""
+        while not self.done:
+            self.step()
+        return self.sim.score
+
+    def verified(self):
+        """True when the finished run reproduces the claimed score."""
+        return self.done and self.error is None and self.sim.score == self.replay.score
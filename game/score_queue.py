@@ -0,0 +1,205 @@
+"""Durable offline queue for score submissions."""
+import json
+import os
+import random
+import threading
+import time
+import uuid
+from collections import deque
+
+# Flush backoff while the backend is unreachable (seconds)
+FLUSH_BACKOFF_BASE = 1.0
+FLUSH_BACKOFF_MAX = 60.0
+
+# Outcomes reported by the deliver callback
+DELIVERED = "delivered"
+REJECTED = "rejected"  # permanent failure (e.g. 400/401); drop the entry
+RETRY = "retry"  # backend unavailable; keep the entry
+HELD = "held"  # can't be sent yet (its player isn't logged in); keep it, go on
+
+
+class ScoreQueue:
+    """Append-only journal of pending score submissions.
+
+    Every queued score is appended to a JSON-lines journal (fsynced) with
+    an idempotency key before anything is sent. Entries hold no
+    credentials; ``deliver`` authenticates them with the current session. Acknowledgements are
+    appended as ``done`` records. Only the best pending score per user is
+    kept, so a long offline session flushes one write per player. On
+    startup the journal is replayed, torn trailing lines from a crash are
+    skipped, and the file is rewritten with just the live entries. If
+    the journal can't be read or written (e.g. an unusable data dir), the
+    queue keeps working in memory only.
+
+    A background thread delivers entries in batches through ``deliver``
+    (entry -> DELIVERED/REJECTED/RETRY/HELD) and backs off while the
+    backend is down; a deliver call that raises counts as RETRY. HELD
+    entries are skipped and wait for ``wake`` (e.g. after a login).
+    Finished entries are reported through ``completed`` for the main
+    thread to pick up.
+    """
+
+    def __init__(self, path, deliver):
+        self.path = path
+        self.deliver = deliver
+        self.completed = deque()  # (entry, outcome), drained by the main thread
+        self._pending = {}  # user -> entry
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+        self._closed = False
+        self.durable = True  # False once the journal is unusable
+        try:
+            self._compact()
+        except OSError as e:
+            self._journal_failed(e)
+
+    # ------------------------------------------------------------------
+    # Journal
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _better(entry, current):
+        return current is None or entry["score"] > current["score"]
+
+    def _compact(self):
+        """Replay the journal and rewrite it with only live, coalesced entries."""
+        added = {}
+        done = set()
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as journal:
+                for line in journal:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # torn write from a crash
+                    if record.get("op") == "add":
+                        added[record["key"]] = record
+                    elif record.get("op") == "done":
+                        done.add(record.get("key"))
+
+        for key, entry in added.items():
+            entry.pop("token", None)  # journals used to store the auth token
+            if key not in done and self._better(entry, self._pending.get(entry["user"])):
+                self._pending[entry["user"]] = entry
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as journal:
+            for entry in self._pending.values():
+                journal.write(json.dumps(entry) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+        os.replace(tmp_path, self.path)
+
+    def _append(self, record):
+        if not self.durable:
+            return
+        try:
+            with open(self.path, "a", encoding="utf-8") as journal:
+                journal.write(json.dumps(record) + "\n")
+                journal.flush()
+                os.fsync(journal.fileno())
+        except OSError as e:
+            self._journal_failed(e)
+
+    def _journal_failed(self, error):
+        print(f"Score journal unavailable ({error}); pending scores are kept in memory only")
+        self.durable = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def enqueue(self, user, score, level=1):
+        """Persist a score for delivery; returns its idempotency key.
+
+        Scores that do not beat the user's pending best are coalesced away
+        (None is returned).
+        """
+        entry = {
+            "op": "add",
+            "key": uuid.uuid4().hex,
+            "user": user,
+            "score": score,
+            "level": level,
+            "ts": time.time(),
+        }
+        with self._lock:
+            current = self._pending.get(user)
+            if not self._better(entry, current):
+                self._wake.set()
+                return None
+            self._append(entry)
+            self._pending[user] = entry
+        self.start()
+        self._wake.set()
+        return entry["key"]
+
+    def pending(self):
+        """Snapshot of the entries still waiting for delivery."""
+        with self._lock:
+            return list(self._pending.values())
+
+    def start(self):
+        """Start the flush thread if it is not running."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._run, name="score-queue", daemon=True)
+            self._thread.start()
+
+    def wake(self):
+        """Retry pending entries now instead of after the backoff."""
+        self._wake.set()
+
+    def close(self):
+        """Stop the flush thread; pending entries stay in the journal."""
+        self._closed = True
+        self._wake.set()
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def _finish(self, entry, outcome):
+        with self._lock:
+            if self._pending.get(entry["user"]) is entry:
+                del self._pending[entry["user"]]
+            self._append({"op": "done", "key": entry["key"], "result": outcome})
+        self.completed.append((entry, outcome))
+
+    def flush(self):
+        """Deliver one batch; returns False if the backend was unavailable.
+
+        HELD entries are passed over, so one player's pending score never
+        holds up another's.
+        """
+        for entry in self.pending():
+            try:
+                outcome = self.deliver(entry)
+            except Exception as e:
+                print(f"Score delivery failed ({e!r}); retrying later")
+                outcome = RETRY
+            if outcome == RETRY:
+                return False
+            if outcome != HELD:
+                self._finish(entry, outcome)
+        return True
+
+    def _run(self):
+        failures = 0
+        while not self._closed:
+            if not self.pending():
+                self._wake.wait()
+                self._wake.clear()
+                continue
+            if self.flush():
+                failures = 0
+                if self.pending():
+                    # Only held entries are left: sleep until woken
+                    self._wake.wait()
+                    self._wake.clear()
+                continue
+            failures += 1
+            delay = min(FLUSH_BACKOFF_MAX, FLUSH_BACKOFF_BASE * (2 ** failures))
+            self._wake.wait(random.uniform(delay / 2, delay))
+            self._wake.clear()
@@ -1,314 +1,404 @@
 """UI screen rendering functions."""
+import time
 import pygame
 from .config import (
     SCREEN_WIDTH, SCREEN_HEIGHT, FONT, SMALL_FONT, LARGE_FONT, TINY_FONT,
-    WHITE, BLACK, RED, GREEN, BLUE, GRAY, GROUND_HEIGHT, IMAGE_PATHS
+    WHITE, BLACK, RED, GREEN, BLUE, GRAY, GROUND_HEIGHT,
+    IDLE_MAX_WAIT, CURSOR_BLINK, API_POLL_INTERVAL
 )
-from .sprites import TextButton
+from .assets import ASSETS
 from .game_state import ScreenState
+from .text import TEXT, draw_text
+from .widgets import ButtonWidget, WidgetTree
+from .dirty_rects import DirtyRectRenderer
+from .compositor import get_scene_compositor
 
+# Button colors chosen to stand out on the backgrounds
+BUTTON_BG = (20, 20, 20)
+BUTTON_HOVER = (70, 130, 180)  # steel blue
 
-def draw_text(screen, text, font, col, x, y):
-    """Draw text on screen."""
-    img = font.render(text, True, col)
-    screen.blit(img, (x, y))
+# Shared form layout for the login/register screens
+FORM_WIDTH = 500
+FIELD_HEIGHT = 50
+FORM_X = SCREEN_WIDTH // 2 - FORM_WIDTH // 2
+MESSAGE_Y = 740
 
+# Layer key for the heart puzzle overlay, which has no ScreenState of its own
+HEART_PUZZLE_LAYER = "heart_puzzle"
 
-def draw_input_field(screen, x, y, width, height, text, active, label=""):
-    """Draw an input field."""
+
+def draw_input_field(screen, x, y, width, height, text, active, label="", cursor=True):
+    """Draw an input field and return the rect it covers (label included).
+
+    The active field shows a cursor unless cursor is False (blinking).
+    """
     color = BLUE if active else GRAY
     pygame.draw.rect(screen, BLACK, (x, y, width, height))
     pygame.draw.rect(screen, color, (x, y, width, height), 2)
     
     if label:
-        label_surface = TINY_FONT.render(label, True, WHITE)
+        label_surface = TEXT.render(TINY_FONT, label, WHITE)
         screen.blit(label_surface, (x, y - 20))
     
     display_text = text if text else ""
-    if active:
+    if active and cursor:
         display_text += "|"  # Cursor
     
-    text_surface = SMALL_FONT.render(display_text, True, WHITE)
+    text_surface = TEXT.render(SMALL_FONT, display_text, WHITE)
     screen.blit(text_surface, (x + 5, y + 5))
+    
+    field_rect = pygame.Rect(x, y, width, height)
+    if label:
+        field_rect.union_ip(label_surface.get_rect(topleft=(x, y - 20)))
+    return field_rect
+
+
+def draw_loading_screen(screen, finished, total):
+    """Draw the startup progress bar (before any image is available)."""
+    screen.fill(BLACK)
+    bar = pygame.Rect(0, 0, FORM_WIDTH, 24)
+    bar.center = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)
+    if total:
+        filled = bar.copy()
+        filled.width = bar.width * finished // total
+        pygame.draw.rect(screen, BLUE, filled)
+    pygame.draw.rect(screen, GRAY, bar, 2)
+    label = TEXT.render(TINY_FONT, "Loading...", WHITE)
+    screen.blit(label, (bar.x, bar.y - 30))
 
 
 class ScreenRenderer:
     """Handles rendering of all UI screens."""
     
-    def __init__(self, screen, game_state, api_client):
+    def __init__(self, screen, game_state, api_client, dirty=None):
         self.screen = screen
         self.game_state = game_state
         self.api_client = api_client
-        # Auth (login/register) background
-        self.auth_bg = pygame.transform.scale(
-            pygame.image.load(IMAGE_PATHS['cover']),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-        # Home background image
-        self.home_bg = pygame.transform.scale(
-            pygame.image.load(IMAGE_PATHS['home']),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-        # Heart puzzle background image
-        self.heart_bg = pygame.transform.scale(
-            pygame.image.load(IMAGE_PATHS['heartbg']),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
-        )
-        # Shared background for profile and leaderboard
-        self.profile_bg = pygame.transform.scale(
-            pygame.image.load(IMAGE_PATHS['dp']),
-            (SCREEN_WIDTH, SCREEN_HEIGHT)
+        # Regions changed this frame, pushed to the display by the game loop
+        self.dirty = dirty or DirtyRectRenderer(screen.get_size())
+        
+        # Pre-composed static layers (background + titles), built on first use
+        self._layers = {}
+        # Widgets are built once per screen and driven by events
+        self.widgets = self._build_widgets()
+        self._active_screen = None
+    
+    # ------------------------------------------------------------------
+    # Backgrounds, fetched when a screen's layer is first composed (they
+    # may still be decoding in the background at startup)
+    # ------------------------------------------------------------------
+    
+    @property
+    def auth_bg(self):
+        """Auth (login/register) background."""
+        return ASSETS.scaled('cover', (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    @property
+    def home_bg(self):
+        return ASSETS.scaled('home', (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    @property
+    def heart_bg(self):
+        return ASSETS.scaled('heartbg', (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    @property
+    def profile_bg(self):
+        """Shared background for profile and leaderboard."""
+        return ASSETS.scaled('dp', (SCREEN_WIDTH, SCREEN_HEIGHT))
+    
+    # ------------------------------------------------------------------
+    # Idle scheduling: menus are only redrawn when something changes
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _cursor_on():
+        """Blink phase of the text cursor."""
+        return int(time.monotonic() / CURSOR_BLINK) % 2 == 0
+    
+    def idle_timeout(self):
+        """Seconds the current menu may wait for input before its next
+        redraw: until the cursor blinks, soon while a request is in
+        flight, and IDLE_MAX_WAIT at most."""
+        timeout = IDLE_MAX_WAIT
+        if self.game_state.current_screen in (ScreenState.LOGIN, ScreenState.REGISTER):
+            timeout = min(timeout, CURSOR_BLINK - time.monotonic() % CURSOR_BLINK)
+        if self.api_client.is_loading():
+            timeout = min(timeout, API_POLL_INTERVAL)
+        return timeout
+    
+    # ------------------------------------------------------------------
+    # Retained layers and widgets
+    # ------------------------------------------------------------------
+    
+    def _compose_layer(self, background, title, title_x, title_y, shadow_dy=2):
+        """Pre-compose a background with a shadowed title."""
+        layer = background.copy()
+        draw_text(layer, title, LARGE_FONT, BLACK, title_x - 2, title_y + shadow_dy)
+        draw_text(layer, title, LARGE_FONT, WHITE, title_x, title_y)
+        return layer
+    
+    def _layer(self, screen_state):
+        """Get the cached static layer for a screen."""
+        layer = self._layers.get(screen_state)
+        if layer is None:
+            if screen_state == ScreenState.LOGIN:
+                layer = self._compose_layer(self.auth_bg, "LOGIN", SCREEN_WIDTH // 2 - 90, 40, 3)
+            elif screen_state == ScreenState.REGISTER:
+                layer = self._compose_layer(self.auth_bg, "REGISTER", SCREEN_WIDTH // 2 - 160, 40, 3)
+            elif screen_state == ScreenState.HOME:
+                layer = self._compose_layer(self.home_bg, "FLAPPY BIRD", SCREEN_WIDTH // 2 - 200, 100)
+            elif screen_state == ScreenState.LEADERBOARD:
+                layer = self._compose_layer(self.profile_bg, "LEADERBOARD", SCREEN_WIDTH // 2 - 200, 20)
+            elif screen_state == ScreenState.PROFILE:
+                layer = self._compose_layer(self.profile_bg, "PROFILE", SCREEN_WIDTH // 2 - 100, 50)
+            elif screen_state == HEART_PUZZLE_LAYER:
+                layer = self._compose_layer(self.heart_bg, "LIFELINE!", SCREEN_WIDTH // 2 - 120, 20)
+                draw_text(layer, "Count the hearts to continue", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 180, 80)
+            else:
+                raise KeyError(screen_state)
+            self._layers[screen_state] = layer
+        return layer
+    
+    def _build_widgets(self):
+        """Build the widget tree of every menu screen."""
+        def button(x, y, width, height, text, on_click, font=SMALL_FONT):
+            return ButtonWidget(x, y, width, height, text, font, WHITE,
+                                BUTTON_BG, BUTTON_HOVER, on_click=on_click)
+        
+        back_y = SCREEN_HEIGHT - 100
+        return {
+            ScreenState.LOGIN: WidgetTree([
+                button(SCREEN_WIDTH // 2 - 210, 630, 200, 50, "Login", self._on_login),
+                button(SCREEN_WIDTH // 2 + 10, 630, 200, 50, "Register", self._on_open_register),
+            ]),
+            ScreenState.REGISTER: WidgetTree([
+                button(SCREEN_WIDTH // 2 - 190, 680, 180, 50, "Register", self._on_register),
+                button(SCREEN_WIDTH // 2 + 10, 680, 180, 50, "Back to Login", self._on_back_to_login),
+            ]),
+            ScreenState.HOME: WidgetTree([
+                button(SCREEN_WIDTH // 2 - 100, 350, 200, 60, "PLAY", self._on_play, font=LARGE_FONT),
+                button(SCREEN_WIDTH // 2 - 100, 450, 200, 50, "Leaderboard", self._on_open_leaderboard),
+                button(SCREEN_WIDTH // 2 - 100, 520, 200, 50, "Profile", self._on_open_profile),
+                button(SCREEN_WIDTH // 2 - 100, 590, 200, 50, "Logout", self._on_logout),
+            ]),
+            ScreenState.LEADERBOARD: WidgetTree([
+                button(SCREEN_WIDTH // 2 - 100, back_y, 200, 50, "Back (ESC)", self._on_back_to_home),
+            ]),
+            ScreenState.PROFILE: WidgetTree([
+                button(SCREEN_WIDTH // 2 - 100, back_y, 200, 50, "Back (ESC)", self._on_back_to_home),
+            ]),
+        }
+    
+    def _tree(self, screen_state):
+        """Get a screen's widget tree, syncing hover state on screen entry."""
+        tree = self.widgets[screen_state]
+        if self._active_screen != screen_state:
+            self._active_screen = screen_state
+            tree.sync(pygame.mouse.get_pos())
+        return tree
+    
+    def handle_event(self, event):
+        """Forward a pygame event to the current screen's widgets."""
+        tree = self.widgets.get(self.game_state.current_screen)
+        if tree is None:
+            return False
+        return self._tree(self.game_state.current_screen).handle_event(event)
+    
+    # ------------------------------------------------------------------
+    # Button actions
+    # ------------------------------------------------------------------
+    
+    def _on_login(self):
+        if self.api_client.is_loading('login'):
+            return
+        self.game_state.login_error_message = ""
+        self.api_client.call_async(
+            'login',
+            self.game_state.login_username,
+            self.game_state.login_password,
+            callback=self._on_login_done
         )
     
+    def _on_login_done(self, result):
+        success, message = result
+        if success:
+            self.game_state.current_screen = ScreenState.HOME
+            self.game_state.current_input_field = None
+            self.game_state.login_username = ""
+            self.game_state.login_password = ""
+            self.game_state.login_error_message = ""
+            self.api_client.call_async('get_profile')
+            self.api_client.call_async('get_user_rank')
+        else:
+            self.game_state.login_error_message = message
+    
+    def _on_open_register(self):
+        self.game_state.current_screen = ScreenState.REGISTER
+        self.game_state.current_input_field = "register_username"
+    
+    def _on_register(self):
+        if self.api_client.is_loading('register'):
+            return
+        self.game_state.register_error_message = ""
+        self.game_state.register_success_message = ""
+        if len(self.game_state.register_username) < 3:
+            self.game_state.register_error_message = "Username too short"
+        elif len(self.game_state.register_password) < 6:
+            self.game_state.register_error_message = "Password too short"
+        else:
+            self.api_client.call_async(
+                'register',
+                self.game_state.register_username,
+                self.game_state.register_email,
+                self.game_state.register_password,
+                callback=self._on_register_done
+            )
+    
+    def _on_register_done(self, result):
+        success, message = result
+        if success:
+            self.game_state.current_screen = ScreenState.LOGIN
+            self.game_state.current_input_field = "login_username"
+            self.game_state.login_username = self.game_state.register_username
+            self.game_state.register_username = ""
+            self.game_state.register_email = ""
+            self.game_state.register_password = ""
+            self.game_state.register_success_message = "Registration successful! Please login."
+        else:
+            self.game_state.register_error_message = message
+    
+    def _on_back_to_login(self):
+        self.game_state.current_screen = ScreenState.LOGIN
+        self.game_state.current_input_field = "login_username"
+        self.game_state.clear_messages()
+    
+    def _on_play(self):
+        self.game_state.start_new_game()
+        self.api_client.score_submitted = False
+        self.api_client.last_submitted_score = 0
+    
+    def _on_open_leaderboard(self):
+        self.game_state.current_screen = ScreenState.LEADERBOARD
+        self.api_client.refresh('get_leaderboard', 10)
+        if self.api_client.auth_token:
+            self.api_client.refresh('get_user_rank')
+    
+    def _on_open_profile(self):
+        self.game_state.current_screen = ScreenState.PROFILE
+        self.api_client.refresh('get_profile')
+        self.api_client.refresh('get_user_rank')
+    
+    def _on_logout(self):
+        self.api_client.logout()
+        self.game_state.current_screen = ScreenState.LOGIN
+        self.game_state.game_started = False
+    
+    def _on_back_to_home(self):
+        self.game_state.current_screen = ScreenState.HOME
+    
+    # ------------------------------------------------------------------
+    # Screens
+    # ------------------------------------------------------------------
+    
+    def _text(self, text, font, col, x, y):
+        """Draw dynamic text on screen and mark it dirty."""
+        self.dirty.mark(draw_text(self.screen, text, font, col, x, y))
+    
+    def _draw_scene(self, bg_img, ground_img, ground_scroll, bird_group):
+        """Draw the frozen game scene behind the countdown/game over text."""
+        birds = [(sprite.image, sprite.rect.topleft) for sprite in bird_group]
+        compositor = get_scene_compositor(bg_img, ground_img)
+        self.dirty.mark_many(compositor.draw(self.screen, (), ground_scroll, overlays=birds))
+        self.dirty.mark((0, GROUND_HEIGHT, SCREEN_WIDTH, SCREEN_HEIGHT - GROUND_HEIGHT))
+    
     def draw_login_screen(self):
         """Draw login screen."""
-        # Background image
-        self.screen.blit(self.auth_bg, (0, 0))
-
-        # Layout helpers for centering form
-        form_width = 500
-        field_height = 50
-        center_x = SCREEN_WIDTH // 2 - form_width // 2
-
-        # Title centered with slight shadow
-        title_x = SCREEN_WIDTH // 2 - 90
-        draw_text(self.screen, "LOGIN", LARGE_FONT, BLACK, title_x - 2, 43)
-        draw_text(self.screen, "LOGIN", LARGE_FONT, WHITE, title_x, 40)
+        self.screen.blit(self._layer(ScreenState.LOGIN), (0, 0))
         
         # Username field (centered, placed lower on screen)
-        draw_input_field(
-            self.screen, center_x, 460, form_width, field_height,
+        self.dirty.mark(draw_input_field(
+            self.screen, FORM_X, 460, FORM_WIDTH, FIELD_HEIGHT,
             self.game_state.login_username,
             self.game_state.current_input_field == "login_username",
-            "Username / Email"
-        )
+            "Username / Email",
+            cursor=self._cursor_on()
+        ))
         
         # Password field
-        draw_input_field(
-            self.screen, center_x, 540, form_width, field_height,
+        self.dirty.mark(draw_input_field(
+            self.screen, FORM_X, 540, FORM_WIDTH, FIELD_HEIGHT,
             "*" * len(self.game_state.login_password),
             self.game_state.current_input_field == "login_password",
-            "Password"
-        )
-        
-        # Buttons centered under fields
-        btn_width = 200
-        btn_y = 630
-        dark_bg = (20, 20, 20)
-        hover_bg = (70, 130, 180)
-
-        login_btn = TextButton(
-            SCREEN_WIDTH // 2 - btn_width - 10, btn_y,
-            btn_width, 50, "Login", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        register_btn = TextButton(
-            SCREEN_WIDTH // 2 + 10, btn_y,
-            btn_width, 50, "Register", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
+            "Password",
+            cursor=self._cursor_on()
+        ))
         
-        if login_btn.draw(self.screen):
-            success, message = self.api_client.login(
-                self.game_state.login_username,
-                self.game_state.login_password
-            )
-            if success:
-                self.game_state.current_screen = ScreenState.HOME
-                self.game_state.current_input_field = None
-                self.game_state.login_username = ""
-                self.game_state.login_password = ""
-                self.game_state.login_error_message = ""
-                self.api_client.get_profile()
-                self.api_client.get_user_rank()
-            else:
-                self.game_state.login_error_message = message
-        
-        # Draw error message if present
-        if self.game_state.login_error_message:
-            draw_text(
-                self.screen,
-                self.game_state.login_error_message,
-                SMALL_FONT,
-                RED,
-                center_x,
-                740,
-            )
+        # Draw progress or error message if present
+        if self.api_client.is_loading('login'):
+            self._text("Logging in...", SMALL_FONT, WHITE, FORM_X, MESSAGE_Y)
+        elif self.game_state.login_error_message:
+            self._text(self.game_state.login_error_message, SMALL_FONT, RED, FORM_X, MESSAGE_Y)
         
-        if register_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.REGISTER
-            self.game_state.current_input_field = "register_username"
+        self.dirty.mark_many(self._tree(ScreenState.LOGIN).draw(self.screen))
     
     def draw_register_screen(self):
         """Draw register screen."""
-        # Background image
-        self.screen.blit(self.auth_bg, (0, 0))
-
-        # Layout helpers for centering form
-        form_width = 500
-        field_height = 50
-        center_x = SCREEN_WIDTH // 2 - form_width // 2
-
-        # Title centered with slight shadow
-        title_x = SCREEN_WIDTH // 2 - 160
-        draw_text(self.screen, "REGISTER", LARGE_FONT, BLACK, title_x - 2, 43)
-        draw_text(self.screen, "REGISTER", LARGE_FONT, WHITE, title_x, 40)
+        self.screen.blit(self._layer(ScreenState.REGISTER), (0, 0))
         
         # Username field (lower on screen)
-        draw_input_field(
-            self.screen, center_x, 460, form_width, field_height,
+        self.dirty.mark(draw_input_field(
+            self.screen, FORM_X, 460, FORM_WIDTH, FIELD_HEIGHT,
             self.game_state.register_username,
             self.game_state.current_input_field == "register_username",
-            "Username"
-        )
+            "Username",
+            cursor=self._cursor_on()
+        ))
         
         # Email field
-        draw_input_field(
-            self.screen, center_x, 540, form_width, field_height,
+        self.dirty.mark(draw_input_field(
+            self.screen, FORM_X, 540, FORM_WIDTH, FIELD_HEIGHT,
             self.game_state.register_email,
             self.game_state.current_input_field == "register_email",
-            "Email"
-        )
+            "Email",
+            cursor=self._cursor_on()
+        ))
         
         # Password field
-        draw_input_field(
-            self.screen, center_x, 620, form_width, field_height,
+        self.dirty.mark(draw_input_field(
+            self.screen, FORM_X, 620, FORM_WIDTH, FIELD_HEIGHT,
             "*" * len(self.game_state.register_password),
             self.game_state.current_input_field == "register_password",
-            "Password"
-        )
-        
-        # Buttons (centered). Place "Back to Login" lower so a single
-        # long mouse click doesn't instantly trigger both screens.
-        btn_width = 180
-        register_btn_y = 680
-        back_btn_y = 681
-        dark_bg = (20, 20, 20)
-        hover_bg = (70, 130, 180)
-
-        register_btn = TextButton(
-            SCREEN_WIDTH // 2 - btn_width - 10, register_btn_y,
-            btn_width, 50, "Register", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        back_btn = TextButton(
-            SCREEN_WIDTH // 2 + 10, back_btn_y,
-            btn_width, 50, "Back to Login", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        
-        if register_btn.draw(self.screen):
-            self.game_state.register_error_message = ""
-            self.game_state.register_success_message = ""
-            if len(self.game_state.register_username) < 3:
-                self.game_state.register_error_message = "Username too short"
-            elif len(self.game_state.register_password) < 6:
-                self.game_state.register_error_message = "Password too short"
-            else:
-                success, message = self.api_client.register(
-                    self.game_state.register_username,
-                    self.game_state.register_email,
-                    self.game_state.register_password
-                )
-                if success:
-                    self.game_state.current_screen = ScreenState.LOGIN
-                    self.game_state.current_input_field = "login_username"
-                    self.game_state.login_username = self.game_state.register_username
-                    self.game_state.register_username = ""
-                    self.game_state.register_email = ""
-                    self.game_state.register_password = ""
-                    self.game_state.register_success_message = "Registration successful! Please login."
-                else:
-                    self.game_state.register_error_message = message
-        
-        # Draw error/success messages if present
-        if self.game_state.register_error_message:
-            draw_text(
-                self.screen,
-                self.game_state.register_error_message,
-                SMALL_FONT,
-                RED,
-                center_x,
-                740,
-            )
+            "Password",
+            cursor=self._cursor_on()
+        ))
+        
+        # Draw progress, error or success messages if present
+        if self.api_client.is_loading('register'):
+            self._text("Registering...", SMALL_FONT, WHITE, FORM_X, MESSAGE_Y)
+        elif self.game_state.register_error_message:
+            self._text(self.game_state.register_error_message, SMALL_FONT, RED, FORM_X, MESSAGE_Y)
         elif self.game_state.register_success_message:
-            draw_text(
-                self.screen,
-                self.game_state.register_success_message,
-                SMALL_FONT,
-                GREEN,
-                center_x,
-                740,
-            )
+            self._text(self.game_state.register_success_message, SMALL_FONT, GREEN, FORM_X, MESSAGE_Y)
         
-        if back_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.LOGIN
-            self.game_state.current_input_field = "login_username"
-            self.game_state.clear_messages()
+        self.dirty.mark_many(self._tree(ScreenState.REGISTER).draw(self.screen))
     
     def draw_home_screen(self):
         """Draw home screen with Play button."""
-        # Background
-        self.screen.blit(self.home_bg, (0, 0))
-        # Title with a subtle shadow for readability
-        draw_text(self.screen, "FLAPPY BIRD", LARGE_FONT, BLACK, SCREEN_WIDTH // 2 - 202, 102)
-        draw_text(self.screen, "FLAPPY BIRD", LARGE_FONT, WHITE, SCREEN_WIDTH // 2 - 200, 100)
+        self.screen.blit(self._layer(ScreenState.HOME), (0, 0))
         
         if self.api_client.user_info:
             welcome_text = f"Welcome, {self.api_client.user_info.get('username', 'Player')}!"
-            draw_text(self.screen, welcome_text, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 150, 200)
+            self._text(welcome_text, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 150, 200)
             
             if self.api_client.user_info.get('highest_score', 0) > 0:
                 high_score_text = f"High Score: {self.api_client.user_info.get('highest_score', 0)}"
-                draw_text(self.screen, high_score_text, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, 250)
-        
-        # Buttons with colors chosen to stand out on the background
-        dark_bg = (20, 20, 20)
-        hover_bg = (70, 130, 180)  # steel blue
-
-        # Play button
-        play_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, 350, 200, 60,
-            "PLAY", LARGE_FONT, WHITE, dark_bg, hover_bg
-        )
-        if play_btn.draw(self.screen):
-            self.game_state.start_new_game()
-            self.api_client.score_submitted = False
-            self.api_client.last_submitted_score = 0
-        
-        # Leaderboard button
-        leaderboard_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, 450, 200, 50,
-            "Leaderboard", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        if leaderboard_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.LEADERBOARD
-            self.api_client.get_leaderboard()
-            if self.api_client.auth_token:
-                self.api_client.get_user_rank()
+                self._text(high_score_text, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, 250)
         
-        # Profile button
-        profile_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, 520, 200, 50,
-            "Profile", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        if profile_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.PROFILE
-            self.api_client.get_profile()
-            self.api_client.get_user_rank()
-        
-        # Logout button
-        logout_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, 590, 200, 50,
-            "Logout", SMALL_FONT, WHITE, dark_bg, hover_bg
-        )
-        if logout_btn.draw(self.screen):
-            self.api_client.logout()
-            self.game_state.current_screen = ScreenState.LOGIN
-            self.game_state.game_started = False
+        self.dirty.mark_many(self._tree(ScreenState.HOME).draw(self.screen))
     
     def draw_leaderboard_screen(self):
         """Draw leaderboard screen."""
-        self.screen.blit(self.profile_bg, (0, 0))
-        # Title with shadow for contrast
-        draw_text(self.screen, "LEADERBOARD", LARGE_FONT, BLACK, SCREEN_WIDTH // 2 - 202, 22)
-        draw_text(self.screen, "LEADERBOARD", LARGE_FONT, WHITE, SCREEN_WIDTH // 2 - 200, 20)
+        self.screen.blit(self._layer(ScreenState.LEADERBOARD), (0, 0))
         
         if self.api_client.leaderboard_data:
             y_offset = 100
@@ -317,95 +407,80 @@ class ScreenRenderer:
                 username_text = entry.get('username', 'Unknown')
                 score_text = str(entry.get('highest_score', 0))
                 
-                draw_text(self.screen, rank_text, SMALL_FONT, WHITE, 50, y_offset)
-                draw_text(self.screen, username_text, SMALL_FONT, WHITE, 220, y_offset)
-                draw_text(self.screen, score_text, SMALL_FONT, WHITE, 600, y_offset)
+                self._text(rank_text, SMALL_FONT, WHITE, 50, y_offset)
+                self._text(username_text, SMALL_FONT, WHITE, 220, y_offset)
+                self._text(score_text, SMALL_FONT, WHITE, 600, y_offset)
                 y_offset += 50
+        elif self.api_client.is_loading('get_leaderboard'):
+            self._text("Loading...", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 60, 200)
         else:
-            draw_text(self.screen, "No data available", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, 200)
+            self._text("No data available", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, 200)
         
-        back_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 100, 200, 50,
-            "Back (ESC)", SMALL_FONT, WHITE, (20, 20, 20), (70, 130, 180)
-        )
-        if back_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.HOME
+        self.dirty.mark_many(self._tree(ScreenState.LEADERBOARD).draw(self.screen))
         
         # Show user rank if logged in
         if self.api_client.auth_token and self.api_client.user_rank:
             rank_info = f"Your Rank: #{self.api_client.user_rank.get('rank', 'N/A')} | High Score: {self.api_client.user_rank.get('highest_score', 0)}"
-            draw_text(self.screen, rank_info, TINY_FONT, BLUE, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 150)
+            self._text(rank_info, TINY_FONT, BLUE, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT - 150)
     
     def draw_profile_screen(self):
         """Draw profile screen."""
-        self.screen.blit(self.profile_bg, (0, 0))
-        # Title with shadow for contrast
-        draw_text(self.screen, "PROFILE", LARGE_FONT, BLACK, SCREEN_WIDTH // 2 - 102, 52)
-        draw_text(self.screen, "PROFILE", LARGE_FONT, WHITE, SCREEN_WIDTH // 2 - 100, 50)
+        self.screen.blit(self._layer(ScreenState.PROFILE), (0, 0))
         
         if self.api_client.user_info:
-            draw_text(self.screen, f"Username: {self.api_client.user_info.get('username', 'N/A')}", SMALL_FONT, WHITE, 200, 150)
-            draw_text(self.screen, f"Email: {self.api_client.user_info.get('email', 'N/A')}", SMALL_FONT, WHITE, 200, 200)
-            draw_text(self.screen, f"High Score: {self.api_client.user_info.get('highest_score', 0)}", SMALL_FONT, WHITE, 200, 250)
-            draw_text(self.screen, f"Games Played: {self.api_client.user_info.get('games_played', 0)}", SMALL_FONT, WHITE, 200, 300)
+            self._text(f"Username: {self.api_client.user_info.get('username', 'N/A')}", SMALL_FONT, WHITE, 200, 150)
+            self._text(f"Email: {self.api_client.user_info.get('email', 'N/A')}", SMALL_FONT, WHITE, 200, 200)
+            self._text(f"High Score: {self.api_client.user_info.get('highest_score', 0)}", SMALL_FONT, WHITE, 200, 250)
+            self._text(f"Games Played: {self.api_client.user_info.get('games_played', 0)}", SMALL_FONT, WHITE, 200, 300)
+        elif self.api_client.is_loading('get_profile'):
+            self._text("Loading...", SMALL_FONT, WHITE, 200, 150)
         
         if self.api_client.user_rank:
-            draw_text(self.screen, f"Rank: #{self.api_client.user_rank.get('rank', 'N/A')}", SMALL_FONT, WHITE, 200, 350)
+            self._text(f"Rank: #{self.api_client.user_rank.get('rank', 'N/A')}", SMALL_FONT, WHITE, 200, 350)
         
-        back_btn = TextButton(
-            SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT - 100, 200, 50,
-            "Back (ESC)", SMALL_FONT, WHITE, (20, 20, 20), (70, 130, 180)
-        )
-        if back_btn.draw(self.screen):
-            self.game_state.current_screen = ScreenState.HOME
+        self.dirty.mark_many(self._tree(ScreenState.PROFILE).draw(self.screen))
     
     def draw_heart_puzzle_screen(self, heart_puzzle):
         """Draw heart puzzle lifeline screen."""
-        # Background image for heart puzzle
-        self.screen.blit(self.heart_bg, (0, 0))
-        # Title with shadow for contrast
-        draw_text(self.screen, "LIFELINE!", LARGE_FONT, BLACK, SCREEN_WIDTH // 2 - 122, 22)
-        draw_text(self.screen, "LIFELINE!", LARGE_FONT, WHITE, SCREEN_WIDTH // 2 - 120, 20)
-        draw_text(self.screen, "Count the hearts to continue", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 180, 80)
+        # Background with title and instructions, pre-composed
+        self.screen.blit(self._layer(HEART_PUZZLE_LAYER), (0, 0))
         
         if heart_puzzle.image:
             self.screen.blit(heart_puzzle.image, (SCREEN_WIDTH // 2 - 200, 120))
+        elif heart_puzzle.waiting:
+            self._text("Loading puzzle...", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 110, 300)
         
         remaining = heart_puzzle.get_remaining_time()
-        draw_text(self.screen, f"Time Left: {remaining}", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 80, 560)
+        self._text(f"Time Left: {remaining}", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 80, 560)
         
         # Input box with semi-transparent dark background for better readability
         input_rect = pygame.Rect(SCREEN_WIDTH // 2 - 80, 620, 160, 50)
         pygame.draw.rect(self.screen, (0, 0, 0, 180), input_rect)
         pygame.draw.rect(self.screen, WHITE, input_rect, 2)
-        draw_text(self.screen, heart_puzzle.input, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 60, 630)
+        self.dirty.mark(input_rect)
+        self._text(heart_puzzle.input, SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 60, 630)
     
-    def draw_countdown_screen(self, bg_img, ground_img, ground_scroll, bird_group, score, remaining_time, flying, game_over, countdown_active):
+    def draw_countdown_screen(self, bg_img, ground_img, ground_scroll, bird_group, score, remaining_time):
         """Draw countdown screen after successful lifeline."""
-        self.screen.blit(bg_img, (0, 0))
-        self.screen.blit(ground_img, (ground_scroll, GROUND_HEIGHT))
-        bird_group.update(flying, game_over, countdown_active)
-        bird_group.draw(self.screen)
+        self._draw_scene(bg_img, ground_img, ground_scroll, bird_group)
         
-        draw_text(self.screen, str(score), FONT, WHITE, SCREEN_WIDTH // 2, 20)
+        self.dirty.mark(TEXT.draw_number(self.screen, score, FONT, WHITE, SCREEN_WIDTH // 2, 20))
         
         if remaining_time > 0:
-            draw_text(self.screen, "LIFELINE SUCCESSFUL!", SMALL_FONT, GREEN, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 150)
-            draw_text(self.screen, f"Continue in {remaining_time}", FONT, WHITE, SCREEN_WIDTH // 2 - 190, SCREEN_HEIGHT // 2 - 100)
+            self._text("LIFELINE SUCCESSFUL!", SMALL_FONT, GREEN, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 150)
+            self._text(f"Continue in {remaining_time}", FONT, WHITE, SCREEN_WIDTH // 2 - 190, SCREEN_HEIGHT // 2 - 100)
     
     def draw_game_over_screen(self, bg_img, ground_img, ground_scroll, bird_group, score, remaining_time):
         """Draw game over screen."""
-        self.screen.blit(bg_img, (0, 0))
-        self.screen.blit(ground_img, (ground_scroll, GROUND_HEIGHT))
-        bird_group.draw(self.screen)
+        self._draw_scene(bg_img, ground_img, ground_scroll, bird_group)
         
-        draw_text(self.screen, "GAME OVER", LARGE_FONT, RED, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 100)
-        draw_text(self.screen, f"Final Score: {score}", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 20)
+        self._text("GAME OVER", LARGE_FONT, RED, SCREEN_WIDTH // 2 - 150, SCREEN_HEIGHT // 2 - 100)
+        self._text(f"Final Score: {score}", SMALL_FONT, WHITE, SCREEN_WIDTH // 2 - 100, SCREEN_HEIGHT // 2 - 20)
         
         if self.api_client.auth_token:
             if self.api_client.score_submitted and score == self.api_client.last_submitted_score:
-                draw_text(self.screen, "Score submitted!", TINY_FONT, GREEN, SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2 + 40)
+                self._text("Score submitted!", TINY_FONT, GREEN, SCREEN_WIDTH // 2 - 80, SCREEN_HEIGHT // 2 + 40)
         
         if remaining_time > 0:
-            draw_text(self.screen, f"Returning to home in {remaining_time}...", TINY_FONT, GRAY, SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT // 2 + 80)
+            self._text(f"Returning to home in {remaining_time}...", TINY_FONT, GRAY, SCREEN_WIDTH // 2 - 120, SCREEN_HEIGHT // 2 + 80)
 
@@ -0,0 +1,245 @@
+"""Headless simulation core for the game's physics, pipes and scoring."""
+import math
+from collections import deque
+from .config import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, SCROLL_SPEED, PIPE_GAP, PIPE_FREQUENCY_TICKS,
+    GROUND_HEIGHT, GRAVITY, MAX_FALL_SPEED, FLAP_VELOCITY,
+    BIRD_WIDTH, BIRD_HEIGHT, BIRD_START_X, PIPE_WIDTH, PIPE_HEIGHT
+)
+
+_MASK64 = (1 << 64) - 1
+
+# Pipe gap centers are SCREEN_HEIGHT // 2 offset by this much either way
+PIPE_OFFSET_RANGE = 100
+
+# Most pipe pairs that can be on screen at once
+MAX_PIPES = (SCREEN_WIDTH + PIPE_WIDTH) // (SCROLL_SPEED * (PIPE_FREQUENCY_TICKS + 1)) + 2
+
+
+def pipe_offset(seed, index):
+    """Vertical offset of the index-th pipe pair of a run.
+    
+    A counter-based generator (splitmix64 of seed and index), so the pipe
+    sequence depends only on the seed and can also be computed in bulk,
+    e.g. with NumPy, for batch simulation.
+    """
+    z = (seed + (index + 1) * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    z ^= z >> 31
+    return z % (2 * PIPE_OFFSET_RANGE + 1) - PIPE_OFFSET_RANGE
+
+
+def round_half_away(value):
+    """Round like pygame.Rect does when a float is assigned to it."""
+    return int(math.floor(value + 0.5)) if value >= 0 else -int(math.floor(-value + 0.5))
+
+
+class PipePair:
+    """One top/bottom pipe pair: left edge x and gap center gap_y."""
+    
+    __slots__ = ("x", "gap_y")
+    
+    def __init__(self, x=0, gap_y=0):
+        self.x = x
+        self.gap_y = gap_y
+    
+    def __repr__(self):
+        return f"PipePair(x={self.x}, gap_y={self.gap_y})"
+
+
+class PipeRing(deque):
+    """Pipe pairs on screen, oldest (leftmost) first, from a fixed pool.
+    
+    capacity PipePairs are allocated up front. Spawning takes a pair from
+    the free list and dropping returns it, so a run of any length creates
+    no pipe objects; the ordering itself is a deque, C's ring of blocks,
+    which keeps iteration in the per-tick loops native. The pool grows
+    only if more than capacity pairs are ever on screen at once.
+    """
+    
+    __slots__ = ("_free",)
+    
+    def __init__(self, capacity=MAX_PIPES):
+        super().__init__()
+        self._free = [PipePair() for _ in range(capacity)]
+    
+    @property
+    def capacity(self):
+        return len(self) + len(self._free)
+    
+    @property
+    def first(self):
+        """The oldest pair still on screen (the next to score), or None."""
+        return self[0] if self else None
+    
+    def spawn(self, x, gap_y):
+        """Place a new pair at the right end; returns it."""
+        pair = self._free.pop() if self._free else PipePair()
+        pair.x = x
+        pair.gap_y = gap_y
+        self.append(pair)
+        return pair
+    
+    def drop_first(self):
+        """Recycle the oldest pair."""
+        self._free.append(self.popleft())
+    
+    def clear(self):
+        """Recycle every pair."""
+        self._free.extend(self)
+        super().clear()
+
+
+class Simulation:
+    """Pure-Python game state advanced one tick (1/FPS s) at a time.
+    
+    Holds the bird physics, flap input and wing animation, the pipe
+    spawning/scrolling and scoring of GameEngine.update, and the rectangle
+    collisions of check_collisions. It uses tick counts instead of
+    wall-clock time, an explicit flap input and a seeded pipe generator. Nothing here touches pygame, so runs can
+    be simulated faster than real time and without a display.
+    
+    Pipes are PipePairs in a PipeRing, oldest first. An optional
+    collider (e.g. game.collision.MaskCollider) replaces the rectangle
+    test for pipes; ceiling and ground are always checked by rectangle.
+    """
+    
+    def __init__(self, seed=0, collider=None):
+        self.seed = seed
+        self.collider = collider
+        self.tick = 0
+        self.flying = False
+        self.game_over = False
+        
+        # Bird (top-left corner of its rect, like the sprite's rect)
+        self.bird_x = BIRD_START_X - BIRD_WIDTH // 2
+        self.bird_y = SCREEN_HEIGHT // 2 - BIRD_HEIGHT // 2
+        self.vel = 0
+        self.frame_index = 0
+        self.frame_counter = 0
+        self.angle = 0
+        
+        self.pipes = PipeRing()
+        self.pipes_spawned = 0
+        self.last_pipe_tick = -PIPE_FREQUENCY_TICKS - 1
+        self.score = 0
+        self.pass_pipe = False
+        self.ground_scroll = 0
+    
+    def reset(self, seed=None):
+        """Start a new run (GameEngine.reset_game); the bird keeps its velocity.
+        
+        Ticks count from 0 again, so replay ticks are relative to the run.
+        The wing animation restarts too: ReplayPlayer starts from a fresh
+        Simulation, and mask collisions depend on the frame and tilt.
+        """
+        if seed is not None:
+            self.seed = seed
+        self.tick = 0
+        self.pipes.clear()
+        self.pipes_spawned = 0
+        self.bird_x = BIRD_START_X
+        self.bird_y = SCREEN_HEIGHT // 2
+        self.frame_index = 0
+        self.frame_counter = 0
+        self.angle = 0
+        self.last_pipe_tick = -PIPE_FREQUENCY_TICKS - 1
+        self.score = 0
+        self.pass_pipe = False
+        self.flying = False
+        self.game_over = False
+    
+    def checkpoint_reset(self):
+        """Clear pipes and re-place the bird after a solved lifeline."""
+        self.pipes.clear()
+        self.bird_x = BIRD_START_X
+        self.bird_y = SCREEN_HEIGHT // 2
+    
+    def step(self, flap=False):
+        """Advance one tick. flap is a new press of the flap key this tick."""
+        self.tick += 1
+        flying = self.flying
+        game_over = self.game_over
+        
+        # Bird physics
+        if flying:
+            self.vel += GRAVITY
+            if self.vel > MAX_FALL_SPEED:
+                self.vel = MAX_FALL_SPEED
+            if self.bird_y + BIRD_HEIGHT < GROUND_HEIGHT:
+                self.bird_y = round_half_away(self.bird_y + self.vel)
+        
+        if flying and not game_over:
+            if flap:
+                self.vel = FLAP_VELOCITY
+            self.frame_counter += 1
+            if self.frame_counter > 5:
+                self.frame_counter = 0
+                self.frame_index = (self.frame_index + 1) % 3
+            self.angle = self.vel * -2
+        elif game_over:
+            self.angle = -90
+        
+        pipes = self.pipes
+        if flying and not game_over:
+            # Spawn
+            if self.tick - self.last_pipe_tick > PIPE_FREQUENCY_TICKS:
+                offset = pipe_offset(self.seed, self.pipes_spawned)
+                self.pipes_spawned += 1
+                pipes.spawn(SCREEN_WIDTH, SCREEN_HEIGHT // 2 + offset)
+                self.last_pipe_tick = self.tick
+            
+            # Scroll, recycling pipes that left the screen
+            for pipe in pipes:
+                pipe.x -= SCROLL_SPEED
+            while pipes and pipes.first.x + PIPE_WIDTH < 0:
+                pipes.drop_first()
+            
+            self.ground_scroll -= SCROLL_SPEED
+            if abs(self.ground_scroll) > 35:
+                self.ground_scroll = 0
+        
+        # Score against the oldest pipe still on screen
+        next_pipe = pipes.first
+        if next_pipe is not None:
+            pipe_left = next_pipe.x
+            pipe_right = pipe_left + PIPE_WIDTH
+            bird_left = self.bird_x
+            if bird_left > pipe_left and bird_left + BIRD_WIDTH < pipe_right and not self.pass_pipe:
+                self.pass_pipe = True
+            if self.pass_pipe and bird_left > pipe_right:
+                self.score += 1
+                self.pass_pipe = False
+    
+    def collided(self):
+        """Check pipe, ceiling and ground collisions (GameEngine.check_collisions)."""
+        top = self.bird_y
+        bottom = top + BIRD_HEIGHT
+        if top < 0 or bottom >= GROUND_HEIGHT:
+            return True
+        if self.collider is not None:
+            return self.collider.hits_pipe(self)
+        left = self.bird_x
+        right = left + BIRD_WIDTH
+        for pipe in self.pipes:
+            x = pipe.x
+            if x >= right:
+                break  # pipes are ordered by x
+            if left < x + PIPE_WIDTH:
+                gap_y = pipe.gap_y
+                top_pipe_bottom = gap_y - PIPE_GAP // 2
+                bottom_pipe_top = gap_y + PIPE_GAP // 2
+                if (top < top_pipe_bottom and bottom > top_pipe_bottom - PIPE_HEIGHT) or \
+                   (bottom > bottom_pipe_top and top < bottom_pipe_top + PIPE_HEIGHT):
+                    return True
+        return False
+    
+    def pipe_rects(self):
+        """(x, y, w, h) of every pipe as drawn: (top, bottom) per pair."""
+        rects = []
+        for pipe in self.pipes:
+            x, gap_y = pipe.x, pipe.gap_y
+            rects.append(((x, gap_y - PIPE_GAP // 2 - PIPE_HEIGHT, PIPE_WIDTH, PIPE_HEIGHT),
+                          (x, gap_y + PIPE_GAP // 2, PIPE_WIDTH, PIPE_HEIGHT)))
+        return rects
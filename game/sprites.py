@@ -1,73 +1,30 @@
 """Sprite classes for the Flappy Bird game."""
 import pygame
-from .config import IMAGE_PATHS, SCROLL_SPEED, PIPE_GAP, SCREEN_HEIGHT, WHITE, GROUND_HEIGHT
+from .config import WHITE
+from .assets import ASSETS
+from .text import TEXT
+
+# Every tilt Simulation.step can produce: vel * -2 for vel in [-10, 8], plus
+# the nose-dive used on game over
+BIRD_ANGLES = list(range(-16, 21)) + [-90]
 
 
 class Bird(pygame.sprite.Sprite):
-    """Bird sprite with animation and physics."""
+    """Bird sprite drawn at the simulated bird's position.
+    
+    Physics, flap input and the wing animation live in
+    game.simulation.Simulation; GameEngine._sync_bird copies its state
+    (position, velocity, frame and tilt) onto this sprite.
+    """
     
     def __init__(self, x, y):
         super().__init__()
-        self.images = [pygame.image.load(IMAGE_PATHS['bird'].format(i)) for i in range(1, 4)]
+        self.images = ASSETS.bird_frames()
+        ASSETS.prerender_bird_rotations(BIRD_ANGLES)
         self.index = 0
-        self.counter = 0
         self.image = self.images[self.index]
         self.rect = self.image.get_rect(center=(x, y))
         self.vel = 0
-        self.clicked = False
-    
-    def update(self, flying, game_over, countdown_active):
-        """Update bird position and animation."""
-        if flying and not countdown_active:
-            self.vel += 0.5
-            if self.vel > 8:
-                self.vel = 8
-            if self.rect.bottom < GROUND_HEIGHT:
-                self.rect.y += self.vel
-        
-        if not game_over and flying:
-            keys = pygame.key.get_pressed()
-            space_pressed = keys[pygame.K_SPACE]
-            
-            if space_pressed and not self.clicked:
-                self.clicked = True
-                self.vel = -10  # Flap!
-            
-            if not space_pressed:
-                self.clicked = False
-            
-            # Animation
-            self.counter += 1
-            if self.counter > 5:
-                self.counter = 0
-                self.index += 1
-                if self.index >= len(self.images):
-                    self.index = 0
-            
-            self.image = pygame.transform.rotate(self.images[self.index], self.vel * -2)
-        elif game_over:
-            self.image = pygame.transform.rotate(self.images[self.index], -90)
-
-
-class Pipe(pygame.sprite.Sprite):
-    """Pipe obstacle sprite."""
-    
-    def __init__(self, x, y, position):
-        super().__init__()
-        self.image = pygame.image.load(IMAGE_PATHS['pipe'])
-        self.rect = self.image.get_rect()
-        
-        if position == 1:
-            self.image = pygame.transform.flip(self.image, False, True)
-            self.rect.bottomleft = (x, y - PIPE_GAP // 2)
-        else:
-            self.rect.topleft = (x, y + PIPE_GAP // 2)
-    
-    def update(self):
-        """Update pipe position."""
-        self.rect.x -= SCROLL_SPEED
-        if self.rect.right < 0:
-            self.kill()
 
 
 class Button:
@@ -110,7 +67,7 @@ class TextButton:
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, WHITE, self.rect, 2)
         
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = TEXT.render(self.font, self.text, self.text_color)
         text_rect = text_surface.get_rect(center=self.rect.center)
         screen.blit(text_surface, text_rect)
         
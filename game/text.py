@@ -0,0 +1,88 @@
+"""Cached text rendering shared by every screen."""
+from collections import OrderedDict
+
+# Default memory cap for cached text surfaces (bytes)
+TEXT_CACHE_BYTES = 4 * 1024 * 1024
+
+
+class TextRenderer:
+    """Renders text through an LRU cache of surfaces.
+
+    Surfaces are keyed by (font, text, color, antialias) and evicted
+    least-recently-used first once their combined pixel memory exceeds
+    max_bytes. Numbers are assembled from cached digit glyphs so a
+    changing score never reaches font.render after the first frame.
+    """
+
+    def __init__(self, max_bytes=TEXT_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _surface_bytes(surface):
+        width, height = surface.get_size()
+        return width * height * surface.get_bytesize()
+
+    def render(self, font, text, color, antialias=True):
+        """Return a (shared, read-only) surface with text rendered in font."""
+        key = (font, text, tuple(color), antialias)
+        surface = self._cache.get(key)
+        if surface is not None:
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self._cache[key] = surface
+        self._bytes += self._surface_bytes(surface)
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            _, evicted = self._cache.popitem(last=False)
+            self._bytes -= self._surface_bytes(evicted)
+        return surface
+
+    def draw(self, screen, text, font, color, x, y):
+        """Blit text with its top-left corner at (x, y); return its rect."""
+        return screen.blit(self.render(font, text, color), (x, y))
+
+    def draw_number(self, screen, value, font, color, x, y):
+        """Blit an integer from the digit-glyph atlas; return the covered rect."""
+        left = x
+        height = 0
+        for digit in str(value):
+            glyph = self.render(font, digit, color)
+            screen.blit(glyph, (x, y))
+            x += glyph.get_width()
+            height = max(height, glyph.get_height())
+        return screen.get_rect().clip((left, y, x - left, height))
+
+    def stats(self):
+        """Return cache counters for diagnostics."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self._cache),
+            'bytes': self._bytes,
+        }
+
+    def reset_stats(self):
+        """Zero the hit/miss counters (e.g. before measuring steady state)."""
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self):
+        """Drop every cached surface."""
+        self._cache.clear()
+        self._bytes = 0
+
+
+# Shared renderer used by screens, sprites and the game loop
+TEXT = TextRenderer()
+
+
+def draw_text(screen, text, font, col, x, y):
+    """Draw text on screen."""
+    return TEXT.draw(screen, text, font, col, x, y)
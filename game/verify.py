@@ -0,0 +1,193 @@
+"""Batch verification of replay files against their claimed scores.
+
+    python -m game.verify REPLAYS_DIR
+    python -m game.verify replays.tar.gz --workers 8
+    cat *.fbr | python -m game.verify -
+    tar c replays/ | python -m game.verify -
+
+Each input is a directory (searched recursively for *.fbr), a tar
+archive, or a file / stdin stream of concatenated replay records. Every
+replay is re-simulated with ReplayPlayer on a process pool and one JSON
+line per replay is written to stdout; a summary goes to stderr. The
+exit status is 1 if any replay failed to verify.
+"""
+import argparse
+import json
+import os
+import sys
+import tarfile
+import time
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from .config import FPS
+from .replay import Replay, ReplayError, ReplayPlayer, read_record, MAGIC, MAX_REPLAY_BYTES
+
+CHUNK_SIZE = 64  # replays per task
+WINDOW = 4  # chunks in flight per worker
+MAX_TICKS = FPS * 60 * 60  # reject runs claiming more than an hour of play
+
+
+def verify_one(name, data, max_ticks=MAX_TICKS):
+    """Verify one encoded replay; returns the JSON-ready result."""
+    result = {"name": name, "ok": False}
+    try:
+        replay = Replay.decode(data)
+    except ReplayError as e:
+        result["error"] = str(e)
+        return result
+    result["claimed"] = replay.score
+    if replay.end_tick > max_ticks:
+        result["error"] = f"run too long ({replay.end_tick} ticks)"
+        return result
+    player = ReplayPlayer(replay)
+    result["score"] = player.run()
+    result["ticks"] = player.sim.tick
+    result["ok"] = player.verified()
+    if not result["ok"]:
+        result["error"] = player.error or "score mismatch"
+    return result
+
+
+def verify_chunk(items, max_ticks=MAX_TICKS):
+    """Worker task: verify a list of (name, data) pairs."""
+    return [verify_one(name, data, max_ticks) for name, data in items]
+
+
+# ----------------------------------------------------------------------
+# Inputs
+# ----------------------------------------------------------------------
+
+def _stream_records(stream, label):
+    index = 0
+    while True:
+        try:
+            data = read_record(stream)
+        except ReplayError as e:
+            # The stream cannot be resynchronized after a bad record
+            yield f"{label}#{index}", e
+            return
+        if data is None:
+            return
+        yield f"{label}#{index}", data
+        index += 1
+
+
+def _read_file(path):
+    with open(path, "rb") as f:
+        data = f.read(MAX_REPLAY_BYTES + 1)
+    if len(data) > MAX_REPLAY_BYTES:
+        return ReplayError("replay too large")
+    return data
+
+
+def _tar_members(archive):
+    for member in archive:
+        if not member.isfile():
+            continue
+        if member.size > MAX_REPLAY_BYTES:
+            yield member.name, ReplayError("replay too large")
+        else:
+            yield member.name, archive.extractfile(member).read()
+        archive.members = []  # TarFile keeps every header otherwise
+
+
+def iter_replays(source):
+    """Yield (name, bytes) for every replay in source; bad inputs yield
+    (name, ReplayError) instead of bytes."""
+    if source == "-":
+        stdin = sys.stdin.buffer
+        if stdin.peek(len(MAGIC))[:len(MAGIC)] == MAGIC:
+            yield from _stream_records(stdin, "stdin")
+        else:
+            with tarfile.open(fileobj=stdin, mode="r|*") as archive:
+                yield from _tar_members(archive)
+    elif os.path.isdir(source):
+        for root, dirs, files in os.walk(source):
+            dirs.sort()
+            for name in sorted(files):
+                if name.endswith(".fbr"):
+                    path = os.path.join(root, name)
+                    yield path, _read_file(path)
+    elif tarfile.is_tarfile(source):
+        # Stream mode: members are read in order without building an index
+        with tarfile.open(source, "r|*") as archive:
+            yield from _tar_members(archive)
+    else:
+        with open(source, "rb") as stream:
+            yield from _stream_records(stream, source)
+
+
+def _chunks(items, size):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# ----------------------------------------------------------------------
+# Dispatch
+# ----------------------------------------------------------------------
+
+def verify_sources(sources, workers=None, chunk_size=CHUNK_SIZE, window=WINDOW, max_ticks=MAX_TICKS):
+    """Verify replays from all sources on a process pool, yielding results.
+
+    At most workers * window chunks are read ahead of the pool, so memory
+    stays bounded however large the input is. Results are yielded as
+    chunks complete, not in input order.
+    """
+    workers = workers or os.cpu_count() or 1
+    limit = workers * window
+
+    def items():
+        for source in sources:
+            yield from iter_replays(source)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for chunk in _chunks(items(), chunk_size):
+            good = []
+            for name, data in chunk:
+                if isinstance(data, ReplayError):
+                    yield {"name": name, "ok": False, "error": str(data)}
+                else:
+                    good.append((name, data))
+            if good:
+                pending.add(pool.submit(verify_chunk, good, max_ticks))
+            while len(pending) >= limit:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m game.verify", description=__doc__.split("\n")[0])
+    parser.add_argument("sources", nargs="+", help="directory, tar archive, replay stream file or - for stdin")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="replays per task")
+    parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="longest run accepted")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    total = failed = 0
+    out = sys.stdout
+    for result in verify_sources(args.sources, args.workers, args.chunk_size, max_ticks=args.max_ticks):
+        out.write(json.dumps(result) + "\n")
+        total += 1
+        failed += not result["ok"]
+    out.flush()
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed * 60 if elapsed else 0
+    print(f"{total} replays, {failed} failed, {elapsed:.2f}s ({rate:,.0f}/min)", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Retained-mode UI widgets driven by pygame events."""
+import pygame
+from .config import WHITE
+from .text import TEXT
+
+
+class Widget:
+    """Base class for widgets that live across frames."""
+
+    def __init__(self, rect):
+        self.rect = pygame.Rect(rect)
+        self.dirty = True
+
+    def sync(self, mouse_pos):
+        """Re-derive hover state from the mouse position."""
+
+    def handle_event(self, event):
+        """React to an event; return True if it was consumed."""
+        return False
+
+    def draw(self, screen):
+        """Blit the widget and return the rect it covers."""
+        self.dirty = False
+        return self.rect
+
+
+class ButtonWidget(Widget):
+    """Text button whose look is rendered once per hover/pressed state."""
+
+    def __init__(self, x, y, width, height, text, font, text_color, bg_color,
+                 hover_color, on_click=None, pressed_color=None):
+        super().__init__((x, y, width, height))
+        self.text = text
+        self.font = font
+        self.text_color = text_color
+        self.bg_color = bg_color
+        self.hover_color = hover_color
+        self.pressed_color = pressed_color or hover_color
+        self.on_click = on_click
+        self.hovered = False
+        self.pressed = False
+        self._surfaces = {}
+
+    def _set_state(self, hovered, pressed):
+        if (hovered, pressed) != (self.hovered, self.pressed):
+            self.hovered = hovered
+            self.pressed = pressed
+            self.dirty = True
+
+    def sync(self, mouse_pos):
+        """Match hover state to the mouse position (e.g. on screen entry)."""
+        self._set_state(self.rect.collidepoint(mouse_pos), False)
+
+    def handle_event(self, event):
+        """Update hover/pressed state and fire on_click on left mouse down."""
+        if event.type == pygame.MOUSEMOTION:
+            self._set_state(self.rect.collidepoint(event.pos), self.pressed)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            if self.rect.collidepoint(event.pos):
+                self._set_state(True, True)
+                if self.on_click:
+                    self.on_click()
+                return True
+        elif event.type == pygame.MOUSEBUTTONUP and event.button == 1:
+            self._set_state(self.rect.collidepoint(event.pos), False)
+        return False
+
+    def _state_surface(self):
+        """Get the pre-rendered surface for the current visual state."""
+        if self.pressed:
+            color = self.pressed_color
+        elif self.hovered:
+            color = self.hover_color
+        else:
+            color = self.bg_color
+
+        surface = self._surfaces.get(color)
+        if surface is None:
+            surface = pygame.Surface(self.rect.size)
+            local = surface.get_rect()
+            pygame.draw.rect(surface, color, local)
+            pygame.draw.rect(surface, WHITE, local, 2)
+            text_surface = TEXT.render(self.font, self.text, self.text_color)
+            surface.blit(text_surface, text_surface.get_rect(center=local.center))
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert()
+            self._surfaces[color] = surface
+        return surface
+
+    def draw(self, screen):
+        """Blit the button for its current state and return its rect."""
+        screen.blit(self._state_surface(), self.rect)
+        return super().draw(screen)
+
+
+class WidgetTree:
+    """Ordered set of widgets built once for a screen."""
+
+    def __init__(self, widgets=()):
+        self.widgets = list(widgets)
+
+    def add(self, widget):
+        """Append a widget and return it."""
+        self.widgets.append(widget)
+        return widget
+
+    def sync(self, mouse_pos):
+        """Re-derive hover state, e.g. when the screen becomes active."""
+        for widget in self.widgets:
+            widget.sync(mouse_pos)
+
+    def handle_event(self, event):
+        """Dispatch an event; stop at the first widget that consumes it."""
+        for widget in self.widgets:
+            if widget.handle_event(event):
+                return True
+        return False
+
+    def dirty_rects(self):
+        """Rects of widgets whose appearance changed since the last draw."""
+        return [widget.rect for widget in self.widgets if widget.dirty]
+
+    def draw(self, screen):
+        """Draw every widget; return the rects that changed."""
+        changed = self.dirty_rects()
+        for widget in self.widgets:
+            widget.draw(screen)
+        return changed